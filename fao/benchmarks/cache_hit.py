@@ -0,0 +1,120 @@
+# fao/benchmarks/cache_hit.py
+"""
+Cache hit latency: pickled response dicts vs pre-rendered response bytes
+
+Before: a hit unpickled the cached dict, then FastAPI ran jsonable_encoder
+and json.dumps on it. After: a hit unpacks the stored body and headers and
+returns them as a Response.
+
+Both paths read from Redis when it's reachable (set REDIS_* as for the API),
+otherwise only the in-process work is measured.
+
+    python -m fao.benchmarks.cache_hit --items 250 --iterations 2000
+"""
+import argparse
+import pickle
+import statistics
+import time
+
+import redis
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from starlette.requests import Request
+
+from fao.src.core import settings
+from fao.src.core.cache import CacheEntry, CachedResponse, _pack_entry, _unpack_entry
+
+
+def build_payload(items: int) -> dict:
+    """Shaped like a metadata endpoint response (e.g. /area_codes with distribution)"""
+    return {
+        "dataset": "production_crops_livestock",
+        "total_areas": items,
+        "areas": [
+            {
+                "area_code": str(i),
+                "area": f"Area {i}",
+                "area_code_m49": f"'{i:03d}",
+                "record_count": 1000 + i * 17,
+            }
+            for i in range(items)
+        ],
+    }
+
+
+def make_request() -> Request:
+    return Request({"type": "http", "method": "GET", "headers": [(b"accept-encoding", b"gzip, deflate, br")]})
+
+
+def get_redis() -> redis.Redis | None:
+    client = redis.Redis(
+        host=settings.redis_host,
+        port=settings.redis_port,
+        password=settings.redis_password,
+        socket_connect_timeout=1,
+    )
+    try:
+        client.ping()
+        return client
+    except redis.RedisError:
+        return None
+
+
+def time_it(fn, iterations: int) -> list[float]:
+    for _ in range(min(100, iterations)):
+        fn()
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1_000_000)
+    return timings
+
+
+def report(name: str, timings: list[float], size: int) -> None:
+    timings = sorted(timings)
+    p50 = statistics.median(timings)
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    print(f"{name:<28} p50 {p50:9.1f} us   p95 {p95:9.1f} us   stored {size:>9,} bytes")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=250, help="Rows in the cached payload")
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    payload = build_payload(args.items)
+    request = make_request()
+    client = get_redis()
+
+    pickled = pickle.dumps(payload)
+    packed = _pack_entry(CacheEntry(value=CachedResponse.from_content(payload), fresh_until=time.time() + 3600))
+
+    if client:
+        client.set("fao:benchmark:pickled", pickled)
+        client.set("fao:benchmark:packed", packed)
+        fetch_pickled = lambda: client.get("fao:benchmark:pickled")
+        fetch_packed = lambda: client.get("fao:benchmark:packed")
+    else:
+        fetch_pickled = lambda: pickled
+        fetch_packed = lambda: packed
+
+    def pickled_hit():
+        content = pickle.loads(fetch_pickled())
+        # What FastAPI does with a returned dict
+        return JSONResponse(content=jsonable_encoder(content)).body
+
+    def packed_hit():
+        return _unpack_entry(fetch_packed()).value.to_response(request, "HIT").body
+
+    print(f"{args.items} items, {args.iterations} iterations, Redis {'on' if client else 'off (in-process only)'}")
+    report("before: pickle + encode", time_it(pickled_hit, args.iterations), len(pickled))
+    report("after: stored response", time_it(packed_hit, args.iterations), len(packed))
+
+    if client:
+        client.delete("fao:benchmark:pickled", "fao:benchmark:packed")
+
+
+if __name__ == "__main__":
+    main()
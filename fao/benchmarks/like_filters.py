@@ -0,0 +1,135 @@
+# fao/benchmarks/like_filters.py
+"""
+Cost of each text ("like") filter on a dataset, per match mode
+
+Every like filter in the dataset's config is run as the list endpoint builds
+it - lookup name columns through their join, the rest on the fact table - and
+timed as a count of the matching fact rows (selecting only the filtered
+column, so no other lookup is joined). The search term comes from a
+real value of the column: a substring of it for contains, its first
+characters for prefix, the whole value for exact.
+
+Needs a loaded database (set DB_* as for the API). Create the indexes first to
+compare against the plain scans:
+
+    python -m fao.src.db.setup create-search-indexes
+    python -m fao.benchmarks.like_filters --dataset prices --iterations 5
+"""
+import argparse
+import json
+import statistics
+import time
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from fao.src.api.utils.config_registry import load_config_model, load_router_configs
+from fao.src.api.utils.query_helpers import MatchMode
+from fao.src.api.utils.router_handler import RouterHandler
+from fao.src.db.database import get_engine
+
+
+def make_handler(session: Session, config, model, match: MatchMode = MatchMode.CONTAINS) -> RouterHandler:
+    handler = RouterHandler(
+        db=session,
+        model=model,
+        model_name=config.model_name,
+        table_name=config.table_name,
+        request=None,
+        response=None,
+        config=config,
+    )
+    handler.match_mode = match
+    return handler
+
+
+def sample_value(session: Session, config, model, filter_name: str):
+    """A value of the filter's column that occurs in the dataset"""
+    handler = make_handler(session, config, model)
+    query = handler.query_builder.build([filter_name])
+    return session.execute(query.where(query.selected_columns[0].is_not(None)).limit(1)).scalar()
+
+
+def search_term(value: str, match: MatchMode) -> str:
+    if match == MatchMode.CONTAINS:
+        return value[1:6] if len(value) > 3 else value
+    if match == MatchMode.PREFIX:
+        return value[:4]
+    return value
+
+
+def used_indexes(session: Session, query) -> list[str]:
+    """Names of the indexes the plan for `query` reads"""
+    connection = session.connection()
+    compiled = query.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True})
+    plan = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled.string}").scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    names, nodes = [], [plan[0]["Plan"]]
+    while nodes:
+        node = nodes.pop()
+        if "Index Name" in node:
+            names.append(node["Index Name"])
+        nodes.extend(node.get("Plans", []))
+    return sorted(set(names))
+
+
+def run_filter(session: Session, config, model, filter_name: str, term: str, match: MatchMode, iterations: int):
+    timings, total = [], 0
+    for _ in range(iterations + 1):
+        handler = make_handler(session, config, model, match)
+        handler.apply_all_filters({filter_name: term})
+        query = select(func.count()).select_from(handler.query_builder.build([filter_name]).subquery())
+        start = time.perf_counter()
+        total = session.execute(query).scalar()
+        timings.append((time.perf_counter() - start) * 1000)
+    # First run warms the cache
+    return total, statistics.median(timings[1:]), used_indexes(session, query)
+
+
+def benchmark_dataset(session: Session, config, iterations: int) -> None:
+    model = load_config_model(config)
+    print(f"\n{config.table_name}")
+    print(f"  {'filter':<24} {'match':<9} {'term':<22} {'rows':>10} {'p50 ms':>9}  indexes")
+
+    for filter_config in config.filter_configs:
+        if filter_config["filter_type"] != "like":
+            continue
+        filter_name = filter_config["name"]
+        value = sample_value(session, config, model, filter_name)
+        if not isinstance(value, str) or not value:
+            print(f"  {filter_name:<24} (no values)")
+            continue
+
+        for match in MatchMode:
+            term = search_term(value, match)
+            rows, p50, indexes = run_filter(session, config, model, filter_name, term, match, iterations)
+            print(
+                f"  {filter_name:<24} {match.value:<9} {term[:22]:<22} {rows:>10,} {p50:>9.1f}  {', '.join(indexes) or '-'}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dataset", action="append", help="Table name (repeatable, default: every dataset)")
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+
+    configs = [
+        config
+        for config in load_router_configs()
+        if (
+            config.table_name in args.dataset
+            if args.dataset
+            else any(f.get("joins_table") for f in config.filter_configs)
+        )
+    ]
+
+    with Session(get_engine()) as session:
+        for config in configs:
+            benchmark_dataset(session, config, args.iterations)
+
+
+if __name__ == "__main__":
+    main()
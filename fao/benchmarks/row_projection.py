@@ -0,0 +1,197 @@
+# fao/benchmarks/row_projection.py
+"""
+Per-row cost of shaping a data page: HybridResult objects vs a precomputed projection
+
+Before: select(Model) plus the joined columns; every row became an ORM instance
+wrapped in a HybridResult (a class defined per row, whose __getattr__ scanned the
+column mapping), then filter_response_data did hasattr/getattr per field per
+row and sorted each dict. After: plain column rows, field positions resolved
+once per query, one dict built per row from an itemgetter.
+
+Runs the prices dataset's real query shape against an in-memory SQLite copy of
+its tables, so no database server is needed.
+
+    python -m fao.benchmarks.row_projection --rows 10000 --iterations 20
+"""
+import argparse
+import statistics
+import time
+from datetime import datetime
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from fao.src.api.routers.prices.prices_config import PricesConfig
+from fao.src.api.utils.router_handler import RouterHandler
+from fao.src.db.pipelines.area_codes.area_codes_model import AreaCodes
+from fao.src.db.pipelines.elements.elements_model import Elements
+from fao.src.db.pipelines.flags.flags_model import Flags
+from fao.src.db.pipelines.item_codes.item_codes_model import ItemCodes
+from fao.src.db.pipelines.prices.prices_model import Prices
+
+REFERENCE_ROWS = 50
+
+
+def seed(session: Session, rows: int) -> None:
+    now = datetime.now()
+    stamps = {"source_dataset": "prices", "created_at": now, "updated_at": now}
+    session.execute(
+        insert(AreaCodes),
+        [
+            {"id": i, "area_code": str(i), "area": f"Area {i}", "area_code_m49": f"m{i}", **stamps}
+            for i in range(1, REFERENCE_ROWS + 1)
+        ],
+    )
+    session.execute(
+        insert(ItemCodes),
+        [
+            {"id": i, "item_code": str(i), "item": f"Item {i}", "item_code_cpc": f"0{i}", **stamps}
+            for i in range(1, REFERENCE_ROWS + 1)
+        ],
+    )
+    session.execute(
+        insert(Elements),
+        [
+            {"id": i, "element_code": str(5000 + i), "element": f"Element {i}", **stamps}
+            for i in range(1, REFERENCE_ROWS + 1)
+        ],
+    )
+    session.execute(insert(Flags), [{"id": 1, "flag": "A", "description": "Official figure", **stamps}])
+    session.execute(
+        insert(Prices),
+        [
+            {
+                "area_code_id": i % REFERENCE_ROWS + 1,
+                "item_code_id": i * 7 % REFERENCE_ROWS + 1,
+                "element_code_id": i * 3 % REFERENCE_ROWS + 1,
+                "flag_id": 1,
+                "year_code": str(1990 + i % 34),
+                "year": 1990 + i % 34,
+                "months_code": "7021",
+                "months": "Annual value",
+                "unit": "USD",
+                "value": i * 0.25,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(rows)
+        ],
+    )
+    session.commit()
+
+
+def make_handler(session: Session) -> RouterHandler:
+    return RouterHandler(
+        db=session,
+        model=Prices,
+        model_name="Prices",
+        table_name="prices",
+        request=None,
+        response=None,
+        config=PricesConfig(),
+    )
+
+
+def legacy_page(session: Session, config: PricesConfig, all_data_fields: set, limit: int) -> list:
+    """The previous QueryBuilder.execute + parse_results + filter_response_data"""
+    query = select(Prices)
+    column_mapping = []
+    joined = set()
+    for filter in config.filter_configs:
+        if "joins_table" in filter and filter["joins_table"] not in joined:
+            join_model = filter["join_model"]
+            query = query.join(join_model, filter["join_condition"] == join_model.id)
+            for col in join_model.__table__.columns:
+                query = query.add_columns(getattr(join_model, col.name))
+                column_mapping.append((len(column_mapping) + 1, col.name))
+            joined.add(filter["joins_table"])
+    rows = session.execute(query.order_by(Prices.id).limit(limit)).all()
+
+    results = []
+    for row in rows:
+
+        class HybridResult:
+            def __init__(self, orm_obj, row_data, column_mapping):
+                self._orm_obj = orm_obj
+                self._row_data = row_data
+                self._column_mapping = column_mapping
+
+            def __getattr__(self, name):
+                if hasattr(self._orm_obj, name):
+                    return getattr(self._orm_obj, name)
+                for index, col_name in self._column_mapping:
+                    if col_name == name and index < len(self._row_data):
+                        return self._row_data[index]
+                raise AttributeError(name)
+
+        results.append(HybridResult(row[0], row, column_mapping))
+
+    data = []
+    for result in results:
+        response_fields = {}
+        for field in all_data_fields:
+            if hasattr(result, field):
+                response_fields[field] = getattr(result, field)
+        data.append(dict(sorted(response_fields.items())))
+
+    session.expunge_all()
+    return data
+
+
+def projected_page(session: Session, limit: int) -> list:
+    handler = make_handler(session)
+    handler.query_builder.add_ordering([("id", "asc")])
+    results = handler.query_builder.paginate(limit, 0).execute(session)
+    return handler.filter_response_data(results)
+
+
+def time_it(fn, iterations: int) -> list[float]:
+    fn()
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def report(name: str, timings: list[float], rows: int) -> None:
+    p50 = statistics.median(timings)
+    print(f"{name:<34} p50 {p50:8.1f} ms   {p50 * 1000 / rows:6.2f} us/row")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10000, help="Page size")
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    Prices.metadata.create_all(
+        engine, tables=[model.__table__ for model in (AreaCodes, ItemCodes, Elements, Flags, Prices)]
+    )
+
+    with Session(engine) as session:
+        seed(session, args.rows)
+        config = PricesConfig()
+        all_data_fields = set(config.all_data_fields)
+
+        before = legacy_page(session, config, all_data_fields, args.rows)
+        after = projected_page(session, args.rows)
+        assert before == after, "projection returned different data"
+
+        print(f"{args.rows:,} row page, {args.iterations} iterations (query + row shaping)")
+        report(
+            "before: ORM + HybridResult",
+            time_it(lambda: legacy_page(session, config, all_data_fields, args.rows), args.iterations),
+            args.rows,
+        )
+        report(
+            "after: column rows + projection",
+            time_it(lambda: projected_page(session, args.rows), args.iterations),
+            args.rows,
+        )
+
+
+if __name__ == "__main__":
+    main()
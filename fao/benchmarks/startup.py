@@ -0,0 +1,56 @@
+# fao/benchmarks/startup.py
+"""
+Cold start time of the ETL and API entry points
+
+Each target is imported (or called) in a fresh interpreter, so nothing is
+cached between samples. Pipeline modules used to call get_csv_path_for and
+build their ETL at import time, and the runners imported every pipeline and
+model up front; now an ETL is built on first use (see pipelines/registry.py)
+and only the pipelines that run are imported.
+
+    python -m fao.benchmarks.startup --repeat 5
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+TARGETS = {
+    "pipelines package": "import fao.src.db.pipelines",
+    "pipelines runner": "import fao.src.db.pipelines.__main__",
+    "one pipeline module": "import fao.src.db.pipelines.{dataset}.{dataset}",
+    "one pipeline's etl": "from fao.src.db.pipelines.registry import get_etl; get_etl('{dataset}')",
+    "dependency graph": (
+        "from fao.src.db.pipelines.registry import PIPELINES; "
+        "from fao.src.db.pipelines.scheduler import pipeline_dependencies; "
+        "pipeline_dependencies(PIPELINES)"
+    ),
+    "db setup": "import fao.src.db.setup",
+    "api": "import fao.src.api.__main__",
+}
+
+
+def time_import(code: str) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dataset", default="production_crops_livestock")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--target", choices=sorted(TARGETS), action="append", help="Only time these (repeatable)")
+    args = parser.parse_args()
+
+    baseline = time_import("pass")
+    print(f"  {'python -c pass':<22} {baseline:>8.3f}s")
+    for label in args.target or TARGETS:
+        code = TARGETS[label].format(dataset=args.dataset)
+        samples = [time_import(code) for _ in range(args.repeat)]
+        print(f"  {label:<22} {statistics.median(samples):>8.3f}s  (min {min(samples):.3f}s)")
+
+
+if __name__ == "__main__":
+    main()
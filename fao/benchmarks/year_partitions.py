@@ -0,0 +1,115 @@
+# fao/benchmarks/year_partitions.py
+"""
+Year-filtered queries on a dataset table, for comparing before/after partitioning
+
+Runs the queries the list and aggregate endpoints build for typical year
+filters - a first page, an exact count, a per-year sum - and reports the p50
+latency and how many tables (partitions) each plan reads. Run it against the
+plain table, convert with `python -m fao.src.db.setup partition-tables`, run again.
+
+    python -m fao.benchmarks.year_partitions --dataset trade_crops_livestock --iterations 5
+"""
+import argparse
+import json
+import statistics
+import time
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from fao.src.api.utils.config_registry import load_config_model, load_router_configs
+from fao.src.api.utils.query_helpers import AggregationType
+from fao.src.api.utils.router_handler import RouterHandler
+from fao.src.db.database import get_engine
+
+
+def make_handler(session: Session, config, model) -> RouterHandler:
+    return RouterHandler(
+        db=session,
+        model=model,
+        model_name=config.model_name,
+        table_name=config.table_name,
+        request=None,
+        response=None,
+        config=config,
+    )
+
+
+def page_query(handler: RouterHandler, params: dict):
+    handler.apply_all_filters(params)
+    handler.query_builder.add_ordering(handler.get_keyset_sort(None))
+    return handler.query_builder.paginate(100, 0).build()
+
+
+def count_query(handler: RouterHandler, params: dict):
+    handler.apply_all_filters(params)
+    return select(func.count()).select_from(handler.query_builder.build().subquery())
+
+
+def sum_by_year_query(handler: RouterHandler, params: dict):
+    handler.apply_all_filters(params)
+    builder = handler.query_builder
+    builder.add_grouping([handler.model.year])
+    builder.add_aggregation(handler.model.value, AggregationType.SUM, "value_sum")
+    return builder.apply_aggregations().build()
+
+
+def scanned_tables(session: Session, query, table_name: str) -> int:
+    """Tables the plan reads from the dataset (its partitions, or the table itself)"""
+    connection = session.connection()
+    compiled = query.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True})
+    plan = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled.string}").scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    relations, nodes = set(), [plan[0]["Plan"]]
+    while nodes:
+        node = nodes.pop()
+        if node.get("Relation Name", "").startswith(table_name):
+            relations.add(node["Relation Name"])
+        nodes.extend(node.get("Plans", []))
+    return len(relations)
+
+
+def time_query(session: Session, build, iterations: int, table_name: str) -> tuple[float, int]:
+    timings = []
+    for _ in range(iterations + 1):
+        query = build()
+        start = time.perf_counter()
+        session.execute(query).all()
+        timings.append((time.perf_counter() - start) * 1000)
+    # First run warms the cache
+    return statistics.median(timings[1:]), scanned_tables(session, query, table_name)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dataset", default="trade_crops_livestock")
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+
+    config = next(config for config in load_router_configs() if config.table_name == args.dataset)
+    model = load_config_model(config)
+
+    with Session(get_engine()) as session:
+        first, last = session.execute(select(func.min(model.year), func.max(model.year))).one()
+        print(f"{args.dataset}: years {first}-{last}, {args.iterations} iterations")
+        print(f"  {'query':<44} {'p50 ms':>9} {'tables':>7}")
+
+        cases = [
+            (f"page, year={last}", page_query, {"year": last}),
+            (f"page, year_min={last - 4}", page_query, {"year_min": last - 4}),
+            (f"count, year={last}", count_query, {"year": last}),
+            (f"count, year_min={last - 9}", count_query, {"year_min": last - 9}),
+            (f"sum by year, year {last - 4}-{last}", sum_by_year_query, {"year_min": last - 4, "year_max": last}),
+            ("count, no year filter", count_query, {}),
+        ]
+        for name, build, params in cases:
+            p50, tables = time_query(
+                session, lambda: build(make_handler(session, config, model), params), args.iterations, config.table_name
+            )
+            print(f"  {name:<44} {p50:>9.1f} {tables:>7}")
+
+
+if __name__ == "__main__":
+    main()
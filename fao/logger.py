@@ -36,6 +36,21 @@ if not os.getenv("AWS_EXECUTION_ENV") and not os.getenv("IS_PRODUCTION"):
     )
 
 
+def add_filter_usage_sink(log_dir: str) -> None:
+    """Write the records bound with filter_usage=True to log_dir/filter_usage_*.log, in any environment"""
+    log_path = Path(log_dir)
+    log_path.mkdir(parents=True, exist_ok=True)
+    logger.add(
+        log_path / "filter_usage_{time:YYYY-MM-DD}.log",
+        rotation="1 day",
+        retention="3 months",
+        level="DEBUG",
+        format="{time:YYYY-MM-DD HH:mm:ss} | {message}",
+        filter=lambda record: record["extra"].get("filter_usage", False),
+        compression="zip",
+    )
+
+
 # Create child loggers for different modules
 def get_logger(name: str):
     """Get a logger with a specific name/context"""
@@ -43,4 +58,4 @@ def get_logger(name: str):
 
 
 # Export the base logger as default
-__all__ = ["logger", "get_logger"]
+__all__ = ["logger", "get_logger", "add_filter_usage_sink"]
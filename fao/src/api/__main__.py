@@ -1,4 +1,7 @@
+import asyncio
+from contextlib import asynccontextmanager
 from typing import cast, Any
+from anyio import to_thread
 from scalar_fastapi import get_scalar_api_reference
 from scalar_fastapi.scalar_fastapi import Layout
 from fastapi import FastAPI, HTTPException, Request
@@ -8,8 +11,12 @@ from fastapi.responses import JSONResponse, FileResponse, HTMLResponse
 from sqlalchemy.exc import SQLAlchemyError
 import uvicorn
 from . import api_map
+from fao.logger import add_filter_usage_sink
 from fao.src.core import settings
+from fao.src.core.cache import close_async_redis_client, run_invalidation_listener
+from fao.src.db.database import get_async_engine
 from fao.src.core.middleware import add_version_headers, QueryStringFlatteningMiddleware
+from fao.src.core.responses import FastJSONResponse, SerializationTimingMiddleware, get_serialization_stats
 from fao.src.core.exceptions import FAOAPIError
 from fao.src.core.error_handlers import (
     fao_exception_handler,
@@ -38,9 +45,25 @@ from .routers.production import production_api
 from .routers.trade import trade_api
 from .routers.value import value_api
 
+if settings.filter_usage_log_dir:
+    add_filter_usage_sink(settings.filter_usage_log_dir)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Sync endpoints and blocking calls from async handlers share anyio's worker threads
+    to_thread.current_default_thread_limiter().total_tokens = settings.threadpool_size
+    invalidation_listener = asyncio.create_task(run_invalidation_listener())
+    yield
+    invalidation_listener.cancel()
+    await close_async_redis_client()
+    await get_async_engine().dispose()
+
 
 # Create main app
 app = FastAPI(
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
     title=settings.api_title,
     description=settings.api_description,
     version=settings.api_version,
@@ -72,6 +95,7 @@ app.add_exception_handler(Exception, generic_exception_handler)
 # Custom middleware
 app.middleware("http")(add_version_headers)
 app.add_middleware(QueryStringFlatteningMiddleware)
+app.add_middleware(SerializationTimingMiddleware)
 
 
 # CORS middleware
@@ -136,6 +160,11 @@ def version_root():
         "endpoints": api_map["endpoints"]
     }
 
+@app.get("/serialization-stats", include_in_schema=False)
+def serialization_stats():
+    """JSON serialization time per endpoint, collected by SerializationTimingMiddleware"""
+    return get_serialization_stats()
+
 @app.get("/favicon.ico")
 async def favicon():
     return FileResponse("static/favicon.svg")
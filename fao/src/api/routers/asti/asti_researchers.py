@@ -1,6 +1,7 @@
 # templates/api_router.py.jinja2 (refactored main)
 from fastapi import APIRouter, Depends, Query, HTTPException, Response, Request
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, or_, and_, String
 from typing import Optional, List, Union
 from datetime import datetime
@@ -8,7 +9,7 @@ from datetime import datetime
 from fao.logger import logger
 from fao.src.core.cache import cache_result
 from fao.src.core import settings
-from fao.src.db.database import get_db
+from fao.src.db.database import get_db, get_async_db
 from fao.src.db.pipelines.asti_researchers.asti_researchers_model import AstiResearchers
 
 
@@ -41,10 +42,12 @@ config = AstiResearchersConfig()
 async def get_asti_researchers_data(
     request: Request,
     response: Response,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     # Standard parameters
     limit: int = Query(100, ge=0, le=10000, description="Maximum records to return"),
     offset: int = Query(0, ge=0, description="Number of records to skip"),
+    cursor: Optional[str] = Query(None, description="Opaque keyset cursor from pagination.next_cursor (replaces offset)"),
+    count: Optional[str] = Query(None, description="Total count mode: exact (default, cached per filter set), estimate (planner estimate) or none"),
     # Filter parameters
     area_code: Optional[Union[str, List[str]]] = Query(None, description="Filter by area_code code (comma-separated for multiple)"),
     area: Optional[str] = Query(None, description="Filter by area description (partial match)"),
@@ -66,18 +69,27 @@ async def get_asti_researchers_data(
     # Option parameters  
     fields: Optional[List[str]] = Query(None, description="Comma-separated list of fields to return"),
     sort: Optional[List[str]] = Query(None, description="Sort fields (e.g., 'year:desc,value:asc')"),
+    match: Optional[str] = Query(None, description="Text filter matching: contains (default), prefix or exact - case-insensitive"),
+    format: Optional[str] = Query(None, description="Response format: json (default), arrow or parquet - also negotiated from the Accept header"),
 ):
     """Get asti researchers data with advanced filtering and pagination.
 
     ## Filtering
     - Use comma-separated values for multiple selections (e.g., element_code=102,489)
     - Use _min/_max suffixes for range queries on numeric fields
-    - Use _exact suffix for exact string matches
+    - Text filters match anywhere in the value by default; match=prefix or match=exact
+      match the start or the whole value instead and can use an index
 
     ## Pagination
     - Use limit and offset parameters
+    - For deep pages pass pagination.next_cursor as cursor (keyset pagination, constant cost per page)
+    - Use count=estimate or count=none to skip the exact total on large, lightly filtered queries
     - Check pagination metadata in response headers
 
+    ## Formats
+    - format=arrow (Arrow IPC stream) or format=parquet returns the page as one columnar table
+    - Pagination metadata is in the response headers for these formats
+
     ## Sorting
     - Use format: field:direction (e.g., 'year:desc')
     - Multiple sorts: 'year:desc,value:asc'
@@ -93,6 +105,10 @@ async def get_asti_researchers_data(
         config=config
     )
 
+    match = router_handler.resolve_match_mode(match)
+
+    format = router_handler.resolve_response_format(format)
+
     area_code = router_handler.clean_param(area_code, "multi")
     area = router_handler.clean_param(area, "like")
     item_code = router_handler.clean_param(item_code, "multi")
@@ -114,6 +130,7 @@ async def get_asti_researchers_data(
     param_configs = {
         "limit": limit,
         "offset": offset,
+        "cursor": cursor,
         "area_code": area_code,
         "area": area,
         "item_code": item_code,
@@ -133,22 +150,23 @@ async def get_asti_researchers_data(
         "note": note,
         "fields": fields,
         "sort": sort,
+        "match": match,
     }
     # Validate field and sort parameter
     requested_fields, sort_columns = router_handler.validate_fields_and_sort_parameters(fields, sort)
 
-    router_handler.validate_filter_parameters(param_configs, db)
+    await router_handler.validate_filter_parameters_async(param_configs, db)
 
     filter_count = router_handler.apply_filters_from_config(param_configs)
-    total_count = router_handler.query_builder.get_count(db)
+    total_count, count_mode = await router_handler.get_total_count_async(count, param_configs, db)
 
-    if sort_columns:
-        router_handler.query_builder.add_ordering(sort_columns)
-    else:
-        router_handler.query_builder.add_ordering(router_handler.get_default_sort())
+    keyset_sort = router_handler.get_keyset_sort(sort_columns)
+    router_handler.query_builder.add_ordering(keyset_sort)
+    offset = router_handler.apply_cursor(cursor, keyset_sort, offset)
 
     # Apply pagination and execute
-    results = router_handler.query_builder.paginate(limit, offset).execute(db)
+    results = await router_handler.query_builder.paginate(limit, offset).execute_async(db)
+    next_cursor = router_handler.build_next_cursor(results, keyset_sort, limit)
 
     response_data = router_handler.filter_response_data(results, requested_fields)
 
@@ -160,6 +178,11 @@ async def get_asti_researchers_data(
         filter_count=filter_count,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        next_cursor=next_cursor,
+        count_mode=count_mode,
+        count=count,
+        match=match,
         area_code=area_code,
         area=area,
         item_code=item_code,
@@ -179,14 +202,115 @@ async def get_asti_researchers_data(
         note=note,
         fields=fields,
         sort=sort,
+        format=format,
+    )
+
+@router.get("/export", summary="Export asti researchers data")
+async def export_asti_researchers_data(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    # Export parameters
+    format: Optional[str] = Query(None, description="Export format: csv (default), ndjson, arrow or parquet - also negotiated from the Accept header"),
+    # Filter parameters
+    area_code: Optional[Union[str, List[str]]] = Query(None, description="Filter by area_code code (comma-separated for multiple)"),
+    area: Optional[str] = Query(None, description="Filter by area description (partial match)"),
+    item_code: Optional[Union[str, List[str]]] = Query(None, description="Filter by item_code code (comma-separated for multiple)"),
+    item: Optional[str] = Query(None, description="Filter by item description (partial match)"),
+    element_code: Optional[Union[str, List[str]]] = Query(None, description="Filter by element_code code (comma-separated for multiple)"),
+    element: Optional[str] = Query(None, description="Filter by element description (partial match)"),
+    flag: Optional[Union[str, List[str]]] = Query(None, description="Filter by flag code (comma-separated for multiple)"),
+    description: Optional[str] = Query(None, description="Filter by description description (partial match)"),
+    year_code: Optional[str] = Query(None, description="Filter by year code (partial match)"),
+    year: Optional[int] = Query(None, description="Filter by exact year"),
+    year_min: Optional[int] = Query(None, description="Minimum year"),
+    year_max: Optional[int] = Query(None, description="Maximum year"),
+    unit: Optional[str] = Query(None, description="Filter by unit (partial match)"),
+    value: Optional[Union[float, int]] = Query(None, description="Exact value"),
+    value_min: Optional[Union[float, int]] = Query(None, description="Minimum value"),
+    value_max: Optional[Union[float, int]] = Query(None, description="Maximum value"),
+    note: Optional[str] = Query(None, description="Filter by note (partial match)"),
+    # Option parameters  
+    fields: Optional[List[str]] = Query(None, description="Comma-separated list of fields to return"),
+    sort: Optional[List[str]] = Query(None, description="Sort fields (e.g., 'year:desc,value:asc')"),
+    match: Optional[str] = Query(None, description="Text filter matching: contains (default), prefix or exact - case-insensitive"),
+):
+    """Stream all asti researchers rows matching the filters as CSV, NDJSON,
+    Arrow IPC or Parquet.
+
+    Takes the same filters, fields and sort as the list endpoint, without
+    pagination. Rows are read from a server-side cursor in batches, so
+    memory use doesn't grow with the size of the export.
+    """
+
+    router_handler = RouterHandler(
+        db=db, 
+        model=AstiResearchers, 
+        model_name="AstiResearchers",
+        table_name="asti_researchers",
+        request=request, 
+        response=None, 
+        config=config
     )
 
+    match = router_handler.resolve_match_mode(match)
+
+    format = router_handler.resolve_export_format(format)
+
+    area_code = router_handler.clean_param(area_code, "multi")
+    area = router_handler.clean_param(area, "like")
+    item_code = router_handler.clean_param(item_code, "multi")
+    item = router_handler.clean_param(item, "like")
+    element_code = router_handler.clean_param(element_code, "multi")
+    element = router_handler.clean_param(element, "like")
+    flag = router_handler.clean_param(flag, "multi")
+    description = router_handler.clean_param(description, "like")
+    year_code = router_handler.clean_param(year_code, "like")
+    year = router_handler.clean_param(year, "exact")
+    year_min = router_handler.clean_param(year_min, "range_min")
+    year_max = router_handler.clean_param(year_max, "range_max")
+    unit = router_handler.clean_param(unit, "like")
+    value = router_handler.clean_param(value, "exact")
+    value_min = router_handler.clean_param(value_min, "range_min")
+    value_max = router_handler.clean_param(value_max, "range_max")
+    note = router_handler.clean_param(note, "like")
+
+    param_configs = {
+        "area_code": area_code,
+        "area": area,
+        "item_code": item_code,
+        "item": item,
+        "element_code": element_code,
+        "element": element,
+        "flag": flag,
+        "description": description,
+        "year_code": year_code,
+        "year": year,
+        "year_min": year_min,
+        "year_max": year_max,
+        "unit": unit,
+        "value": value,
+        "value_min": value_min,
+        "value_max": value_max,
+        "note": note,
+        "fields": fields,
+        "sort": sort,
+        "match": match,
+    }
+    requested_fields, sort_columns = router_handler.validate_fields_and_sort_parameters(fields, sort)
+
+    await router_handler.validate_filter_parameters_async(param_configs, db)
+
+    router_handler.apply_filters_from_config(param_configs)
+    router_handler.query_builder.add_ordering(router_handler.get_keyset_sort(sort_columns))
+
+    return router_handler.build_export_response(format, requested_fields)
+
 # templates/partials/router_aggregation_endpoints.jinja2
 @router.get("/aggregate", summary="Get aggregated asti researchers data")
 async def get_asti_researchers_aggregated(
     request: Request,
     response: Response,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     # Grouping
     group_by: List[str] = Query(..., description="Comma-separated list of fields to group by"),
     # Aggregations
@@ -214,6 +338,7 @@ async def get_asti_researchers_aggregated(
     note: Optional[str] = Query(None, description="Filter by note (partial match)"),
     # Option parameters  
     sort: Optional[List[str]] = Query(None, description="Sort fields (e.g., 'year:desc,value:asc')"),
+    match: Optional[str] = Query(None, description="Text filter matching: contains (default), prefix or exact - case-insensitive"),
 ):
     """Get aggregated data with grouping and multiple aggregation functions.
     
@@ -242,6 +367,8 @@ async def get_asti_researchers_aggregated(
         config=config
     )
 
+    match = router_handler.resolve_match_mode(match)
+
      # Setup aggregation mode
     router_handler.setup_aggregation(group_by, aggregations)
 
@@ -285,6 +412,7 @@ async def get_asti_researchers_aggregated(
         "value_max": value_max,
         "note": note,
         "sort": sort,
+        "match": match,
     }
 
     # Validate fields and sort for aggregation
@@ -295,7 +423,7 @@ async def get_asti_researchers_aggregated(
     requested_fields, sort_columns = router_handler.validate_fields_and_sort_parameters(fields=[], sort=sort)
 
     # Validate filter parameters
-    router_handler.validate_filter_parameters(param_configs, db)
+    await router_handler.validate_filter_parameters_async(param_configs, db)
 
     # Apply filters
     filter_count = router_handler.apply_filters_from_config(param_configs)
@@ -332,7 +460,7 @@ async def get_asti_researchers_aggregated(
     router_handler.query_builder.apply_aggregations()
     
     # Get count
-    total_count = router_handler.query_builder.get_count(db)
+    total_count = await router_handler.query_builder.get_count_async(db)
 
     # Apply sorting
     if sort_columns:
@@ -343,13 +471,11 @@ async def get_asti_researchers_aggregated(
             router_handler.query_builder.add_ordering([(router_handler.group_fields[0], "asc")])
 
     # Execute query
-    results = router_handler.query_builder.paginate(limit, offset).execute(db)
+    results = await router_handler.query_builder.paginate(limit, offset).execute_async(db)
 
     # Format aggregation results
     response_data = router_handler.format_aggregation_results(results)
 
-    print(f"SQL Query: {router_handler.query_builder.query}")
-
     # Build response
     return router_handler.build_response(
         request=request,
@@ -386,7 +512,7 @@ async def get_asti_researchers_aggregated(
 # ----------------------------------------
 @router.get("/area_codes", summary="Get AreaCodes in asti_researchers")
 @cache_result(prefix="asti_researchers:area_codes", ttl=604800)
-async def get_available_area_codes(
+def get_available_area_codes(
     db: Session = Depends(get_db),
     search: Optional[str] = Query(None, description="Search area by name or code"),
     include_distribution: Optional[bool] = Query(False, description="Set True to include distribution statistics"),
@@ -476,7 +602,7 @@ async def get_available_area_codes(
 
 @router.get("/item_codes", summary="Get ItemCodes in asti_researchers")
 @cache_result(prefix="asti_researchers:item_codes", ttl=604800)
-async def get_available_item_codes(
+def get_available_item_codes(
     db: Session = Depends(get_db),
     search: Optional[str] = Query(None, description="Search item by name or code"),
     include_distribution: Optional[bool] = Query(False, description="Set True to include distribution statistics"),
@@ -579,7 +705,7 @@ async def get_available_item_codes(
 
 @router.get("/elements", summary="Get Elements in asti_researchers")
 @cache_result(prefix="asti_researchers:elements", ttl=604800)
-async def get_available_elements(
+def get_available_elements(
     db: Session = Depends(get_db),
     search: Optional[str] = Query(None, description="Search element by name or code"),
     include_distribution: Optional[bool] = Query(False, description="Set True to include distribution statistics"),
@@ -654,7 +780,7 @@ async def get_available_elements(
 
 @router.get("/flags", summary="Get Flags in asti_researchers")
 @cache_result(prefix="asti_researchers:flags", ttl=604800)
-async def get_available_flags(
+def get_available_flags(
     db: Session = Depends(get_db),
     search: Optional[str] = Query(None, description="Search description by name or code"),
     include_distribution: Optional[bool] = Query(False, description="Include distribution statistics"),
@@ -729,7 +855,7 @@ async def get_available_flags(
 
 @router.get("/units", summary="Get units of measurement in asti_researchers")
 @cache_result(prefix="asti_researchers:units", ttl=604800)
-async def get_available_units(db: Session = Depends(get_db)):
+def get_available_units(db: Session = Depends(get_db)):
     """Get all units of measurement used in this dataset."""
     query = (
         select(
@@ -758,7 +884,7 @@ async def get_available_units(db: Session = Depends(get_db)):
 
 @router.get("/years", summary="Get available years in asti_researchers")
 @cache_result(prefix="asti_researchers:years", ttl=604800)
-async def get_available_years(
+def get_available_years(
     db: Session = Depends(get_db),
     include_counts: bool = Query(False, description="Include record counts per year"),
 ):
@@ -815,7 +941,7 @@ async def get_available_years(
 # -----------------------------------------------
 @router.get("/overview", summary="Get complete overview of asti_researchers dataset")
 @cache_result(prefix="asti_researchers:overview", ttl=3600)
-async def get_dataset_overview(db: Session = Depends(get_db)):
+def get_dataset_overview(db: Session = Depends(get_db)):
     """Get a complete overview of the dataset including all available dimensions and statistics."""
     overview = {
         "dataset": "asti_researchers",
@@ -924,7 +1050,7 @@ async def get_dataset_overview(db: Session = Depends(get_db)):
 
  
 @router.get("/health", tags=["health"])
-async def health_check(db: Session = Depends(get_db)):
+def health_check(db: Session = Depends(get_db)):
     """Check if the asti_researchers endpoint is healthy."""
     try:
         # Try to execute a simple query
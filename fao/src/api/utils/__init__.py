@@ -1,13 +1,20 @@
-from .query_helpers import QueryBuilder, AggregationType
+from .query_helpers import QueryBuilder, AggregationType, CountMode
 from .response_helpers import PaginationBuilder, ResponseFormatter
-from .parameter_parsers import parse_sort_parameter, parse_fields_parameter, parse_aggregation_parameter
+from .parameter_parsers import (
+    parse_sort_parameter,
+    parse_fields_parameter,
+    parse_aggregation_parameter,
+    parse_cursor_parameter,
+)
 
 __all__ = [
     "QueryBuilder",
     "AggregationType",
+    "CountMode",
     "PaginationBuilder",
     "ResponseFormatter",
     "parse_sort_parameter",
     "parse_fields_parameter",
     "parse_aggregation_parameter",
+    "parse_cursor_parameter",
 ]
@@ -0,0 +1,135 @@
+# fao/src/api/utils/arrow_helpers.py
+"""
+Arrow IPC and Parquet encoding for bulk consumers
+
+Results are turned into record batches column by column - one Python list per
+column, then one pa.array per list - so no per-row dicts are built. pyarrow is
+an optional dependency: without it the arrow/parquet formats are rejected and
+everything else works as before.
+"""
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+
+from sqlalchemy import Boolean, Date, DateTime, Float, Integer, Numeric, SmallInteger, String
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pq = None
+
+ARROW_MEDIA_TYPES = {
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+def arrow_available() -> bool:
+    return pa is not None
+
+
+def _arrow_type(sql_type) -> Optional["pa.DataType"]:
+    """Arrow type for a SQLAlchemy column type (None lets pyarrow infer it)"""
+    # Most specific first: SmallInteger is an Integer
+    if isinstance(sql_type, SmallInteger):
+        return pa.int16()
+    if isinstance(sql_type, Integer):
+        return pa.int64()
+    if isinstance(sql_type, (Float, Numeric)):
+        return pa.float64()
+    if isinstance(sql_type, String):
+        return pa.string()
+    if isinstance(sql_type, DateTime):
+        return pa.timestamp("us")
+    if isinstance(sql_type, Date):
+        return pa.date32()
+    if isinstance(sql_type, Boolean):
+        return pa.bool_()
+    return None
+
+
+def build_schema(columns: Dict[str, Any]) -> "pa.Schema":
+    """Schema from {field name: SQLAlchemy column}, in that order"""
+    return pa.schema([pa.field(name, _arrow_type(column.type) or pa.null()) for name, column in columns.items()])
+
+
+def build_record_batch(schema: "pa.Schema", columns: Sequence[Sequence[Any]]) -> "pa.RecordBatch":
+    """Record batch from one value list per schema field"""
+    arrays = [
+        pa.array(values, type=None if field.type == pa.null() else field.type) for field, values in zip(schema, columns)
+    ]
+    # Inferred types (unmapped columns) win over the placeholder null type
+    schema = pa.schema([field.with_type(array.type) for field, array in zip(schema, arrays)])
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def batch_from_rows(schema: "pa.Schema", rows: Sequence[Sequence[Any]]) -> "pa.RecordBatch":
+    """Record batch from row tuples in schema order"""
+    columns = list(zip(*rows)) if rows else [[] for _ in schema]
+    return build_record_batch(schema, columns)
+
+
+class _ChunkSink:
+    """Write-only file that hands back whatever was written since the last take().
+
+    Keeps a running offset for tell() so Parquet footers point at the right
+    positions even though the buffer itself is emptied after every chunk.
+    """
+
+    closed = False
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def take(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _open_writer(format: str, sink: _ChunkSink, schema: "pa.Schema"):
+    if format == "parquet":
+        return pq.ParquetWriter(sink, schema)
+    return pa.ipc.new_stream(sink, schema)
+
+
+def serialize_batch(batch: "pa.RecordBatch", format: str) -> bytes:
+    """A complete Arrow IPC stream or Parquet file holding `batch`"""
+    sink = _ChunkSink()
+    with _open_writer(format, sink, batch.schema) as writer:
+        writer.write_batch(batch)
+    return sink.take()
+
+
+async def stream_batches(schema: "pa.Schema", batches: AsyncIterator[Sequence], format: str) -> AsyncIterator[bytes]:
+    """Encode row batches as they arrive: one IPC message or Parquet row group per batch"""
+    sink = _ChunkSink()
+    writer = None
+    async for rows in batches:
+        batch = batch_from_rows(schema, rows)
+        if writer is None:
+            schema = batch.schema
+            writer = _open_writer(format, sink, schema)
+        writer.write_batch(batch)
+        yield sink.take()
+
+    if writer is None:
+        writer = _open_writer(format, sink, schema)
+    writer.close()
+    yield sink.take()
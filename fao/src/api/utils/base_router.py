@@ -2,16 +2,20 @@
 from typing import Dict, Any, List, Optional, Tuple, Type, Union
 from fastapi import Depends, Query, HTTPException, Response, Request
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import Select
 from abc import ABC, abstractmethod
 
 # Import utilities
-from fao.src.api.utils.query_helpers import QueryBuilder, AggregationType
-from fao.src.api.utils.response_helpers import PaginationBuilder, ResponseFormatter
+from fao.src.api.utils.query_helpers import QueryBuilder, AggregationType, CountMode, MatchMode
+from fao.src.api.utils.response_helpers import PaginationBuilder, ResponseFormatter, RESPONSE_MEDIA_TYPES
+from fao.src.api.utils.export_helpers import EXPORT_MEDIA_TYPES, build_export_response
+from fao.src.api.utils.arrow_helpers import ARROW_MEDIA_TYPES, arrow_available, build_schema, build_record_batch
 from fao.src.api.utils.parameter_parsers import (
     parse_sort_parameter,
     parse_fields_parameter,
     parse_aggregation_parameter,
+    parse_cursor_parameter,
 )
 
 from fao.src.core.validation import (
@@ -22,6 +26,13 @@ from fao.src.core.validation import (
     validate_model_has_columns,
 )
 
+from fao.src.core import settings
+from fao.src.core.responses import FastJSONResponse
+from fao.src.core.cache import (
+    generate_cache_key,
+    get_cached_count_async,
+    set_cached_count_async,
+)
 from fao.src.core.exceptions import (
     invalid_parameter,
     invalid_range,
@@ -47,6 +58,8 @@ class BaseRouterHandler(ABC):
         self.config = config
         self.query_builder: QueryBuilder
         self.requested_fields: Optional[List[str]] = None
+        self.response_format: str = "json"
+        self.match_mode: MatchMode = MatchMode.CONTAINS
 
     @abstractmethod
     def _get_all_data_fields(self) -> set:
@@ -91,6 +104,8 @@ class BaseRouterHandler(ABC):
         """
         # First validate fields
         self.requested_fields = self.validate_fields_parameter(fields)
+        # Only fetch what the response will contain (and joins only for those)
+        self.query_builder.select_fields(self.get_output_fields(self.requested_fields))
 
         # Then validate sort
         if not sort:
@@ -206,6 +221,14 @@ class BaseRouterHandler(ABC):
                 if not validation_func(param_value, db):
                     exception_func(param_value)
 
+    async def validate_filter_parameters_async(self, params: Dict[str, Any], db: AsyncSession) -> None:
+        """Validate filter parameters on an AsyncSession.
+
+        The lookup validators are sync, run_sync gives them a Session whose IO
+        still goes through the event loop.
+        """
+        await db.run_sync(lambda session: self.validate_filter_parameters(params, session))
+
     # In base_router.py
     def apply_basic_filters(self, params: Dict[str, Any]) -> int:
         """Apply filters for columns that exist directly on the model"""
@@ -256,11 +279,73 @@ class BaseRouterHandler(ABC):
                 self.query_builder.add_multi_filter(column, values)
 
         elif filter_type == "like":
-            self.query_builder.add_filter(column, param_value)
+            self.query_builder.add_filter(column, param_value, match=self.match_mode)
 
         elif filter_type == "exact":
             self.query_builder.add_filter(column, param_value, exact=True)
 
+    def resolve_count_mode(self, count: Optional[str]) -> str:
+        """Validate the count parameter, defaulting to exact"""
+        count = (count or CountMode.EXACT.value).lower()
+        selectable_modes = [CountMode.EXACT.value, CountMode.ESTIMATE.value, CountMode.NONE.value]
+
+        if count not in selectable_modes:
+            raise invalid_parameter(
+                params="count", value=count, reason=f"Must be one of: {', '.join(selectable_modes)}"
+            )
+        return count
+
+    def resolve_match_mode(self, match: Optional[str]) -> str:
+        """Validate the match parameter for text filters, defaulting to contains"""
+        match = (match or MatchMode.CONTAINS.value).lower()
+        selectable_modes = [mode.value for mode in MatchMode]
+
+        if match not in selectable_modes:
+            raise invalid_parameter(
+                params="match", value=match, reason=f"Must be one of: {', '.join(selectable_modes)}"
+            )
+        self.match_mode = MatchMode(match)
+        return match
+
+    def get_count_cache_key(self, params: Dict[str, Any]) -> str:
+        """Cache key for the exact count of a filter set"""
+        # Only filters change the count - pagination, projection and sort don't
+        filter_params = {}
+        for key, value in params.items():
+            if key in ["limit", "offset", "cursor", "fields", "sort"] or value is None:
+                continue
+            filter_params[key] = sorted(str(v) for v in value) if isinstance(value, list) else value
+
+        return generate_cache_key(f"{self.table_name}:count", params=filter_params)
+
+    async def get_total_count_async(
+        self, count: Optional[str], params: Dict[str, Any], db: AsyncSession
+    ) -> Tuple[Optional[int], str]:
+        """Get the total row count for the filtered query using the requested count mode.
+
+        Exact counts are cached per normalized filter set, so repeated pages of the
+        same filters only count once. The cache is read through the pooled async
+        Redis client, which backs off while Redis is down instead of blocking the
+        request on a reconnect. Returns the count (None for count=none) and the
+        mode that produced it.
+        """
+        count = self.resolve_count_mode(count)
+
+        if count == CountMode.NONE.value:
+            return None, CountMode.NONE.value
+
+        if count == CountMode.ESTIMATE.value:
+            return await db.run_sync(self.query_builder.get_estimated_count), CountMode.ESTIMATE.value
+
+        cache_key = self.get_count_cache_key(params)
+        cached_count = await get_cached_count_async(cache_key)
+        if cached_count is not None:
+            return cached_count, CountMode.CACHED.value
+
+        total_count = await self.query_builder.get_count_async(db)
+        set_cached_count_async(cache_key, total_count, settings.count_cache_ttl)
+        return total_count, CountMode.EXACT.value
+
     def get_default_sort(self) -> List[Tuple[str, str]]:
         """Get default sort order"""
         if hasattr(self.model, "year"):
@@ -268,21 +353,113 @@ class BaseRouterHandler(ABC):
         else:
             return [("id", "asc")]
 
-    def filter_response_data(self, results: List, requested_fields: Optional[List[str]] = None) -> List[Dict]:
-        """Format query results based on requested fields"""
-        data = []
-        for result in results:
-            response_fields = {}
+    def get_keyset_sort(self, sort_columns: Optional[List[Tuple[str, str]]]) -> List[Tuple[str, str]]:
+        """Get the sort order used for paging, always ending in id so every row has a unique position"""
+        keyset_sort = list(sort_columns) if sort_columns else self.get_default_sort()
 
-            for field in self.all_data_fields:  # <- Changed from self.allowed_fields
-                if not requested_fields or field in requested_fields:
-                    if hasattr(result, field):
-                        response_fields[field] = getattr(result, field)
+        if not any(field == "id" for field, _ in keyset_sort):
+            # Follow the last direction so uniform sorts stay a single row comparison
+            keyset_sort.append(("id", keyset_sort[-1][1]))
 
-            sorted_fields = dict(sorted(response_fields.items()))
-            data.append(sorted_fields)
+        return keyset_sort
 
-        return data
+    def apply_cursor(self, cursor: Optional[str], keyset_sort: List[Tuple[str, str]], offset: int) -> int:
+        """Seek past the cursor position if one was given. Returns the offset to paginate with"""
+        if not cursor:
+            return offset
+
+        if offset:
+            raise incompatible_parameters(
+                params=["cursor", "offset"],
+                values=[cursor, offset],
+                reason="Use either cursor or offset pagination, not both",
+            )
+
+        try:
+            cursor_data = parse_cursor_parameter(cursor)
+        except ValueError as e:
+            raise invalid_parameter(
+                params="cursor", value=cursor, reason=f"{e}. Use next_cursor from a previous response"
+            )
+
+        if cursor_data["sort"] != [tuple(field) for field in keyset_sort]:
+            raise invalid_parameter(
+                params="cursor",
+                value=cursor,
+                reason="Cursor was issued for a different sort order. Keep sort unchanged while paging",
+            )
+
+        try:
+            self.query_builder.seek(keyset_sort, cursor_data["values"])
+        except ValueError as e:
+            raise invalid_parameter(params="cursor", value=cursor, reason=str(e))
+        return 0
+
+    def build_next_cursor(self, results: List, keyset_sort: List[Tuple[str, str]], limit: int) -> Optional[str]:
+        """Build the cursor for the page after `results`, or None if this is the last page"""
+        if limit <= 0 or len(results) < limit:
+            return None
+
+        project = self.query_builder.get_projection([field for field, _ in keyset_sort])
+        return PaginationBuilder.encode_cursor(keyset_sort, list(project(results[-1])))
+
+    def filter_response_data(self, results: List, requested_fields: Optional[List[str]] = None) -> List[Dict]:
+        """Format query results based on requested fields (a record batch for arrow/parquet)"""
+        if self.response_format in ARROW_MEDIA_TYPES:
+            return self.build_record_batch(results, requested_fields)
+
+        # Field order and row positions are worked out once, not per row
+        fields = self.get_output_fields(requested_fields)
+        project = self.query_builder.get_projection(fields)
+        return [dict(zip(fields, project(row))) for row in results]
+
+    def build_record_batch(self, results: List, requested_fields: Optional[List[str]] = None):
+        """Columnar version of filter_response_data: one value list per field, no per-row dicts"""
+        fields = self.get_output_fields(requested_fields)
+        schema = build_schema(self.query_builder.get_field_columns(fields))
+        indexes = self.query_builder.get_field_indexes(fields)
+        return build_record_batch(schema, [[row[index] for row in results] for index in indexes])
+
+    def get_output_fields(self, requested_fields: Optional[List[str]] = None) -> List[str]:
+        """Response fields in output (alphabetical) order"""
+        return [
+            field
+            for field in sorted(self.all_data_fields)
+            if (not requested_fields or field in requested_fields) and self.query_builder.has_field(field)
+        ]
+
+    def _resolve_format(self, format: Optional[str], media_types: Dict[str, str], default: str) -> str:
+        if format:
+            format = format.lower()
+            if format not in media_types:
+                raise invalid_parameter(
+                    params="format", value=format, reason=f"Must be one of: {', '.join(media_types)}"
+                )
+            if format in ARROW_MEDIA_TYPES and not arrow_available():
+                raise invalid_parameter(params="format", value=format, reason="pyarrow is not installed on this server")
+            return format
+
+        # Accept is a preference, not a demand - without pyarrow, negotiate among the formats we can serve
+        served = {
+            name: media_type
+            for name, media_type in media_types.items()
+            if name not in ARROW_MEDIA_TYPES or arrow_available()
+        }
+        return ResponseFormatter.negotiate_format(None, self.request.headers.get("accept"), served, default)
+
+    def resolve_response_format(self, format: Optional[str]) -> str:
+        """Validate the format parameter (or Accept header) of the list endpoint, defaulting to json"""
+        self.response_format = self._resolve_format(format, RESPONSE_MEDIA_TYPES, "json")
+        return self.response_format
+
+    def resolve_export_format(self, format: Optional[str]) -> str:
+        """Validate the format parameter (or Accept header) of the export endpoint, defaulting to csv"""
+        return self._resolve_format(format, EXPORT_MEDIA_TYPES, "csv")
+
+    def build_export_response(self, format: str, requested_fields: Optional[List[str]] = None):
+        """Stream every row matching the applied filters, in sort order"""
+        query = self.query_builder.project(self.get_output_fields(requested_fields))
+        return build_export_response(query, format, filename=self.table_name)
 
     def setup_aggregation(self, group_by: Union[str, List[str]], aggregations: Union[str, List[str]]):
         """Setup handler for aggregation mode with validation"""
@@ -426,21 +603,36 @@ class BaseRouterHandler(ABC):
         request,
         response,
         data: List[Dict],
-        total_count: int,
+        total_count: Optional[int],
         limit: int,
         offset: int,
         filter_count: int,
+        next_cursor: Optional[str] = None,
+        count_mode: str = CountMode.EXACT.value,
         **params,
-    ) -> Dict:
+    ) -> Response:
         """Build standardized API response"""
-        pagination = PaginationBuilder.build_pagination_meta(total_count, limit, offset)
+        pagination = PaginationBuilder.build_pagination_meta(
+            total_count, limit, offset, next_cursor=next_cursor, cursor=params.get("cursor"), count_mode=count_mode
+        )
 
         # Collect parameters for links
         all_params = {k: v for k, v in params.items() if v is not None}
         all_params.update({"limit": limit, "offset": offset})
 
-        links = PaginationBuilder.build_links(str(request.url), total_count, limit, offset, all_params)
+        links = PaginationBuilder.build_links(
+            str(request.url), total_count, limit, offset, all_params, next_cursor=next_cursor, count_mode=count_mode
+        )
+
+        ResponseFormatter.set_pagination_headers(
+            response, total_count, limit, offset, links, count_mode=count_mode, cursor=params.get("cursor")
+        )
 
-        ResponseFormatter.set_pagination_headers(response, total_count, limit, offset, links)
+        if self.response_format in ARROW_MEDIA_TYPES:
+            return ResponseFormatter.format_columnar_response(data, self.response_format, dict(response.headers))
 
-        return ResponseFormatter.format_data_response(data, pagination, links, filter_count)
+        # Returned as a response so FastAPI doesn't run jsonable_encoder over every row
+        return FastJSONResponse(
+            content=ResponseFormatter.format_data_response(data, pagination, links, filter_count),
+            headers=dict(response.headers),
+        )
@@ -0,0 +1,36 @@
+# fao/src/api/utils/config_registry.py
+"""
+Every generated router config (fao/src/api/routers/<group>/<name>_config.py)
+
+Used by tooling that plans database work from what the API actually filters
+on - the configs are the one place that lists each dataset's filters.
+"""
+import dataclasses
+import importlib
+from pathlib import Path
+from typing import Any, List
+
+ROUTERS_DIR = Path(__file__).resolve().parent.parent / "routers"
+ROUTERS_PACKAGE = "fao.src.api.routers"
+
+
+def load_router_configs() -> List[Any]:
+    """An instance of each router config class, ordered by table name"""
+    configs = []
+    for path in sorted(ROUTERS_DIR.glob("*/*_config.py")):
+        module = importlib.import_module(f"{ROUTERS_PACKAGE}.{path.parent.name}.{path.stem}")
+        for value in vars(module).values():
+            if (
+                isinstance(value, type)
+                and dataclasses.is_dataclass(value)
+                and value.__module__ == module.__name__
+                and value.__name__.endswith("Config")
+            ):
+                configs.append(value())
+    return sorted(configs, key=lambda config: config.table_name)
+
+
+def load_config_model(config) -> Any:
+    """The SQLAlchemy model a config's endpoints query"""
+    module = importlib.import_module(f"fao.src.db.pipelines.{config.table_name}.{config.table_name}_model")
+    return getattr(module, config.model_name)
@@ -0,0 +1,88 @@
+# fao/src/api/utils/export_helpers.py
+"""
+Streaming exports of a filtered dataset query
+
+Rows are pulled from a server-side cursor in batches of settings.export_batch_size
+and written out batch by batch, so memory stays flat no matter how many rows
+match. Each batch is a list of plain tuples in `fields` order - no ORM objects
+or per-row dicts are built for CSV, Arrow or Parquet.
+"""
+import csv
+import io
+from functools import partial
+from typing import AsyncIterator, Sequence
+
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select
+
+from fao.src.api.utils import arrow_helpers
+from fao.src.core import settings
+from fao.src.core.responses import dumps
+from fao.src.db.database import get_async_session_factory
+
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+    **arrow_helpers.ARROW_MEDIA_TYPES,
+}
+
+
+async def stream_batches(query: Select, batch_size: int) -> AsyncIterator[Sequence]:
+    """Yield result rows in batches from a server-side cursor.
+
+    Uses its own session: the request's session is closed as soon as the
+    endpoint returns, which is before the response body is streamed.
+    """
+    async with get_async_session_factory()() as session:
+        result = await session.stream(query.execution_options(yield_per=batch_size))
+        async for batch in result.partitions():
+            yield batch
+
+
+async def csv_chunks(query: Select, batches: AsyncIterator[Sequence]) -> AsyncIterator[bytes]:
+    """Header row, then one chunk per batch"""
+    fields = list(query.selected_columns.keys())
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+
+    async for batch in batches:
+        writer.writerows(batch)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+
+    # Header only - nothing matched
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+async def ndjson_chunks(query: Select, batches: AsyncIterator[Sequence]) -> AsyncIterator[bytes]:
+    """One JSON object per line, one chunk per batch"""
+    fields = list(query.selected_columns.keys())
+    async for batch in batches:
+        yield b"".join(dumps(dict(zip(fields, row))) + b"\n" for row in batch)
+
+
+def arrow_chunks(query: Select, batches: AsyncIterator[Sequence], format: str) -> AsyncIterator[bytes]:
+    """Arrow IPC stream or Parquet file, one record batch / row group per batch"""
+    schema = arrow_helpers.build_schema(dict(query.selected_columns.items()))
+    return arrow_helpers.stream_batches(schema, batches, format)
+
+
+EXPORT_WRITERS = {
+    "csv": csv_chunks,
+    "ndjson": ndjson_chunks,
+    "arrow": partial(arrow_chunks, format="arrow"),
+    "parquet": partial(arrow_chunks, format="parquet"),
+}
+
+
+def build_export_response(query: Select, format: str, filename: str) -> StreamingResponse:
+    """Stream a projected query (see QueryBuilder.project) in the requested format"""
+    batches = stream_batches(query, settings.export_batch_size)
+    return StreamingResponse(
+        EXPORT_WRITERS[format](query, batches),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{format}"'},
+    )
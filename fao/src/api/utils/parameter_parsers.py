@@ -1,5 +1,8 @@
 # fao/src/api/utils/parameter_parsers.py
 import re
+import json
+import base64
+import binascii
 from typing import List, Tuple, Optional, Dict, Any, Type
 from sqlalchemy import Column
 from fastapi import HTTPException
@@ -74,3 +77,31 @@ def parse_aggregation_parameter(agg: str) -> Dict[str, str]:
         alias = alias.replace(round_match.group(0), "").strip()
 
     return {"field": field, "function": function, "alias": alias, "round_to": round_to}
+
+
+def parse_cursor_parameter(cursor: str) -> Dict[str, Any]:
+    """Decode an opaque keyset pagination cursor.
+
+    Returns dict with 'sort' (list of (field, direction)) and 'values'.
+    Raises ValueError if the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise ValueError(f"Malformed cursor: {e}")
+
+    if not isinstance(payload, dict) or not isinstance(payload.get("s"), list) or not isinstance(payload.get("v"), list):
+        raise ValueError("Malformed cursor: missing sort or values")
+
+    if not all(
+        isinstance(item, list) and len(item) == 2 and all(isinstance(part, str) for part in item)
+        for item in payload["s"]
+    ):
+        raise ValueError("Malformed cursor: sort must be [field, direction] pairs")
+
+    sort = [tuple(item) for item in payload["s"]]
+    if len(sort) != len(payload["v"]):
+        raise ValueError("Malformed cursor: sort and values do not match")
+
+    return {"sort": sort, "values": payload["v"]}
@@ -1,8 +1,12 @@
 # fao/src/api/utils/query_helpers.py (expanded)
-from typing import Any, Set, List, Dict, Union, Tuple, Type
-from sqlalchemy import Numeric, select, Select, func, or_, and_, Column
+import json
+from datetime import date, datetime
+from operator import itemgetter
+from typing import Any, Callable, Set, List, Dict, Union, Tuple, Type
+from sqlalchemy import Float, Numeric, select, Select, func, or_, and_, tuple_, false, text, Column
 from sqlalchemy.orm import Query, DeclarativeBase
 from sqlalchemy.sql import ColumnElement
+from sqlalchemy.sql.util import find_tables
 from enum import Enum
 
 
@@ -29,17 +33,39 @@ class AggregationType(Enum):
     SUM_IF = "sum_if"  # Sum with condition
 
 
+class CountMode(Enum):
+    """How the total row count of a list request was produced."""
+
+    EXACT = "exact"  # count(*) over the filtered query
+    CACHED = "cached"  # exact count served from cache for the same filter set
+    ESTIMATE = "estimate"  # planner estimate (pg_class.reltuples or EXPLAIN rows)
+    NONE = "none"  # no count taken
+
+
+class MatchMode(Enum):
+    """How a text ("like") filter matches its column, case-insensitively."""
+
+    CONTAINS = "contains"  # ILIKE '%value%' - served by a pg_trgm GIN index
+    PREFIX = "prefix"  # lower(column) LIKE 'value%' - served by a lower(column) text_pattern_ops btree
+    EXACT = "exact"  # lower(column) = 'value' - same btree
+
+
 class QueryBuilder:
     """Helper class to build SQLAlchemy queries with filters and pagination."""
 
     def __init__(self, Table: Type[DeclarativeBase]):
         self.Table = Table
-        self.query = select(self.Table)
+        # Filters, ordering and pagination accumulate here; the SELECT list and
+        # the joins are only decided in build(). Plain columns rather than the
+        # ORM entity: rows come back as compact, tuple-backed Row objects.
+        self.query = select(*Table.__table__.columns).select_from(Table)
         self._aggregations = []
         self._group_by = []
         self._joined_tables: Set[str] = set()  # Track joined tables
-        self._joined_columns = []  # Track columns added from joins
-        self._column_mapping = []
+        self._joins: Dict[str, Tuple[Any, Column]] = {}  # join key -> (join table, local fk column)
+        self._output_fields: List[str] | None = None  # None = every column, main table and joined
+        self._order_fields: List[str] = []
+        self._in_filtered: Set[str] = set()  # columns with an IN filter, which already excludes NULLs
 
         # Proper field name to column mapping
         self._field_to_column: Dict[str, ColumnElement] = {}
@@ -54,21 +80,14 @@ class QueryBuilder:
         join_key = local_fk_column.key
 
         if join_key not in self._joined_tables:
-            self.query = self.query.join(join_model, local_fk_column == join_model.id)
-
-            add_columns = [col.name for col in join_model.__table__.columns]
-
-            # Track everything properly
-            current_index = len(self._column_mapping) + 1
-            for col_name in add_columns:
-                col_obj = getattr(join_model, col_name)
-                self.query = self.query.add_columns(col_obj)
-                self._column_mapping.append((current_index, col_name))
-
-                # This is the key - maintain the mapping
-                self._field_to_column[col_name] = col_obj
+            # Only registered - build() adds the join if anything references its columns
+            self._joins[join_key] = (join_model.__table__, local_fk_column)
 
-                current_index += 1
+            # Names already taken (main table columns like id, or an earlier
+            # join's created_at) win, so every field name is unique
+            for col in join_model.__table__.columns:
+                if col.name not in self._field_to_column:
+                    self._field_to_column[col.name] = getattr(join_model, col.name)
 
             self._joined_tables.add(join_key)
 
@@ -78,15 +97,31 @@ class QueryBuilder:
         """Check if a table has already been joined."""
         return join_key in self._joined_tables
 
-    def add_filter(self, column, value: Any, exact: bool = False) -> "QueryBuilder":
+    def add_filter(
+        self, column, value: Any, exact: bool = False, match: MatchMode = MatchMode.CONTAINS
+    ) -> "QueryBuilder":
         """Add a single filter to the query."""
         if value is not None:
             if isinstance(value, str) and not exact:
-                self.query = self.query.where(column.ilike(f"%{value}%"))
+                self.query = self.query.where(self._text_match(column, value, match))
             else:
                 self.query = self.query.where(column == value)
         return self
 
+    @staticmethod
+    def _text_match(column, value: str, match: MatchMode) -> ColumnElement:
+        """Case-insensitive text predicate in the form the search indexes can serve.
+
+        The pattern is lower-cased here rather than in SQL so the planner sees a
+        constant and can turn a prefix LIKE into a btree range scan.
+        """
+        if match == MatchMode.PREFIX:
+            escaped = value.lower().replace("/", "//").replace("%", "/%").replace("_", "/_")
+            return func.lower(column).like(f"{escaped}%", escape="/")
+        if match == MatchMode.EXACT:
+            return func.lower(column) == value.lower()
+        return column.ilike(f"%{value}%")
+
     def add_multi_filter(self, column, values: Union[str, List]) -> "QueryBuilder":
         """Add filter for multiple values (e.g., '102,489' or [102, 489])."""
         if values:
@@ -98,6 +133,12 @@ class QueryBuilder:
             self.query = self.query.where(column.in_(values))
         return self
 
+    def add_in_filter(self, column, values: List[Any]) -> "QueryBuilder":
+        """Add `column IN (values)` as given - an empty list matches nothing."""
+        self.query = self.query.where(column.in_(values))
+        self._in_filtered.add(column.key)
+        return self
+
     def add_range_filter(self, column, min_val: Any = None, max_val: Any = None) -> "QueryBuilder":
         """Add range filter for numeric columns."""
         if min_val is not None:
@@ -128,17 +169,18 @@ class QueryBuilder:
         agg_func = agg_funcs[agg_type](column)
         round_to_n = int(round_to) if round_to else 2
 
-        # Apply rounding for numeric aggregations
+        # Apply rounding for numeric aggregations, back to double precision so the
+        # driver returns floats rather than Decimals that need converting per value
         if agg_type == AggregationType.AVG:
-            agg_func = func.round(func.cast(agg_func, Numeric), round_to_n)
+            agg_func = func.cast(func.round(func.cast(agg_func, Numeric), round_to_n), Float)
         elif agg_type == AggregationType.SUM:
-            agg_func = func.round(func.cast(agg_func, Numeric), round_to_n)
+            agg_func = func.cast(func.round(func.cast(agg_func, Numeric), round_to_n), Float)
         elif agg_type == AggregationType.STDDEV:
-            agg_func = func.round(func.cast(agg_func, Numeric), round_to_n)
+            agg_func = func.cast(func.round(func.cast(agg_func, Numeric), round_to_n), Float)
         elif agg_type == AggregationType.VARIANCE:
-            agg_func = func.round(func.cast(agg_func, Numeric), round_to_n)
+            agg_func = func.cast(func.round(func.cast(agg_func, Numeric), round_to_n), Float)
         elif agg_type == AggregationType.MEDIAN:
-            agg_func = func.round(func.cast(agg_func, Numeric), round_to_n)
+            agg_func = func.cast(func.round(func.cast(agg_func, Numeric), round_to_n), Float)
 
         if alias:
             agg_func = agg_func.label(alias)
@@ -173,68 +215,182 @@ class QueryBuilder:
 
             column = self._field_to_column[field_name]
             self.query = self.query.order_by(column.desc() if direction == "desc" else column)
+            self._order_fields.append(field_name)
+
+        return self
+
+    def seek(self, sort_fields: List[Tuple[str, str]], values: List[Any]) -> "QueryBuilder":
+        """Add a keyset predicate so the query starts right after the row holding `values`.
 
+        Args:
+            sort_fields: The full ordering of the query, ending in a unique column (id)
+            values: The sort key values of the last row of the previous page
+        """
+        if len(values) != len(sort_fields):
+            raise ValueError("Cursor values don't match the sort order")
+
+        columns = []
+        for field_name, _ in sort_fields:
+            if field_name not in self._field_to_column:
+                raise ValueError(f"Cannot seek on '{field_name}' - field not available in query")
+            columns.append(self._field_to_column[field_name])
+
+        # Cursor values have been through JSON - give the driver the column's own types back
+        values = [self._coerce_to_column(column, value) for column, value in zip(columns, values)]
+
+        directions = {direction for _, direction in sort_fields}
+        has_nulls = any(value is None for value in values) or any(col.nullable for col in columns)
+
+        # Same direction on non-null columns: a row comparison the planner can serve from a composite index
+        if len(directions) == 1 and not has_nulls:
+            row, after = tuple_(*columns), tuple_(*values)
+            self.query = self.query.where(row < after if "desc" in directions else row > after)
+            return self
+
+        # Mixed directions: (a > x) OR (a = x AND b > y) OR ..., with Postgres NULL ordering
+        # (NULLS LAST for asc, NULLS FIRST for desc)
+        clauses = []
+        for i, (column, (_, direction), value) in enumerate(zip(columns, sort_fields, values)):
+            equal = [col.is_not_distinct_from(val) for col, val in zip(columns[:i], values[:i])]
+            if value is None:
+                after = column.is_not(None) if direction == "desc" else false()
+            elif direction == "desc":
+                after = column < value
+            else:
+                after = or_(column > value, column.is_(None))
+            clauses.append(and_(*equal, after))
+
+        self.query = self.query.where(or_(*clauses))
         return self
 
+    @staticmethod
+    def _coerce_to_column(column, value: Any) -> Any:
+        """Convert a JSON-decoded value to the Python type of `column`."""
+        if value is None:
+            return None
+        try:
+            python_type = column.type.python_type
+        except NotImplementedError:
+            return value
+        if isinstance(value, python_type):
+            return value
+        if python_type in (date, datetime):
+            return python_type.fromisoformat(value)
+        return python_type(value)
+
     def get_count(self, db) -> int:
         """Get total count for pagination."""
         # For aggregated queries, we need to count the groups
         if self._group_by:
-            count_query = select(func.count()).select_from(self.query.subquery())
+            count_query = select(func.count()).select_from(self.build().subquery())
         else:
-            count_query = select(func.count()).select_from(self.query.subquery())
+            count_query = select(func.count()).select_from(self.build().subquery())
         return db.execute(count_query).scalar() or 0
 
+    async def get_count_async(self, db) -> int:
+        """Get total count for pagination on an AsyncSession."""
+        count_query = select(func.count()).select_from(self.build().subquery())
+        return (await db.execute(count_query)).scalar() or 0
+
+    def get_estimated_count(self, db) -> int:
+        """Get the planner's row estimate instead of counting.
+
+        Unfiltered queries use pg_class.reltuples for the main table, anything
+        else uses the top-level "Plan Rows" of EXPLAIN on the query.
+        """
+        if self.query.whereclause is None and not self._group_by:
+            reltuples = db.execute(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table_name)"),
+                {"table_name": self.Table.__table__.name},
+            ).scalar()
+            # reltuples is -1 (or 0) until the table has been vacuumed/analyzed
+            if reltuples and reltuples > 0:
+                return int(reltuples)
+
+        connection = db.connection()
+        compiled = self.build().compile(dialect=connection.dialect, compile_kwargs={"render_postcompile": True})
+        params = tuple(compiled.params[name] for name in compiled.positiontup) if compiled.positional else compiled.params
+        plan = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled.string}", params).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
     def paginate(self, limit: int, offset: int) -> "QueryBuilder":
         """Add pagination to the query."""
         if limit > 0:
             self.query = self.query.limit(limit).offset(offset)
         return self
 
+    def select_fields(self, fields: List[str]) -> "QueryBuilder":
+        """Limit the SELECT list to `fields` (sort keys are added back for the cursor)."""
+        self._output_fields = list(fields)
+        return self
+
+    def get_selected_fields(self) -> List[str]:
+        """Field names of the SELECT list build() produces, in order."""
+        if self._output_fields is None:
+            return list(self._field_to_column)
+        return self._output_fields + [field for field in self._order_fields if field not in self._output_fields]
+
+    def build(self, fields: List[str] | None = None) -> Select:
+        """The statement to run: the selected fields plus only the joins something references.
+
+        Joins that no selected column, filter, sort or grouping touches are left
+        out. They're inner joins on a foreign key, so the only rows a dropped join
+        would have removed are the ones with a NULL key - those are excluded directly.
+        """
+        query = self.query
+        if not self._aggregations:
+            fields = fields if fields is not None else self.get_selected_fields()
+            query = query.with_only_columns(*[self._field_to_column[field].label(field) for field in fields])
+
+        referenced = set()
+        for clause in [
+            *query.selected_columns,
+            *([query.whereclause] if query.whereclause is not None else []),
+            *query._order_by_clauses,
+            *query._group_by_clauses,
+        ]:
+            referenced.update(find_tables(clause, check_columns=True))
+
+        for join_table, local_fk_column in self._joins.values():
+            if join_table in referenced:
+                query = query.join(join_table, local_fk_column == join_table.c.id)
+            elif local_fk_column.nullable and local_fk_column.key not in self._in_filtered:
+                query = query.where(local_fk_column.is_not(None))
+        return query
+
+    def project(self, fields: List[str]) -> Select:
+        """The query with only `fields` selected, as plain columns in that order."""
+        return self.build(fields)
+
+    def has_field(self, field: str) -> bool:
+        """Whether `field` names a column of the main table or a joined lookup."""
+        return field in self._field_to_column
+
+    def get_field_columns(self, fields: List[str]) -> Dict[str, ColumnElement]:
+        """The column behind each field, in the order given."""
+        return {field: self._field_to_column[field] for field in fields}
+
+    def get_field_indexes(self, fields: List[str]) -> List[int]:
+        """Position of each field in the rows returned by execute()."""
+        positions = {name: index for index, name in enumerate(self.get_selected_fields())}
+        return [positions[field] for field in fields]
+
+    def get_projection(self, fields: List[str]) -> Callable[[Any], Tuple]:
+        """Function pulling `fields` out of a result row as a tuple, resolved once per query."""
+        indexes = self.get_field_indexes(fields)
+        if len(indexes) == 1:
+            index = indexes[0]
+            return lambda row: (row[index],)
+        if not indexes:
+            return lambda row: ()
+        return itemgetter(*indexes)
+
     def execute(self, db):
-        """Execute the query and return results."""
-        rows = db.execute(self.query).all()
+        """Execute the query and return its Row objects (attribute access by field name)."""
+        return db.execute(self.build()).all()
 
-        # For aggregated queries, return raw rows
-        if self._aggregations:
-            return rows
-
-        # For regular queries, parse to HybridResult objects
-        return self.parse_results(rows)
-
-    def parse_results(self, rows):
-        """Convert Row results to dictionaries with all columns."""
-        # If no additional columns were added, return ORM objects
-        if not self._column_mapping:
-            return [row[0] for row in rows]
-
-        # Otherwise, create hybrid objects
-        results = []
-        for row in rows:
-            # Create a wrapper that combines ORM object and additional columns
-            class HybridResult:
-                def __init__(self, orm_obj, row_data, column_mapping):
-                    self._orm_obj = orm_obj
-                    self._row_data = row_data
-                    self._column_mapping = column_mapping
-
-                def __getattr__(self, name):
-                    # First try the ORM object
-                    if hasattr(self._orm_obj, name):
-                        return getattr(self._orm_obj, name)
-
-                    # Then check our additional columns
-                    for index, col_name in self._column_mapping:
-                        if col_name == name and index < len(self._row_data):
-                            return self._row_data[index]
-
-                    raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
-
-                def __hasattr__(self, name):
-                    if hasattr(self._orm_obj, name):
-                        return True
-                    return any(col_name == name for _, col_name in self._column_mapping)
-
-            results.append(HybridResult(row[0], row, self._column_mapping))
-
-        return results
+    async def execute_async(self, db):
+        """Execute the query on an AsyncSession and return its Row objects."""
+        return (await db.execute(self.build())).all()
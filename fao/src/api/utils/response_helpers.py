@@ -1,22 +1,78 @@
 # fao/src/api/utils/response_helpers.py (complete)
-from typing import Dict, List, Any, Set, Optional
+from typing import Dict, List, Any, Set, Optional, Tuple
 from datetime import datetime, timezone
 
 import math
+import json
+import base64
 from urllib.parse import urlencode, urlparse, parse_qs
 
 from fastapi import Response
 
+from fao.src.api.utils.query_helpers import CountMode
+from fao.src.api.utils import arrow_helpers
+
+# Formats the paged data endpoints can answer in
+RESPONSE_MEDIA_TYPES = {
+    "json": "application/json",
+    **arrow_helpers.ARROW_MEDIA_TYPES,
+}
+
 
 class PaginationBuilder:
     """Build pagination metadata and links."""
 
     @staticmethod
-    def build_pagination_meta(total_count: int, limit: int, offset: int) -> Dict:
-        """Build pagination metadata."""
-        total_pages = math.ceil(total_count / limit) if limit > 0 else 1
+    def build_pagination_meta(
+        total_count: Optional[int],
+        limit: int,
+        offset: int,
+        next_cursor: Optional[str] = None,
+        cursor: Optional[str] = None,
+        count_mode: str = CountMode.EXACT.value,
+    ) -> Dict:
+        """Build pagination metadata.
+
+        count_mode reports where total came from. Page numbers are only derived
+        from exact (or cached exact) totals - with an estimate or no count,
+        has_next comes from whether the page was full.
+        """
+        is_exact = total_count is not None and count_mode in (CountMode.EXACT.value, CountMode.CACHED.value)
+        if total_count is None:
+            total_pages = None
+        else:
+            total_pages = math.ceil(total_count / limit) if limit > 0 else 1
         current_page = (offset // limit) + 1 if limit > 0 else 1
 
+        if cursor:
+            # Keyset pages have no page number - position is only known relative to the cursor
+            return {
+                "total": total_count,
+                "total_pages": total_pages,
+                "current_page": None,
+                "per_page": limit,
+                "from": None,
+                "to": None,
+                "has_next": next_cursor is not None,
+                "has_prev": True,
+                "next_cursor": next_cursor,
+                "count_mode": count_mode,
+            }
+
+        if not is_exact:
+            return {
+                "total": total_count,
+                "total_pages": total_pages,
+                "current_page": current_page,
+                "per_page": limit,
+                "from": offset + 1,
+                "to": None,
+                "has_next": next_cursor is not None,
+                "has_prev": current_page > 1,
+                "next_cursor": next_cursor,
+                "count_mode": count_mode,
+            }
+
         return {
             "total": total_count,
             "total_pages": total_pages,
@@ -26,13 +82,27 @@ class PaginationBuilder:
             "to": min(offset + limit, total_count),
             "has_next": current_page < total_pages,
             "has_prev": current_page > 1,
+            "next_cursor": next_cursor,
+            "count_mode": count_mode,
         }
 
     @staticmethod
-    def build_links(base_url: str, total_count: int, limit: int, offset: int, params: Dict) -> Dict:
-        """Build pagination links."""
+    def build_links(
+        base_url: str,
+        total_count: Optional[int],
+        limit: int,
+        offset: int,
+        params: Dict,
+        next_cursor: Optional[str] = None,
+        count_mode: str = CountMode.EXACT.value,
+    ) -> Dict:
+        """Build pagination links.
+
+        If the request was made with a cursor only first/next links are built, since
+        keyset pages can't be addressed by number. Without an exact total there is
+        no last link and next follows whether the page was full.
+        """
         links = {}
-        total_pages = math.ceil(total_count / limit) if limit > 0 else 1
         current_page = (offset // limit) + 1 if limit > 0 else 1
 
         # Parse base URL
@@ -40,25 +110,50 @@ class PaginationBuilder:
         base_params = parse_qs(parsed.query)
 
         # Merge with provided params
-        query_params = {k: v for k, v in params.items() if k not in ["offset", "limit"] and v is not None}
+        query_params = {k: v for k, v in params.items() if k not in ["offset", "limit", "cursor"] and v is not None}
 
         def build_url(new_offset: int) -> str:
             all_params = {**query_params, "limit": limit, "offset": new_offset}
             query_string = urlencode(all_params, doseq=True)
             return f"{parsed.scheme}://{parsed.netloc}{parsed.path}?{query_string}"
 
+        def build_cursor_url(cursor: str) -> str:
+            all_params = {**query_params, "limit": limit, "cursor": cursor}
+            query_string = urlencode(all_params, doseq=True)
+            return f"{parsed.scheme}://{parsed.netloc}{parsed.path}?{query_string}"
+
         # Build links
         links["first"] = build_url(0)
-        links["last"] = build_url((total_pages - 1) * limit)
 
-        if current_page < total_pages:
+        if params.get("cursor"):
+            if next_cursor:
+                links["next"] = build_cursor_url(next_cursor)
+            return links
+
+        if total_count is not None and count_mode in (CountMode.EXACT.value, CountMode.CACHED.value):
+            total_pages = math.ceil(total_count / limit) if limit > 0 else 1
+            links["last"] = build_url((total_pages - 1) * limit)
+
+            if current_page < total_pages:
+                links["next"] = build_url(offset + limit)
+        elif next_cursor:
             links["next"] = build_url(offset + limit)
 
         if current_page > 1:
             links["prev"] = build_url(max(0, offset - limit))
 
+        # Lets offset clients switch to keyset pagination for deep pages
+        if next_cursor:
+            links["next_cursor"] = build_cursor_url(next_cursor)
+
         return links
 
+    @staticmethod
+    def encode_cursor(sort_fields: List[Tuple[str, str]], values: List[Any]) -> str:
+        """Encode the sort order and last row's sort key values as an opaque cursor."""
+        payload = json.dumps({"s": [list(field) for field in sort_fields], "v": values}, default=str)
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
 
 class ResponseFormatter:
     """Format API responses consistently."""
@@ -83,20 +178,56 @@ class ResponseFormatter:
 
         return response
 
+    @staticmethod
+    def format_columnar_response(batch, format: str, headers: Dict[str, str]) -> Response:
+        """A page as a single Arrow IPC stream or Parquet file; pagination stays in the headers."""
+        return Response(
+            content=arrow_helpers.serialize_batch(batch, format),
+            media_type=arrow_helpers.ARROW_MEDIA_TYPES[format],
+            headers=headers,
+        )
+
+    @staticmethod
+    def negotiate_format(
+        requested: Optional[str], accept: Optional[str], media_types: Dict[str, str], default: str
+    ) -> str:
+        """Pick a response format: the format parameter if given, else the first Accept media type we serve."""
+        if requested:
+            return requested.lower()
+
+        for media_range in (accept or "").split(","):
+            media_type = media_range.split(";")[0].strip().lower()
+            for format, format_media_type in media_types.items():
+                if media_type == format_media_type.split(";")[0]:
+                    return format
+        return default
+
     @staticmethod
     def format_metadata_response(dataset: str, metadata_type: str, total: int, items: List[Dict]) -> Dict:
         """Format metadata response."""
         return {"dataset": dataset, f"total_{metadata_type}": total, metadata_type: items}
 
     @staticmethod
-    def set_pagination_headers(response: Response, total_count: int, limit: int, offset: int, links: dict):
+    def set_pagination_headers(
+        response: Response,
+        total_count: Optional[int],
+        limit: int,
+        offset: int,
+        links: dict,
+        count_mode: str = CountMode.EXACT.value,
+        cursor: Optional[str] = None,
+    ):
         """Set pagination-related response headers"""
-        total_pages = (total_count + limit - 1) // limit if limit > 0 else 1
         current_page = (offset // limit) + 1 if limit > 0 else 1
 
-        response.headers["X-Total-Count"] = str(total_count)
-        response.headers["X-Total-Pages"] = str(total_pages)
-        response.headers["X-Current-Page"] = str(current_page)
+        if total_count is not None:
+            total_pages = (total_count + limit - 1) // limit if limit > 0 else 1
+            response.headers["X-Total-Count"] = str(total_count)
+            response.headers["X-Total-Pages"] = str(total_pages)
+        response.headers["X-Count-Mode"] = count_mode
+        if not cursor:
+            # Keyset pages have no page number, as in build_pagination_meta
+            response.headers["X-Current-Page"] = str(current_page)
         response.headers["X-Per-Page"] = str(limit)
 
         # Build Link header
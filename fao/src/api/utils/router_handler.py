@@ -1,6 +1,12 @@
 # fao/src/api/utils/dataset_router_handler.py
 from typing import Dict, List, Set, Any, Optional
+from sqlalchemy.orm import Session
 from .base_router import BaseRouterHandler
+from fao.logger import logger
+from fao.src.core.validation import lookup_resolver
+
+# Prefix of the per-request filter usage log line
+FILTER_USAGE_TAG = "filter usage:"
 
 
 class RouterHandler(BaseRouterHandler):
@@ -8,6 +14,8 @@ class RouterHandler(BaseRouterHandler):
 
     def __init__(self, db, model, model_name, table_name, request, response, config):
         self.config = config
+        # Lookup code filter -> fact table foreign key ids, see resolve_lookup_codes
+        self.lookup_ids: Dict[str, List[int]] = {}
         super().__init__(db, model, model_name, table_name, request, response, config)
         self.initialize_query_builder()
 
@@ -20,7 +28,11 @@ class RouterHandler(BaseRouterHandler):
         return set(self.config.all_parameter_fields)
 
     def initialize_query_builder(self) -> None:
-        """Initialize the QueryBuilder with the model and optional joined columns"""
+        """Initialize the QueryBuilder with the model and its lookup joins.
+
+        Joins are only registered here - QueryBuilder.build() adds the ones a
+        request's fields, filters or sort actually reference.
+        """
         super().initialize_query_builder()
 
         for filter in self.config.filter_configs:
@@ -28,6 +40,35 @@ class RouterHandler(BaseRouterHandler):
                 if not self.query_builder.is_joined(filter["joins_table"]):
                     self.query_builder.add_join(filter["join_model"], filter["join_condition"], filter["filter_column"])
 
+    def validate_filter_parameters(self, params: Dict[str, Any], db: Session) -> None:
+        super().validate_filter_parameters(params, db)
+        self.resolve_lookup_codes(params, db)
+
+    def resolve_lookup_codes(self, params: Dict[str, Any], db: Session) -> None:
+        """Turn lookup code filters (area_code=5,8) into the fact table's foreign key ids.
+
+        The lookup resolver maps each code to its reference rows' ids from a
+        cached read of the reference table, so these filters become
+        `area_code_id IN (...)` on the indexed column instead of a join.
+        """
+        self.lookup_ids = {}
+        for filter_config in self.config.filter_configs:
+            if filter_config["filter_type"] != "multi" or not filter_config.get("joins_table"):
+                continue
+
+            param_value = params.get(filter_config["name"])
+            if not param_value:
+                continue
+
+            if isinstance(param_value, str):
+                codes = [v.strip() for v in param_value.split(",") if v.strip()]
+            else:
+                codes = param_value
+
+            self.lookup_ids[filter_config["name"]] = lookup_resolver.resolve(
+                db, filter_config["filter_model"], filter_config["filter_column"], [str(code) for code in codes]
+            )
+
     def apply_filters_from_config(self, params: Dict[str, Any]) -> int:
         return self.apply_all_filters(params)
 
@@ -44,9 +85,23 @@ class RouterHandler(BaseRouterHandler):
             if not param_value:
                 continue
 
-            column = getattr(filter_config["filter_model"], filter_config["filter_column"])
-            self._apply_single_filter(column, param_value, filter_config["filter_type"])
+            if filter_config["name"] in self.lookup_ids:
+                self.query_builder.add_in_filter(filter_config["join_condition"], self.lookup_ids[filter_config["name"]])
+            else:
+                column = getattr(filter_config["filter_model"], filter_config["filter_column"])
+                self._apply_single_filter(column, param_value, filter_config["filter_type"])
 
             filter_count += 1
 
+        self.log_filter_usage(params)
         return filter_count
+
+    def log_filter_usage(self, params: Dict[str, Any]) -> None:
+        """Record which filters the request combined, for the index advisor (fao/src/db/index_advisor.py)"""
+        names = [f["name"] for f in self.config.filter_configs]
+        for range_config in self.config.range_configs:
+            names += [f"{range_config['param_name']}_min", f"{range_config['param_name']}_max"]
+
+        used = sorted({name for name in names if params.get(name) is not None})
+        if used:
+            logger.bind(filter_usage=True).debug(f"{FILTER_USAGE_TAG} {self.table_name} {','.join(used)}")
@@ -3,24 +3,43 @@
 Simple caching module for FAO API
 Caches endpoint results in Redis with automatic fallback if Redis is unavailable
 
+Two tiers: an in-process LRU (L1) with per-entry TTL in front of Redis (L2).
+Endpoint results are cached as the final (gzipped) JSON body plus headers, so
+a hit is returned as a Response without unpickling or re-encoding.
+cache_result talks to Redis through a pooled redis.asyncio client so cache
+IO never blocks the event loop; the sync client is kept for admin helpers
+(invalidate_cache, get_cache_info) that run outside request handling.
+invalidate_cache publishes the pattern so every worker drops matching L1
+entries, see run_invalidation_listener.
+
 Note: Some type: ignore comments are needed due to redis-py type stubs
 sometimes confusing sync and async clients in type checkers.
-
-Requirements:
-- redis>=4.0.0,<6.0.0 (install with: pip install redis==5.0.1)
 """
 # Standard library
 import asyncio
+import fnmatch
+import gzip
 import hashlib
+import inspect
 import json
-import pickle
+import struct
+import threading
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from functools import wraps
-from typing import Any, Dict, List, Union
+from typing import Any, Awaitable, Callable, Dict, List, Set, Tuple, Union
 
 # Third-party
 import redis
+import redis.asyncio as aioredis
+from redis.asyncio.lock import Lock as AsyncLock
 from redis import Redis
+from fastapi import Request, Response
+from starlette.concurrency import run_in_threadpool
 from fao.src.core import settings
+from fao.src.core.responses import FastJSONResponse, dumps
 from fao.logger import logger
 from fao.src.core.exceptions import (
     CacheOperationError,
@@ -32,8 +51,89 @@ from fao.src.core.exceptions import (
     cache_deserialization_failed,
 )
 
-# Global Redis client
+# Global Redis clients
 _redis_client: Redis | None = None
+_async_redis_client: aioredis.Redis | None = None
+_async_redis_retry_at: float = 0.0
+
+# Keeps fire-and-forget cache writes referenced until they finish
+_pending_writes: Set[asyncio.Task] = set()
+
+# In-process computations (misses and refreshes) by cache key, see _single_flight
+_inflight: Dict[str, asyncio.Task] = {}
+
+
+class TierStats:
+    """Hit/miss counters for one cache tier (per worker process)"""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+
+class LocalCache:
+    """In-process L1 cache: size-bounded LRU with a TTL per entry.
+
+    Values are kept as the original objects, so a hit skips the Redis round
+    trip. Callers must not mutate what they get back.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.stats = TierStats()
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        # invalidate_cache can be called from worker threads
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Returns (found, value)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.stats.misses += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return True, entry[1]
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete_pattern(self, pattern: str) -> int:
+        """Drop keys matching a Redis-style glob pattern"""
+        with self._lock:
+            keys = [key for key in self._entries if fnmatch.fnmatchcase(key, pattern)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_local_cache = LocalCache(settings.l1_cache_max_entries)
+_redis_stats = TierStats()
+
+
+def _invalidation_channel() -> str:
+    return f"{settings.cache_prefix}{settings.cache_key_separator}invalidate"
 
 
 def get_redis_client() -> Redis | None:
@@ -77,6 +177,348 @@ def get_redis_client() -> Redis | None:
     return _redis_client
 
 
+def get_async_redis_client() -> aioredis.Redis | None:
+    """
+    Get or create the pooled async Redis client used by request handlers
+    Returns None if caching is disabled, or for redis_retry_interval seconds after
+    a connection failure so a Redis outage doesn't cost every request a timeout
+    """
+    global _async_redis_client
+
+    if not getattr(settings, "cache_enabled", True):
+        return None
+
+    if time.monotonic() < _async_redis_retry_at:
+        return None
+
+    if _async_redis_client is None:
+        is_upstash = "upstash.io" in settings.redis_host.lower()
+        connection_kwargs: Dict[str, Any] = {}
+        if is_upstash:
+            # Upstash requires SSL but doesn't require cert validation
+            connection_kwargs = {"connection_class": aioredis.SSLConnection, "ssl_cert_reqs": "none"}
+
+        pool = aioredis.BlockingConnectionPool(
+            host=settings.redis_host,
+            port=settings.redis_port,
+            password=settings.redis_password,
+            db=0,
+            max_connections=settings.redis_max_connections,
+            timeout=settings.redis_socket_timeout,  # Wait for a free connection at most this long
+            socket_connect_timeout=settings.redis_socket_timeout,
+            socket_timeout=settings.redis_socket_timeout,
+            **connection_kwargs,
+        )
+        _async_redis_client = aioredis.Redis(connection_pool=pool)
+
+    return _async_redis_client
+
+
+def _mark_async_redis_unavailable(error: Exception) -> None:
+    """Back off from Redis after a connection failure"""
+    global _async_redis_retry_at
+
+    _async_redis_retry_at = time.monotonic() + settings.redis_retry_interval
+    exc = cache_connection_failed(error=error)
+    logger.error(f"Cache connection failed: {exc.message} - {exc.detail}")
+
+
+async def close_async_redis_client() -> None:
+    """Close the async client and its connection pool"""
+    global _async_redis_client
+
+    if _async_redis_client is not None:
+        await _async_redis_client.aclose()
+        _async_redis_client = None
+
+
+def _schedule_cache_write(
+    redis_client: aioredis.Redis,
+    cache_key: str,
+    value: Any,
+    ttl: int,
+    serializer: Callable[[Any], bytes],
+    lock: AsyncLock | None = None,
+) -> None:
+    """Write to the cache in the background so the caller never waits on Redis"""
+    task = asyncio.get_running_loop().create_task(_write_cache(redis_client, cache_key, value, ttl, serializer, lock))
+    _pending_writes.add(task)
+    task.add_done_callback(_pending_writes.discard)
+
+
+async def _write_cache(
+    redis_client: aioredis.Redis,
+    cache_key: str,
+    value: Any,
+    ttl: int,
+    serializer: Callable[[Any], bytes],
+    lock: AsyncLock | None = None,
+) -> None:
+    """Serialize and store a value, logging (never raising) failures.
+
+    If a lock is given it's released after the write, so workers waiting on it
+    find the value as soon as they see the lock go.
+    """
+    try:
+        try:
+            data = serializer(value)
+        except Exception as e:
+            exc = cache_serialization_failed(type(value), error=e)
+            logger.error(f"Cache serialization failed: {exc.message} - {exc.detail}")
+            return
+
+        try:
+            await redis_client.setex(cache_key, ttl, data)
+        except (redis.ConnectionError, redis.TimeoutError) as e:
+            _mark_async_redis_unavailable(e)
+        except redis.RedisError as e:
+            exc = cache_write_failed(cache_key, error=e)
+            logger.error(f"Cache operation failed: {exc.message} - {exc.detail}")
+    finally:
+        if lock is not None:
+            await _release_lock(lock)
+
+
+async def _release_lock(lock: AsyncLock) -> None:
+    try:
+        await lock.release()
+    except redis.RedisError:
+        # Expired or Redis gone - either way nobody holds it anymore
+        pass
+
+
+@dataclass
+class CachedResponse:
+    """A rendered endpoint response: the JSON body (gzipped when large) and its headers"""
+
+    body: bytes
+    gzipped: bool
+    media_type: str
+    headers: Dict[str, str]
+
+    @classmethod
+    def from_content(cls, content: Any) -> "CachedResponse":
+        """Render content as the app's JSON response class would and compress it"""
+        body = dumps(content)
+        gzipped = len(body) >= settings.cache_compress_min_size
+        if gzipped:
+            body = gzip.compress(body, compresslevel=settings.cache_compress_level, mtime=0)
+        return cls(body=body, gzipped=gzipped, media_type=FastJSONResponse.media_type, headers={})
+
+    def to_response(self, request: Request | None, cache_status: str) -> Response:
+        """Build the Response, decompressing only for clients that don't accept gzip"""
+        headers = {**self.headers, "Vary": "Accept-Encoding", "X-Cache": cache_status}
+        body = self.body
+        if self.gzipped:
+            accept_encoding = request.headers.get("accept-encoding", "") if request is not None else ""
+            if "gzip" in accept_encoding.lower():
+                headers["Content-Encoding"] = "gzip"
+            else:
+                body = gzip.decompress(body)
+        return Response(content=body, media_type=self.media_type, headers=headers)
+
+
+@dataclass
+class CacheEntry:
+    """What cache_result stores: the rendered response plus when it stops being fresh.
+
+    Redis keeps entries stale_ttl seconds past fresh_until so a stale value can
+    be served while it's refreshed.
+    """
+
+    value: CachedResponse
+    fresh_until: float
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() < self.fresh_until
+
+
+# Redis layout: magic | fresh_until, header length | header JSON | body
+_ENTRY_MAGIC = b"FAOC1"
+_ENTRY_PREFIX = struct.Struct(">dI")
+
+
+def _pack_entry(entry: CacheEntry) -> bytes:
+    header = json.dumps(
+        {"gzipped": entry.value.gzipped, "media_type": entry.value.media_type, "headers": entry.value.headers}
+    ).encode("utf-8")
+    return b"".join(
+        [_ENTRY_MAGIC, _ENTRY_PREFIX.pack(entry.fresh_until, len(header)), header, entry.value.body]
+    )
+
+
+def _unpack_entry(data: bytes) -> CacheEntry:
+    if not data.startswith(_ENTRY_MAGIC):
+        raise ValueError("Not a cache_result entry")
+    offset = len(_ENTRY_MAGIC)
+    fresh_until, header_length = _ENTRY_PREFIX.unpack_from(data, offset)
+    offset += _ENTRY_PREFIX.size
+    header = json.loads(data[offset : offset + header_length])
+    body = data[offset + header_length :]
+    return CacheEntry(
+        value=CachedResponse(
+            body=body, gzipped=header["gzipped"], media_type=header["media_type"], headers=header["headers"]
+        ),
+        fresh_until=fresh_until,
+    )
+
+
+async def _read_entry(redis_client: aioredis.Redis, cache_key: str, record_stats: bool = True) -> CacheEntry | None:
+    """Read a CacheEntry from Redis, None on a miss or any failure"""
+    cached_data = None
+    try:
+        cached_data = await redis_client.get(cache_key)
+    except (redis.ConnectionError, redis.TimeoutError) as e:
+        _mark_async_redis_unavailable(e)
+    except redis.RedisError as e:
+        # Log error but don't fail the request
+        exc = cache_read_failed(cache_key, error=e)
+        logger.error(f"Cache operation failed: {exc.message} - {exc.detail}")
+
+    entry = None
+    if isinstance(cached_data, bytes):
+        try:
+            entry = _unpack_entry(cached_data)
+        except (ValueError, struct.error) as e:
+            # Includes pickled entries from older versions - recomputed and overwritten
+            exc = cache_deserialization_failed(error=e)
+            logger.error(f"Cache deserialization failed: {exc.message} - {exc.detail}")
+
+    if record_stats:
+        if entry is not None:
+            _redis_stats.hits += 1
+        else:
+            _redis_stats.misses += 1
+    return entry
+
+
+async def _wait_for_entry(redis_client: aioredis.Redis, cache_key: str) -> CacheEntry | None:
+    """Poll Redis for the value another worker is computing, up to cache_lock_wait seconds"""
+    deadline = time.monotonic() + settings.cache_lock_wait
+    delay = 0.05
+    while time.monotonic() < deadline:
+        await asyncio.sleep(delay)
+        entry = await _read_entry(redis_client, cache_key, record_stats=False)
+        if entry is not None:
+            return entry
+        delay = min(delay * 2, 0.5)
+    return None
+
+
+def _single_flight(cache_key: str, factory: Callable[[], Awaitable[Any]]) -> "asyncio.Task[Any]":
+    """Run factory once per key in this process, sharing the task with concurrent callers.
+
+    Callers should await it through asyncio.shield so one request going away
+    doesn't cancel the work the others are waiting on.
+    """
+    task = _inflight.get(cache_key)
+    if task is None:
+        task = asyncio.get_running_loop().create_task(factory())
+        _inflight[cache_key] = task
+        task.add_done_callback(lambda _: _inflight.pop(cache_key, None))
+    return task
+
+
+async def _compute_and_store(
+    redis_client: aioredis.Redis | None,
+    cache_key: str,
+    compute: Callable[[], Awaitable[Any]],
+    ttl: int,
+    stale_ttl: int,
+    wait_for_leader: bool,
+) -> Any:
+    """Compute a value and cache it in both tiers.
+
+    With cache_lock_enabled only one worker computes a key at a time. Others
+    wait for its result (wait_for_leader) or give up and return None (used by
+    background refreshes, where someone else refreshing is just as good).
+    """
+    lock = None
+    if redis_client and settings.cache_lock_enabled:
+        lock = redis_client.lock(
+            f"{cache_key}{settings.cache_key_separator}lock", timeout=settings.cache_lock_timeout, blocking=False
+        )
+        try:
+            acquired = await lock.acquire()
+        except redis.RedisError as e:
+            exc = CacheOperationError(operation="lock", message=str(e))
+            logger.error(f"Cache lock failed: {exc.message}")
+            lock, acquired = None, True
+
+        if not acquired:
+            lock = None
+            if not wait_for_leader:
+                return None
+            entry = await _wait_for_entry(redis_client, cache_key)
+            if entry is not None:
+                _local_cache.set(cache_key, entry.value, min(ttl, settings.l1_cache_ttl))
+                return entry.value
+            # The other worker is taking too long - compute it here as well
+
+    try:
+        result = await compute()
+    except BaseException:
+        if lock is not None:
+            await _release_lock(lock)
+        raise
+
+    _local_cache.set(cache_key, result, min(ttl, settings.l1_cache_ttl))
+    if redis_client:
+        # Released by the write, once the value is there for the waiting workers
+        _schedule_cache_write(
+            redis_client,
+            cache_key,
+            CacheEntry(value=result, fresh_until=time.time() + ttl),
+            ttl + stale_ttl,
+            serializer=_pack_entry,
+            lock=lock,
+        )
+    elif lock is not None:
+        await _release_lock(lock)
+    return result
+
+
+@asynccontextmanager
+async def _own_session(kwargs: Dict[str, Any]):
+    """Swap the request's db session for a new one.
+
+    Background refreshes and shared miss computations outlive the request,
+    whose session is closed once the response is sent or the client goes away.
+    """
+    # Imported here - the database module is only needed for computing misses
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.orm import Session
+    from fao.src.db.database import get_async_session_factory, get_session_factory
+
+    db = kwargs.get("db")
+    if isinstance(db, AsyncSession):
+        async with get_async_session_factory()() as own_db:
+            yield {**kwargs, "db": own_db}
+    elif isinstance(db, Session):
+        with get_session_factory()() as own_db:
+            yield {**kwargs, "db": own_db}
+    else:
+        yield kwargs
+
+
+def _schedule_refresh(cache_key: str, refresh: Callable[[], Awaitable[Any]]) -> None:
+    """Start a background refresh of a stale key unless one is already running here"""
+    # Own key - a refresh may return None, which a miss waiting on it must not get
+    refresh_key = f"{cache_key}{settings.cache_key_separator}refresh"
+    if refresh_key in _inflight:
+        return
+
+    async def run_refresh():
+        try:
+            return await refresh()
+        except Exception as e:
+            exc = CacheOperationError(operation="refresh", message=str(e))
+            logger.error(f"Stale cache refresh failed for {cache_key}: {exc.message}")
+
+    _single_flight(refresh_key, run_refresh)
+
+
 def generate_cache_key(prefix: str, *, params: dict, exclude_params: List[str] | None = None) -> str:
     """
     Generate consistent cache key from endpoint and parameters
@@ -89,12 +531,9 @@ def generate_cache_key(prefix: str, *, params: dict, exclude_params: List[str] |
     Returns:
         Cache key string
     """
-    if exclude_params is None:
-        exclude_params = []
-
-    # Always exclude these from cache key
+    # Always exclude these from cache key (copied so the caller's list isn't extended on every call)
     default_excludes = ["db", "response", "request"]
-    exclude_params.extend(default_excludes)
+    exclude_params = [*(exclude_params or []), *default_excludes]
 
     # Filter and sort parameters for consistency
     cache_params = {}
@@ -120,151 +559,193 @@ def generate_cache_key(prefix: str, *, params: dict, exclude_params: List[str] |
         return f"{settings.cache_prefix}{settings.cache_key_separator}{prefix}{settings.cache_key_separator}default"
 
 
-def cache_result(prefix: str, *, ttl: int = 3600, exclude_params: List[str] | None = None):
+def cache_result(
+    prefix: str, *, ttl: int = 3600, exclude_params: List[str] | None = None, stale_ttl: int | None = None
+):
     """Decorator to cache endpoint results in Redis.
 
     Caches function results based on input parameters with automatic
     fallback if Redis is unavailable.
 
+    The result is cached rendered - the JSON body, gzipped above
+    cache_compress_min_size, plus headers - and every call returns a
+    Response built from it. Gzipped bodies are sent as-is to clients that
+    accept gzip. The wrapper adds a Request parameter to the endpoint's
+    signature for this if the endpoint doesn't take one.
+
+    Misses are single-flight: concurrent requests for a key share one
+    computation in this process, and with cache_lock_enabled one worker
+    computes while the others wait for its result. For stale_ttl seconds
+    after ttl an expired value is still served while a background refresh
+    recomputes it.
+
     Args:
         prefix: Cache key prefix (typically the endpoint/dataset name)
         ttl: Time to live in seconds (default 1 hour)
         exclude_params: Parameters to exclude from cache key
+        stale_ttl: How long past ttl a stale value may be served (default settings.cache_stale_ttl)
 
     Returns:
-        Decorated function that caches results
+        Decorated endpoint that caches results
 
     Example:
-        >>> @cache_result(prefix="prices", ttl=86400)
-        >>> def get_prices(**kwargs):
+        >>> @router.get("/years")
+        >>> @cache_result(prefix="prices:years", ttl=86400)
+        >>> def get_prices_years(db: Session = Depends(get_db)):
         >>>     return expensive_database_query()
     """
 
     def decorator(func):
-        @wraps(func)
-        async def async_wrapper(*args, **kwargs):
-            # Get Redis client
-            redis_client = get_redis_client()
-            if not redis_client:
-                # Redis not available, execute without caching
-                return await func(*args, **kwargs)
+        is_coroutine = asyncio.iscoroutinefunction(func)
 
-            cache_key = None
-            try:
-                # Generate cache key
-                cache_key = generate_cache_key(prefix, params=kwargs, exclude_params=exclude_params)
-
-                # Try to get from cache
-                cached_data = redis_client.get(cache_key)
-                if cached_data:
-                    # Ensure cached_data is bytes
-                    if isinstance(cached_data, bytes):
-                        try:
-                            return pickle.loads(cached_data)
-                        except (pickle.PickleError, Exception) as e:
-                            exc = cache_deserialization_failed(error=e)
-                            logger.error(f"Cache deserialization failed: {exc.message} - {exc.detail}")
-                            # Continue to fetch fresh data
-
-                # Not in cache, execute function
-                result = await func(*args, **kwargs)
-
-                # Cache the result
-                try:
-                    pickled_data = pickle.dumps(result)
-                    redis_client.setex(cache_key, ttl, pickled_data)
-                except (pickle.PickleError, Exception) as e:
-                    exc = cache_serialization_failed(type(result), error=e)
-                    logger.error(f"Cache serialization failed: {exc.message} - {exc.detail}")
-                    # Still return the result, just don't cache it
-
-                return result
-
-            except redis.RedisError as e:
-                # Log error but don't fail the request
-                if cache_key and "get" in str(e).lower():
-                    exc = cache_read_failed(cache_key, error=e)
-                elif cache_key:
-                    exc = cache_write_failed(cache_key, error=e)
-                else:
-                    exc = CacheOperationError(operation="unknown", message=str(e))
-                logger.error(f"Cache operation failed: {exc.message} - {exc.detail}")
+        # Find the endpoint's Request parameter, or add one for FastAPI to fill
+        signature = inspect.signature(func)
+        request_param = next(
+            (name for name, param in signature.parameters.items() if param.annotation is Request), None
+        )
+        inject_request = request_param is None
+        if inject_request:
+            request_param = "cache_request"
+            parameters = list(signature.parameters.values())
+            position = next(
+                (i for i, param in enumerate(parameters) if param.kind is inspect.Parameter.VAR_KEYWORD),
+                len(parameters),
+            )
+            parameters.insert(
+                position, inspect.Parameter(request_param, inspect.Parameter.KEYWORD_ONLY, annotation=Request)
+            )
+            signature = signature.replace(parameters=parameters)
+        key_excludes = [*(exclude_params or []), request_param]
+
+        async def call(*args, **kwargs):
+            if is_coroutine:
                 return await func(*args, **kwargs)
+            # Sync endpoints do blocking DB work - keep it in the bounded worker pool
+            return await run_in_threadpool(func, *args, **kwargs)
+
+        async def render(*args, **kwargs) -> CachedResponse:
+            result = await call(*args, **kwargs)
+            # Encoding a large payload is CPU work too
+            return await run_in_threadpool(CachedResponse.from_content, result)
 
         @wraps(func)
-        def sync_wrapper(*args, **kwargs):
-            # Get Redis client
-            redis_client = get_redis_client()
-            if not redis_client:
-                # Redis not available, execute without caching
-                return func(*args, **kwargs)
-
-            cache_key = None
-            try:
-                # Generate cache key
-                cache_key = generate_cache_key(prefix, params=kwargs, exclude_params=exclude_params)
-
-                # Try to get from cache
-                cached_data = redis_client.get(cache_key)
-                if cached_data:
-                    # Ensure cached_data is bytes
-                    if isinstance(cached_data, bytes):
-                        try:
-                            return pickle.loads(cached_data)
-                        except (pickle.PickleError, Exception) as e:
-                            exc = cache_deserialization_failed(error=e)
-                            logger.error(f"Cache deserialization failed: {exc.message} - {exc.detail}")
-                            # Continue to fetch fresh data
-
-                # Not in cache, execute function
-                result = func(*args, **kwargs)
-
-                # Cache the result
-                try:
-                    pickled_data = pickle.dumps(result)
-                    redis_client.setex(cache_key, ttl, pickled_data)
-                except (pickle.PickleError, Exception) as e:
-                    exc = cache_serialization_failed(type(result), error=e)
-                    logger.error(f"Cache serialization failed: {exc.message} - {exc.detail}")
-                    # Still return the result, just don't cache it
-
-                return result
-
-            except redis.RedisError as e:
-                # Log error but don't fail the request
-                if cache_key and "get" in str(e).lower():
-                    exc = cache_read_failed(cache_key, error=e)
-                elif cache_key:
-                    exc = cache_write_failed(cache_key, error=e)
-                else:
-                    exc = CacheOperationError(operation="unknown", message=str(e))
-                logger.error(f"Cache operation failed: {exc.message} - {exc.detail}")
-                return func(*args, **kwargs)
-
-        # Return appropriate wrapper based on function type
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper
-        else:
-            return sync_wrapper
+        async def wrapper(*args, **kwargs):
+            request = kwargs.pop(request_param, None) if inject_request else kwargs.get(request_param)
+
+            if not getattr(settings, "cache_enabled", True):
+                return await call(*args, **kwargs)
+
+            # Generate cache key
+            cache_key = generate_cache_key(prefix, params=kwargs, exclude_params=key_excludes)
+            serve_stale_for = settings.cache_stale_ttl if stale_ttl is None else stale_ttl
+
+            # Try this process first
+            found, cached_value = _local_cache.get(cache_key)
+            if found:
+                return cached_value.to_response(request, "HIT")
+
+            # Then Redis - if it's not available, execute without the shared cache
+            redis_client = get_async_redis_client()
+            entry = await _read_entry(redis_client, cache_key) if redis_client else None
+
+            if entry is not None and entry.is_fresh:
+                # L1 entries only live briefly - invalidation across workers is best effort
+                local_ttl = min(ttl, settings.l1_cache_ttl, entry.fresh_until - time.time())
+                _local_cache.set(cache_key, entry.value, local_ttl)
+                return entry.value.to_response(request, "HIT")
+
+            if entry is not None:
+                # Stale: answer with it now and recompute in the background
+                async def refresh():
+                    async with _own_session(kwargs) as refresh_kwargs:
+                        return await _compute_and_store(
+                            redis_client,
+                            cache_key,
+                            lambda: render(*args, **refresh_kwargs),
+                            ttl,
+                            serve_stale_for,
+                            wait_for_leader=False,
+                        )
+
+                _schedule_refresh(cache_key, refresh)
+                return entry.value.to_response(request, "STALE")
+
+            # Not in cache, execute function (once for all concurrent requests). The shared
+            # computation outlives whichever request started it, so it gets its own session too
+            async def compute():
+                async with _own_session(kwargs) as own_kwargs:
+                    return await _compute_and_store(
+                        redis_client,
+                        cache_key,
+                        lambda: render(*args, **own_kwargs),
+                        ttl,
+                        serve_stale_for,
+                        wait_for_leader=True,
+                    )
+
+            task = _single_flight(cache_key, compute)
+            rendered = await asyncio.shield(task)
+            return rendered.to_response(request, "MISS")
+
+        # Sync functions are wrapped too - FastAPI awaits the wrapper and the
+        # function itself still runs in a worker thread
+        wrapper.__signature__ = signature  # type: ignore[attr-defined]
+        return wrapper
 
     return decorator
 
 
+async def get_cached_count_async(cache_key: str) -> int | None:
+    """
+    Get a cached row count without blocking the event loop
+
+    Returns None on a miss or if Redis is unavailable
+    """
+    redis_client = get_async_redis_client()
+    if not redis_client:
+        return None
+
+    try:
+        cached_count = await redis_client.get(cache_key)
+        return int(cached_count) if cached_count is not None else None
+    except (redis.ConnectionError, redis.TimeoutError) as e:
+        _mark_async_redis_unavailable(e)
+    except redis.RedisError as e:
+        exc = cache_read_failed(cache_key, error=e)
+        logger.error(f"Cache operation failed: {exc.message} - {exc.detail}")
+    return None
+
+
+def set_cached_count_async(cache_key: str, count: int, ttl: int) -> None:
+    """Cache a row count in the background, ignoring failures"""
+    redis_client = get_async_redis_client()
+    if redis_client:
+        _schedule_cache_write(redis_client, cache_key, count, ttl, serializer=lambda value: str(value).encode())
+
+
 def invalidate_cache(pattern: str = "*") -> int:
     """
     Invalidate cache entries matching pattern
 
+    Clears this process's L1 directly and publishes the pattern so the other
+    workers' listeners clear theirs.
+
     Args:
         pattern: Redis key pattern (e.g., "fao:prices:*" to clear all prices cache)
 
     Returns:
         Number of keys deleted
     """
+    full_pattern = f"{settings.cache_prefix}{settings.cache_key_separator}{pattern}"
+    local_deleted = _local_cache.delete_pattern(full_pattern)
+
     redis_client = get_redis_client()
     if not redis_client:
-        return 0
+        return local_deleted
 
     try:
+        redis_client.publish(_invalidation_channel(), full_pattern)
+
         deleted_count = 0
         cursor: Union[int, bytes] = 0
 
@@ -290,11 +771,44 @@ def invalidate_cache(pattern: str = "*") -> int:
         return 0
 
 
+async def run_invalidation_listener() -> None:
+    """Drop L1 entries whenever any worker calls invalidate_cache.
+
+    Runs for the app's lifetime (started from the lifespan) and resubscribes
+    after Redis errors.
+    """
+    while True:
+        redis_client = get_async_redis_client()
+        if not redis_client:
+            await asyncio.sleep(settings.redis_retry_interval)
+            continue
+
+        try:
+            async with redis_client.pubsub() as pubsub:
+                await pubsub.subscribe(_invalidation_channel())
+                while True:
+                    # Poll with a timeout - a blocking read would trip the pool's socket timeout
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message and message["type"] == "message":
+                        _local_cache.delete_pattern(message["data"].decode())
+        except (redis.ConnectionError, redis.TimeoutError) as e:
+            _mark_async_redis_unavailable(e)
+        except redis.RedisError as e:
+            exc = CacheOperationError(operation="subscribe", message=str(e))
+            logger.error(f"Cache invalidation listener failed: {exc.message}")
+            await asyncio.sleep(settings.redis_retry_interval)
+
+
 def get_cache_info() -> Dict[str, Any]:
-    """Get basic cache information and statistics"""
+    """Get basic cache information and statistics, including hit/miss counters per tier"""
+    tiers = {
+        "l1": {"entries": len(_local_cache), "max_entries": _local_cache.max_entries, **_local_cache.stats.as_dict()},
+        "l2": _redis_stats.as_dict(),
+    }
+
     redis_client = get_redis_client()
     if not redis_client:
-        return {"status": "disabled", "reason": "Redis not available"}
+        return {"status": "disabled", "reason": "Redis not available", "tiers": tiers}
 
     try:
         info: Dict[str, Any] = redis_client.info()  # type: ignore
@@ -320,9 +834,10 @@ def get_cache_info() -> Dict[str, Any]:
             "memory_used": info.get("used_memory_human", "unknown"),
             "connected_clients": info.get("connected_clients", 0),
             "redis_version": info.get("redis_version", "unknown"),
+            "tiers": tiers,
         }
 
     except redis.RedisError as e:
         exc = CacheOperationError(operation="info", message=str(e))
         logger.error(f"Error getting cache info: {exc.message}")
-        return {"status": "error", "error": str(exc.message)}
+        return {"status": "error", "error": str(exc.message), "tiers": tiers}
@@ -39,7 +39,7 @@ class QueryStringFlatteningMiddleware:
         self.app = app
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
-        query_string = scope.get("query_string", None).decode()
+        query_string = scope.get("query_string", b"").decode()
         if scope["type"] == "http" and query_string:
             parsed = parse_query_string(query_string)
             flattened = {}
@@ -0,0 +1,103 @@
+# fao/src/core/responses.py
+"""
+orjson-backed JSON responses with per-endpoint serialization timing
+
+FastJSONResponse is the app's default response class. Endpoints that return it
+directly (build_response, cache_result) also skip FastAPI's jsonable_encoder
+pass, so floats, ints, datetimes and dicts are serialized natively by orjson.
+"""
+import threading
+import time
+from contextvars import ContextVar
+from decimal import Decimal
+from typing import Any, Dict, List
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Serialization time (ms) of the current request, set up by SerializationTimingMiddleware
+_request_timing: ContextVar[List[float] | None] = ContextVar("serialization_timing", default=None)
+
+_stats_lock = threading.Lock()
+_serialization_stats: Dict[str, Dict[str, float]] = {}
+
+
+def _default(obj: Any) -> Any:
+    """Types orjson doesn't handle natively"""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    # Pydantic models, sets, enums, ...
+    return jsonable_encoder(obj)
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize content to JSON bytes, timing it for the current request"""
+    start = time.perf_counter()
+    body = orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    timing = _request_timing.get()
+    if timing is not None:
+        timing.append((time.perf_counter() - start) * 1000)
+    return body
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def record_serialization_time(route: str, duration_ms: float) -> None:
+    with _stats_lock:
+        stats = _serialization_stats.setdefault(route, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+        stats["count"] += 1
+        stats["total_ms"] += duration_ms
+        stats["max_ms"] = max(stats["max_ms"], duration_ms)
+
+
+def get_serialization_stats() -> Dict[str, Dict[str, float]]:
+    """Serialization time per endpoint (this worker only), slowest average first"""
+    with _stats_lock:
+        stats = {
+            route: {
+                "count": int(values["count"]),
+                "avg_ms": round(values["total_ms"] / values["count"], 3),
+                "max_ms": round(values["max_ms"], 3),
+                "total_ms": round(values["total_ms"], 3),
+            }
+            for route, values in _serialization_stats.items()
+        }
+    return dict(sorted(stats.items(), key=lambda item: item[1]["avg_ms"], reverse=True))
+
+
+class SerializationTimingMiddleware:
+    """Reports JSON serialization time in a Server-Timing header and collects it per route"""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timing: List[float] = []
+        token = _request_timing.set(timing)
+
+        async def send_with_timing(message: Message) -> None:
+            # The body is rendered before the response starts, so the time is known here
+            if message["type"] == "http.response.start" and timing:
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", f"serialize;dur={sum(timing):.2f}".encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _request_timing.reset(token)
+            route = scope.get("route")
+            if timing and route is not None:
+                record_serialization_time(f"{scope['method']} {route.path}", sum(timing))
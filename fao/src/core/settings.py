@@ -36,16 +36,33 @@ class Settings(BaseSettings):
     db_host: str = os.getenv("DB_HOST", "localhost")
     db_port: str = os.getenv("DB_PORT", "5432")
     db_name: str = os.getenv("DB_NAME", "fao")
+    async_pool_size: int = 10
+    async_max_overflow: int = 20
+
+    # Worker threads for sync endpoints and blocking calls made from async handlers
+    threadpool_size: int = 40
 
     # Cache Configuration
     cache_enabled: bool = os.getenv("CACHE_ENABLED", "true").lower() in ("true", "1", "yes")
     redis_host: str = os.getenv("REDIS_HOST") or "localhost"
     redis_port: int = int(os.getenv("REDIS_PORT") or 6379)
     redis_password: str = os.getenv("REDIS_PASSWORD") or "password"
+    redis_max_connections: int = 50
+    redis_socket_timeout: float = 1.0
+    redis_retry_interval: int = 30
     default_cache_ttl: int = 3600
+    l1_cache_max_entries: int = 1024
+    l1_cache_ttl: int = 300
+    cache_stale_ttl: int = 3600
+    cache_compress_min_size: int = 1024
+    cache_compress_level: int = 6
+    cache_lock_enabled: bool = True
+    cache_lock_timeout: int = 60
+    cache_lock_wait: float = 10.0
     cache_prefix: str = "fao"
     cache_key_separator: str = ":"
     max_scan_count: int = 100
+    count_cache_ttl: int = 900
 
     # CORS
     cors_origins: List[str] = ["http://localhost:3000", "https://app.mickeymalotte.com"]
@@ -55,6 +72,18 @@ class Settings(BaseSettings):
     max_limit: int = 1000
     default_offset: int = 0
 
+    # Rows fetched per server-side cursor round trip when streaming /export
+    export_batch_size: int = 5000
+
+    # Pipelines run_all_pipelines runs at once, each in its own process
+    etl_max_workers: int = 4
+    # Apply only the changed rows when a loaded dataset's CSV changes (False: truncate and reload it)
+    etl_incremental: bool = True
+
+    # Directory the API writes its "filter usage:" lines to, for the index advisor. Set it in
+    # production - the app_*.log files that also carry them are only written in development
+    filter_usage_log_dir: str | None = None
+
     # Documentation URLs
     docs_url: str | None = None
     redoc_url: str | None = None
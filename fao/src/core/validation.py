@@ -1,3 +1,5 @@
+import threading
+from collections import defaultdict
 from typing import Set, Optional, Dict, Any, Type, TYPE_CHECKING, List
 from sqlalchemy.orm import Session
 from sqlalchemy import select, distinct
@@ -70,6 +72,46 @@ def _get_valid_codes_generic(db: Session, model_class: Type[Any], code_column_na
     return valid_codes
 
 
+class LookupResolver:
+    """Lookup code -> the reference rows' ids, so a code filter is an IN on the fact table's foreign key
+
+    A reference table has a row per code and source dataset, and a fact
+    table's foreign key points at whichever of them its ETL produced - so a
+    code stands for every id its rows have. Filtering on all of them matches
+    exactly the rows a join on the code would. The code -> ids map of each
+    reference table is read in one query and cached like the valid codes.
+    """
+
+    def __init__(self, ttl_seconds: int = 3600):
+        self._cache = ValidationCache(ttl_seconds=ttl_seconds)
+        self._lock = threading.Lock()
+
+    def get_id_map(self, db: Session, model_class: Type[Any], code_column: str) -> Dict[str, List[int]]:
+        """Code -> ids of every row of a reference table"""
+        cache_key = f"{model_class.__tablename__}:{code_column}"
+        with self._lock:
+            id_map = self._cache.get(cache_key)
+        if id_map is not None:
+            return id_map
+
+        id_map = defaultdict(list)
+        for code, row_id in db.execute(select(getattr(model_class, code_column), model_class.id)):
+            id_map[str(code)].append(row_id)
+        id_map = dict(id_map)
+
+        with self._lock:
+            self._cache.set(cache_key, id_map)
+        return id_map
+
+    def resolve(self, db: Session, model_class: Type[Any], code_column: str, codes: List[str]) -> List[int]:
+        """Ids of the reference rows with any of `codes` - unknown codes have no rows to match"""
+        id_map = self.get_id_map(db, model_class, code_column)
+        return [row_id for code in codes for row_id in id_map.get(str(code), ())]
+
+
+# Global resolver instance
+lookup_resolver = LookupResolver(ttl_seconds=3600)
+
 
 def get_valid_area_code(db: Session) -> Set[str]:
     """Get valid area codes with caching"""
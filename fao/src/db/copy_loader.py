@@ -0,0 +1,119 @@
+# fao/src/db/copy_loader.py
+"""
+COPY-based bulk loading for dataset tables
+
+A chunk of cleaned rows is streamed column-wise as CSV through
+`COPY ... FROM STDIN` into an unlogged staging table with the same columns,
+then merged into the target with one `INSERT ... SELECT ... ON CONFLICT DO
+NOTHING`. COPY skips per-row statement parsing and parameter binding, and the
+unlogged staging table skips the WAL, so a chunk costs two statements instead
+of one VALUES tuple per row.
+
+    staging = create_staging_table(session, table, list(frame.columns))
+    copy_frame(session, staging, frame)
+    inserted = merge_staging(session, staging, table)
+    drop_staging_table(session, staging)
+
+A whole file can be staged chunk by chunk (truncate=False) and merged once
+with distinct=True, which drops its duplicate rows in Postgres - on disk if
+need be - rather than in memory.
+"""
+import io
+from typing import List, Optional
+
+import pandas as pd
+from sqlalchemy import Column, ColumnElement, Float, Integer, MetaData, Table, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+# COPY's NULL marker - unlike the CSV default (an unquoted empty field) it keeps empty strings as ''
+NULL_MARKER = r"\N"
+
+
+def copy_frame_for(table: Table, columns: pd.DataFrame) -> pd.DataFrame:
+    """`columns` (named after table columns) with values COPY parses the way the VALUES inserts did"""
+    frame = {}
+    for name, series in columns.items():
+        column_type = table.c[name].type
+        if isinstance(column_type, Integer) and pd.api.types.is_float_dtype(series):
+            # Hashed ids come out of apply() as floats when any row has none
+            series = series.astype("Int64")
+        elif isinstance(column_type, Float) and pd.api.types.is_float_dtype(series):
+            # psycopg2 sent a missing float as 'NaN', not NULL
+            series = series.astype(object).where(series.notna(), "NaN")
+        frame[name] = series
+    return pd.DataFrame(frame)
+
+
+def staging_table_name(table_name: str) -> str:
+    return f"{table_name[:55]}_staging"
+
+
+def create_staging_table(session: Session, table: Table, columns: List[str], keep_rows: bool = False) -> Table:
+    """Unlogged table with `columns` of `table` and no constraints, recreated empty
+    (with keep_rows, an existing one is kept as it is)"""
+    staging = Table(
+        staging_table_name(table.name),
+        MetaData(),
+        *[Column(name, table.c[name].type) for name in columns],
+        prefixes=["UNLOGGED"],
+    )
+    connection = session.connection()
+    if not keep_rows:
+        staging.drop(connection, checkfirst=True)
+    staging.create(connection, checkfirst=True)
+    return staging
+
+
+def staging_table_exists(session: Session, table: Table) -> bool:
+    return session.execute(
+        text("SELECT to_regclass(:name) IS NOT NULL"), {"name": staging_table_name(table.name)}
+    ).scalar()
+
+
+def drop_staging_table(session: Session, staging: Table) -> None:
+    staging.drop(session.connection(), checkfirst=True)
+
+
+def copy_frame(session: Session, staging: Table, frame: pd.DataFrame, truncate: bool = True) -> None:
+    """Replace (or with truncate=False, add to) the staging table's rows with `frame`, streamed through
+    COPY FROM STDIN as CSV"""
+    buffer = io.StringIO()
+    frame.to_csv(buffer, header=False, index=False, na_rep=NULL_MARKER)
+    buffer.seek(0)
+
+    if truncate:
+        session.execute(text(f"TRUNCATE {staging.name}"))
+    column_list = ", ".join(f'"{name}"' for name in frame.columns)
+    cursor = session.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {staging.name} ({column_list}) FROM STDIN WITH (FORMAT csv, NULL '{NULL_MARKER}')", buffer
+        )
+    finally:
+        cursor.close()
+
+
+def merge_staging(
+    session: Session, staging: Table, table: Table, where: Optional[ColumnElement] = None, distinct: bool = False
+) -> int:
+    """INSERT the staged rows (those matching `where`, each distinct row once with `distinct`) into `table`,
+    skipping conflicts. Returns the number inserted.
+
+    Columns the ETL doesn't supply but that have a SQL default on the model
+    (created_at/updated_at = now()) get it here, as the VALUES inserts did.
+    """
+    names = [column.name for column in staging.columns]
+    values = [staging.c[name] for name in names]
+    for column in table.columns:
+        if column.name not in names and column.default is not None and column.default.is_clause_element:
+            names.append(column.name)
+            values.append(column.default.arg.label(column.name))
+
+    query = select(*values)
+    if where is not None:
+        query = query.where(where)
+    if distinct:
+        query = query.distinct()
+    stmt = pg_insert(table).from_select(names, query).on_conflict_do_nothing()
+    return session.execute(stmt).rowcount
@@ -2,6 +2,7 @@
 from functools import lru_cache
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 
 from fao.src.core import settings
 from fao.logger import logger
@@ -14,6 +15,7 @@ DB_PORT = settings.db_port
 DB_NAME = settings.db_name
 
 DATABASE_URL = f"postgresql+psycopg2://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+ASYNC_DATABASE_URL = f"postgresql+asyncpg://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
 # Base can be created immediately
 Base = declarative_base()
@@ -42,6 +44,32 @@ def get_db():
         db.close()
 
 
+@lru_cache
+def get_async_engine():
+    """Create async (asyncpg) engine only when needed"""
+    logger.success(f"Async DB connection: postgresql+asyncpg://{DB_USER}:[password]@{DB_HOST}:{DB_PORT}/{DB_NAME}")
+    return create_async_engine(
+        ASYNC_DATABASE_URL,
+        echo=False,
+        pool_size=settings.async_pool_size,
+        max_overflow=settings.async_max_overflow,
+        pool_pre_ping=True,
+    )
+
+
+@lru_cache
+def get_async_session_factory():
+    """Create async session factory only when needed"""
+    return async_sessionmaker(bind=get_async_engine(), autoflush=False, expire_on_commit=False)
+
+
+async def get_async_db():
+    """Dependency to get an async DB session"""
+    AsyncSessionLocal = get_async_session_factory()
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 def run_with_session(fn):
     db = next(get_db())
     try:
@@ -0,0 +1,88 @@
+# fao/src/db/delta_loader.py
+"""
+Row-level delta loads for dataset tables whose CSV changed
+
+The new CSV is COPYed whole into the staging table (see copy_loader.py), then
+compared with the table on the dataset's natural key - every mapped column
+except the measured ones, e.g. (area_code_id, item_code_id, element_code_id,
+year_code, year, unit). In one transaction:
+
+    rows whose key is gone from the CSV    DELETE
+    rows whose value/flag/note changed     UPDATE
+    keys new to the CSV                    INSERT
+
+so unchanged rows - nearly all of them, between FAO releases - are never
+rewritten. Keys are compared as ROW(...)::text, which matches NULLs to NULLs
+and lets Postgres hash join the two tables on a single expression. A staged
+row whose key an earlier row already has is dropped first (and counted) -
+the table can only hold one row per key for the UPDATE to match.
+
+    staging = create_staging_table(session, table, list(frame.columns))
+    copy_frame(session, staging, frame, truncate=False)  # per chunk
+    delta = apply_delta(session, staging, table, key_columns)
+"""
+from dataclasses import dataclass
+from typing import List
+
+from sqlalchemy import Table, Text, cast, delete, exists, func, literal_column, select, text, tuple_, update
+from sqlalchemy.orm import Session
+
+from fao.src.db.copy_loader import merge_staging
+
+
+@dataclass
+class TableDelta:
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+    # Staged rows dropped for repeating an earlier row's key
+    duplicates: int = 0
+
+    @property
+    def changed(self) -> int:
+        return self.inserted + self.updated + self.deleted
+
+    def __str__(self) -> str:
+        return f"{self.inserted:,} inserted, {self.updated:,} updated, {self.deleted:,} deleted"
+
+
+def row_key(table: Table, key_columns: List[str]):
+    return cast(func.row(*[table.c[name] for name in key_columns]), Text)
+
+
+def apply_delta(session: Session, staging: Table, table: Table, key_columns: List[str]) -> TableDelta:
+    """Make `table` hold the staged rows, touching only the rows that differ. Doesn't commit."""
+    value_columns = [column.name for column in staging.columns if column.name not in key_columns]
+    table_key, staging_key = row_key(table, key_columns), row_key(staging, key_columns)
+
+    # Keep the first staged row (COPY order, so CSV order) of each key
+    ctid = literal_column("ctid")
+    numbered = select(
+        ctid.label("row_ctid"),
+        func.row_number().over(partition_by=[staging.c[name] for name in key_columns], order_by=ctid).label("n"),
+    ).subquery()
+    duplicates = session.execute(
+        delete(staging).where(ctid.in_(select(numbered.c.row_ctid).where(numbered.c.n > 1)))
+    ).rowcount
+
+    # The staging table was just filled - without statistics the planner guesses it is tiny
+    session.execute(text(f"ANALYZE {staging.name}"))
+
+    deleted = session.execute(delete(table).where(~exists().where(staging_key == table_key))).rowcount
+
+    updated = 0
+    if value_columns:
+        stmt = (
+            update(table)
+            .where(table_key == staging_key)
+            .where(
+                tuple_(*[table.c[name] for name in value_columns]).is_distinct_from(
+                    tuple_(*[staging.c[name] for name in value_columns])
+                )
+            )
+            .values({name: staging.c[name] for name in value_columns})
+        )
+        updated = session.execute(stmt).rowcount
+
+    inserted = merge_staging(session, staging, table, where=~exists(select(1).where(table_key == staging_key)))
+    return TableDelta(inserted=inserted, updated=updated, deleted=deleted, duplicates=duplicates)
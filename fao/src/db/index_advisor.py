@@ -0,0 +1,364 @@
+# fao/src/db/index_advisor.py
+"""
+Composite index advisor for the dataset tables
+
+The generated models index each foreign key and `year` on its own, so a request
+filtering on area, item, element and a year range can use only one of them and
+checks the rest row by row. This proposes (and optionally creates) composite
+indexes for the filter combinations the API actually serves:
+
+- columns come from each router config: code and name filters on lookups map to
+  the foreign key, code/exact filters to their column, range filters go last
+- combinations come from the "filter usage:" lines RouterHandler logs per
+  request, rotated .zip files included: the filter_usage_*.log files the API
+  writes to FILTER_USAGE_LOG_DIR, or failing those the development DEBUG log
+  (logs/app_*.log). The deployed API writes no app_*.log, so without
+  FILTER_USAGE_LOG_DIR set there (and its files copied to --logs) a dataset
+  gets the config-only proposal: one index over its lookup code filters plus
+  the range column, leaving out lookups with only a handful of values (flags)
+- equality columns are ordered by how often they're filtered on, then by
+  selectivity, and an index that is a prefix of another proposal is folded into it
+- the measure column (value) is added as INCLUDE, so aggregates over the
+  filtered rows can be answered from the index alone
+
+Size and speedup are estimates from planner statistics - ANALYZE the tables
+first. Size comes from the row count and column widths; speedup is the rows
+read through the best existing index divided by the rows read through the
+proposed one. Columns without statistics use the planner's defaults (0.005 per
+equality, 1/3 per range).
+
+    python -m fao.src.db.index_advisor --logs logs
+    python -m fao.src.db.index_advisor --dataset prices --sql prices_indexes.sql
+    python -m fao.src.db.index_advisor --create
+"""
+import argparse
+import hashlib
+import io
+import math
+import re
+import zipfile
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.engine import Connection
+
+from fao.logger import logger
+from fao.src.api.utils.config_registry import load_router_configs
+from fao.src.api.utils.router_handler import FILTER_USAGE_TAG
+from fao.src.db.database import DATABASE_URL
+
+# Planner defaults for columns without statistics (selfuncs.h)
+DEFAULT_EQ_SEL = 0.005
+DEFAULT_INEQ_SEL = 1 / 3
+# Lookups with fewer distinct values than this are left out of the config-only proposal
+MIN_DISTINCT = 10
+# Columns added as INCLUDE when the table has them
+MEASURE_COLUMNS = ("value",)
+# Btree leaf pages are filled to 90% on creation
+INDEX_FILL = 0.9
+
+
+@dataclass
+class FilterColumns:
+    """Where a dataset's filter parameters land on its table"""
+
+    equality: Dict[str, str] = field(default_factory=dict)  # param name -> column
+    range: Dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_config(cls, config) -> "FilterColumns":
+        columns = cls()
+        for filter_config in config.filter_configs:
+            if filter_config.get("joins_table"):
+                columns.equality[filter_config["name"]] = filter_config["join_condition"].key
+            elif filter_config["filter_type"] in ("multi", "exact"):
+                columns.equality[filter_config["name"]] = filter_config["filter_column"]
+            elif filter_config["filter_type"] in ("range_min", "range_max"):
+                columns.range[filter_config["name"]] = filter_config["filter_column"]
+        for range_config in config.range_configs:
+            for suffix in ("_min", "_max"):
+                columns.range[range_config["param_name"] + suffix] = range_config["filter_column"]
+        return columns
+
+    def columns_for(self, params) -> Tuple[List[str], List[str]]:
+        """(equality columns, range columns) a set of filter params touches"""
+        equality = list(dict.fromkeys(self.equality[p] for p in params if p in self.equality))
+        ranges = list(dict.fromkeys(self.range[p] for p in params if p in self.range and self.range[p] not in equality))
+        return equality, ranges
+
+
+@dataclass
+class TableStats:
+    rows: float
+    n_distinct: Dict[str, float]
+    avg_width: Dict[str, int]
+    columns: List[str]
+    indexes: List[List[str]]
+    total_bytes: int
+
+    def selectivity(self, column: str, is_range: bool = False) -> float:
+        if is_range:
+            return DEFAULT_INEQ_SEL
+        distinct = self.distinct(column)
+        return 1 / max(distinct, 1) if distinct else DEFAULT_EQ_SEL
+
+    def distinct(self, column: str) -> Optional[float]:
+        # pg_stats n_distinct: negative values are a fraction of the row count
+        n_distinct = self.n_distinct.get(column)
+        if not n_distinct:
+            return None
+        return -n_distinct * self.rows if n_distinct < 0 else n_distinct
+
+
+@dataclass
+class Proposal:
+    table: str
+    columns: Tuple[str, ...]
+    range_columns: Tuple[str, ...]
+    include: Tuple[str, ...]
+    requests: int
+    size_bytes: int = 0
+    rows_before: float = 0
+    rows_after: float = 0
+
+    @property
+    def name(self) -> str:
+        digest = hashlib.md5(",".join(self.columns + self.include).encode()).hexdigest()[:8]
+        return f"ix_{self.table[:40]}_{digest}_adv"
+
+    @property
+    def sql(self) -> str:
+        include = f" INCLUDE ({', '.join(self.include)})" if self.include else ""
+        return (
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {self.name} ON {self.table} ({', '.join(self.columns)}){include}"
+        )
+
+    @property
+    def speedup(self) -> float:
+        return self.rows_before / max(self.rows_after, 1)
+
+
+def _read_lines(path: Path) -> Iterator[str]:
+    if path.suffix == ".zip":
+        with zipfile.ZipFile(path) as archive:
+            for name in archive.namelist():
+                yield from io.TextIOWrapper(archive.open(name), encoding="utf-8", errors="replace")
+    else:
+        with path.open(encoding="utf-8", errors="replace") as file:
+            yield from file
+
+
+def read_filter_usage(log_dir: Path) -> Dict[str, Counter]:
+    """table -> Counter of filter param combinations, from the request logs"""
+    pattern = re.compile(rf"{re.escape(FILTER_USAGE_TAG)} (\w+) ([\w,]+)")
+    usage = defaultdict(Counter)
+    # Both carry the same lines when FILTER_USAGE_LOG_DIR is logs/ in development - read one
+    paths = sorted(log_dir.glob("filter_usage_*.log*")) or sorted(log_dir.glob("app_*.log*"))
+    for path in paths:
+        for line in _read_lines(path):
+            match = pattern.search(line)
+            if match:
+                usage[match.group(1)][tuple(match.group(2).split(","))] += 1
+    return usage
+
+
+def load_table_stats(conn: Connection, table: str) -> Optional[TableStats]:
+    size = conn.execute(
+        text("SELECT reltuples, pg_total_relation_size(oid) FROM pg_class WHERE oid = to_regclass(:table)"),
+        {"table": table},
+    ).first()
+    if size is None:
+        return None
+
+    rows, total_bytes = size
+    if rows < 0:
+        # Never analyzed - count it instead of guessing
+        logger.warning(f"{table} has no statistics, run ANALYZE {table} for better estimates")
+        rows = conn.execute(text(f"SELECT count(*) FROM {table}")).scalar()
+
+    stats = conn.execute(
+        text(
+            "SELECT attname, n_distinct, avg_width FROM pg_stats "
+            "WHERE schemaname = current_schema() AND tablename = :table"
+        ),
+        {"table": table},
+    ).all()
+    inspector = inspect(conn)
+    indexes = [[c for c in index["column_names"] if c] for index in inspector.get_indexes(table)]
+    indexes.append(inspector.get_pk_constraint(table)["constrained_columns"])
+    return TableStats(
+        rows=rows,
+        n_distinct={name: n_distinct for name, n_distinct, _ in stats},
+        avg_width={name: width for name, _, width in stats},
+        columns=[column["name"] for column in inspector.get_columns(table)],
+        indexes=[index for index in indexes if index],
+        total_bytes=total_bytes,
+    )
+
+
+def default_usage(config, columns: FilterColumns, stats: TableStats) -> Counter:
+    """The config's lookup code filters plus its first range, for datasets with no logged traffic"""
+    params = [
+        f["name"]
+        for f in config.filter_configs
+        if f.get("joins_table")
+        and f["filter_type"] == "multi"
+        and (stats.distinct(columns.equality[f["name"]]) or MIN_DISTINCT) >= MIN_DISTINCT
+    ]
+    params += list(columns.range)[:1]
+    return Counter({tuple(params): 0})
+
+
+def propose(
+    config, stats: TableStats, usage: Counter, min_share: float, max_indexes: int, covering: bool
+) -> List[Proposal]:
+    columns = FilterColumns.from_config(config)
+    if not usage:
+        usage = default_usage(config, columns, stats)
+
+    column_hits = Counter()
+    for params, requests in usage.items():
+        for column in sum(columns.columns_for(params), []):
+            column_hits[column] += requests
+
+    # Most filtered first (shared prefixes), then most selective
+    keys = Counter()
+    for params, requests in usage.items():
+        equality, ranges = columns.columns_for(params)
+        equality.sort(key=lambda c: (-column_hits[c], stats.selectivity(c)))
+        key = (tuple(equality), tuple(ranges[:1]))
+        if len(key[0]) + len(key[1]) >= 2:
+            keys[key] += requests
+
+    # An index also serves every filter set on a prefix of its columns
+    for key in sorted(keys, key=lambda k: len(k[0]) + len(k[1])):
+        full = key[0] + key[1]
+        longer = [other for other in keys if other != key and (other[0] + other[1])[: len(full)] == full]
+        if longer:
+            keys[max(longer, key=keys.get)] += keys.pop(key)
+
+    total = sum(usage.values())
+    include = tuple(c for c in MEASURE_COLUMNS if covering and c in stats.columns)
+    proposals = []
+    for (equality, ranges), requests in keys.most_common():
+        if total and requests / total < min_share:
+            continue
+        key = equality + ranges
+        if any(index[: len(key)] == list(key) for index in stats.indexes):
+            continue
+        proposal = Proposal(config.table_name, key, ranges, tuple(c for c in include if c not in key), requests)
+        estimate(proposal, stats)
+        proposals.append(proposal)
+    return proposals[:max_indexes]
+
+
+def estimate(proposal: Proposal, stats: TableStats) -> None:
+    """Fill in the proposal's size and the rows read before/after"""
+    key = proposal.columns
+
+    def selectivity(column: str) -> float:
+        return stats.selectivity(column, is_range=column in proposal.range_columns)
+
+    proposal.rows_after = stats.rows * math.prod(selectivity(c) for c in key)
+
+    # The best existing index can only use its leading columns that are in the key
+    best = 1.0
+    for index in stats.indexes:
+        matched = 1.0
+        for column in index:
+            if column not in key:
+                break
+            matched *= selectivity(column)
+        best = min(best, matched)
+    proposal.rows_before = stats.rows * best
+
+    # 8 byte tuple header + data padded to 8 bytes, plus a 4 byte line pointer
+    width = sum(stats.avg_width.get(c, 4) for c in key + proposal.include)
+    proposal.size_bytes = int(stats.rows * (math.ceil((8 + width) / 8) * 8 + 4) / INDEX_FILL)
+
+
+def _mb(size: float) -> str:
+    return f"{size / 1024 / 1024:,.1f} MB"
+
+
+def report(config, stats: TableStats, proposals: List[Proposal], requests: int) -> None:
+    source = f"{requests:,} logged filtered requests" if requests else "no logged requests, proposing from config"
+    print(f"\n{config.table_name}: {stats.rows:,.0f} rows, {_mb(stats.total_bytes)} with indexes, {source}")
+    if not proposals:
+        print("  nothing to add")
+        return
+
+    for proposal in proposals:
+        include = f" INCLUDE ({', '.join(proposal.include)})" if proposal.include else ""
+        share = f"{proposal.requests / requests:6.1%}" if requests else "     -"
+        print(f"  ({', '.join(proposal.columns)}){include}")
+        print(
+            f"    {share} of requests   ~{_mb(proposal.size_bytes)}   "
+            f"rows read {proposal.rows_before:,.0f} -> {proposal.rows_after:,.0f}   ~{proposal.speedup:,.1f}x"
+        )
+    added = sum(p.size_bytes for p in proposals)
+    print(f"  total ~{_mb(added)} ({added / max(stats.total_bytes, 1):.0%} of the table's current size)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--logs", type=Path, default=Path("logs"), help="Directory of filter_usage_*.log or app_*.log files"
+    )
+    parser.add_argument("--dataset", action="append", help="Table name (repeatable, default: every dataset)")
+    parser.add_argument("--min-share", type=float, default=0.05, help="Skip combinations below this share of requests")
+    parser.add_argument("--max-indexes", type=int, default=3, help="Most indexes proposed per dataset")
+    parser.add_argument("--no-include", action="store_true", help="Don't add measure columns as INCLUDE")
+    parser.add_argument("--sql", type=Path, help="Write the CREATE INDEX statements to this file")
+    parser.add_argument("--create", action="store_true", help="Create the proposed indexes")
+    args = parser.parse_args()
+
+    usage = read_filter_usage(args.logs) if args.logs.is_dir() else {}
+    configs = [
+        config
+        for config in load_router_configs()
+        if (
+            config.table_name in args.dataset
+            if args.dataset
+            else any(f.get("joins_table") for f in config.filter_configs)
+        )
+    ]
+
+    engine = create_engine(DATABASE_URL)
+    proposals = []
+    with engine.connect() as conn:
+        for config in configs:
+            stats = load_table_stats(conn, config.table_name)
+            if stats is None or not stats.rows:
+                continue
+            table_usage = usage.get(config.table_name, Counter())
+            dataset_proposals = propose(
+                config, stats, table_usage, args.min_share, args.max_indexes, covering=not args.no_include
+            )
+            report(config, stats, dataset_proposals, sum(table_usage.values()))
+            proposals += dataset_proposals
+
+    statements = ";\n".join(p.sql for p in proposals) + ";\n" if proposals else ""
+    if args.sql:
+        args.sql.write_text(statements)
+        logger.info(f"Wrote {len(proposals)} statements to {args.sql}")
+
+    if args.create and proposals:
+        from fao.src.db.setup import create_indexes
+
+        create_indexes(engine, statements)
+        with engine.connect() as conn:
+            for proposal in proposals:
+                size = conn.execute(
+                    text("SELECT pg_relation_size(to_regclass(:name))"), {"name": proposal.name}
+                ).scalar()
+                logger.info(
+                    f"{proposal.name} on {proposal.table}: {_mb(size or 0)} (estimated {_mb(proposal.size_bytes)})"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# fao/src/db/partitioning.py
+"""
+Declarative year range partitioning for the largest dataset tables
+
+A dataset listed in PARTITIONED_DATASETS is created as a table partitioned
+by RANGE (year), with one partition per `step` years between `start` and `end`
+plus a default partition for anything outside. Queries filtering on year,
+year_min or year_max only scan the partitions that can match.
+
+A model opts in with its table args and by making year part of the primary
+key (Postgres requires the partition key in every unique constraint):
+
+    year = Column(SmallInteger, primary_key=True, nullable=False, index=True)
+    __table_args__ = partitioned_by_year("trade_indices")
+
+New databases get the partitions from create_all. Existing tables are
+converted with `python -m fao.src.db.setup partition-tables`.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import Table, event, text
+
+
+@dataclass(frozen=True)
+class YearPartitions:
+    start: int
+    end: int
+    step: int = 5
+    column: str = "year"
+    csv_column: str = "Year"
+
+    def bounds(self) -> List[Tuple[int, int]]:
+        """[lower, upper) year range of each partition"""
+        return [(lower, min(lower + self.step, self.end)) for lower in range(self.start, self.end, self.step)]
+
+    def partition_ddl(self, table_name: str) -> List[str]:
+        statements = [
+            f"CREATE TABLE IF NOT EXISTS {table_name}_y{lower} PARTITION OF {table_name} "
+            f"FOR VALUES FROM ({lower}) TO ({upper})"
+            for lower, upper in self.bounds()
+        ]
+        statements.append(f"CREATE TABLE IF NOT EXISTS {table_name}_default PARTITION OF {table_name} DEFAULT")
+        return statements
+
+
+# Tables over ~10M rows whose queries nearly always carry a year filter
+PARTITIONED_DATASETS: Dict[str, YearPartitions] = {
+    "trade_crops_livestock": YearPartitions(start=1960, end=2030),
+    "trade_detailed_trade_matrix": YearPartitions(start=1985, end=2030),
+    "trade_indices": YearPartitions(start=1960, end=2030),
+}
+
+
+def partitioned_by_year(table_name: str) -> Dict[str, Any]:
+    """__table_args__ for a dataset table partitioned by year"""
+    partitions = PARTITIONED_DATASETS[table_name]
+    return {
+        "postgresql_partition_by": f"RANGE ({partitions.column})",
+        "info": {"year_partitions": partitions},
+    }
+
+
+def get_year_partitions(table: Table) -> Optional[YearPartitions]:
+    return table.info.get("year_partitions")
+
+
+@event.listens_for(Table, "after_create")
+def create_partitions(table: Table, connection, **kw) -> None:
+    partitions = get_year_partitions(table)
+    if partitions is None:
+        return
+    for statement in partitions.partition_ddl(table.name):
+        connection.execute(text(statement))
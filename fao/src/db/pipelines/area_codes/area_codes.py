@@ -1,6 +1,6 @@
 import pandas as pd
-from fao.src.db.utils import get_csv_path_for
 from fao.src.db.database import run_with_session
+from fao.src.db.pipelines.registry import etl_module_getattr, get_etl
 from fao.src.db.pipelines.base import BaseLookupETL
 from .area_codes_model import AreaCodes
 
@@ -10,9 +10,10 @@ class AreaCodesETL(BaseLookupETL):
     
     def __init__(self):
         super().__init__(
-            csv_path=get_csv_path_for("synthetic_references/area_codes.csv"),
+            csv_path="synthetic_references/area_codes.csv",
             model_class=AreaCodes,
             table_name="area_codes",
+            column_map={"area_code": "Area Code", "area": "Area", "area_code_m49": "Area Code (M49)", "source_dataset": "source_dataset"},
             hash_columns=["Area Code", "source_dataset"],
             pk_column="Area Code"
         )
@@ -29,23 +30,10 @@ class AreaCodesETL(BaseLookupETL):
         df['source_dataset'] = df['source_dataset'].astype(str).str.strip().str.replace("'", "")
         
         return df
-    
-    def build_record(self, row: pd.Series) -> dict:
-        """Build record for insertion"""
-        record = {}
-        record['area_code'] = row['Area Code']
-        record['area'] = row['Area']
-        record['area_code_m49'] = row['Area Code (M49)']
-        record['source_dataset'] = row['source_dataset']
-        return record
 
 
-# Module-level functions for backwards compatibility
-etl = AreaCodesETL()
-load = etl.load
-clean = etl.clean
-insert = etl.insert
-run = etl.run
+# Module-level etl/load/clean/insert/run for backwards compatibility, built on first use
+__getattr__ = etl_module_getattr("area_codes")
 
 if __name__ == "__main__":
-    run_with_session(run)
\ No newline at end of file
+    run_with_session(get_etl("area_codes").run)
\ No newline at end of file
@@ -1,6 +1,6 @@
 import pandas as pd
-from fao.src.db.utils import get_csv_path_for
 from fao.src.db.database import run_with_session
+from fao.src.db.pipelines.registry import etl_module_getattr, get_etl
 from fao.src.db.pipelines.base import BaseDatasetETL
 from .asti_researchers_model import AstiResearchers
 
@@ -10,9 +10,10 @@ class AstiResearchersETL(BaseDatasetETL):
     
     def __init__(self):
         super().__init__(
-            csv_path=get_csv_path_for("ASTI_Researchers_E_All_Data_(Normalized)/ASTI_Researchers_E_All_Data_(Normalized).csv"),
+            csv_path="ASTI_Researchers_E_All_Data_(Normalized)/ASTI_Researchers_E_All_Data_(Normalized).csv",
             model_class=AstiResearchers,
             table_name="asti_researchers",
+            column_map={"area_code_id": "area_code_id", "item_code_id": "item_code_id", "element_code_id": "element_code_id", "flag_id": "flag_id", "year_code": "Year Code", "year": "Year", "unit": "Unit", "value": "Value", "note": "Note"},
             exclude_columns=["Area", "Area Code", "Area Code (M49)", "Element", "Element Code", "Flag", "Item", "Item Code"],
             foreign_keys=[{"csv_column_name": "Area Code", "exception_func": "invalid_area_code", "format_methods": [], "hash_columns": ["Area Code", "source_dataset"], "hash_fk_csv_column_name": "Area Code_id", "hash_fk_sql_column_name": "area_code_id", "hash_pk_sql_column_name": "id", "index_hash": "ec83df11_area_codes", "model_name": "AreaCodes", "pipeline_name": "area_codes", "reference_additional_columns": ["area_code_m49"], "reference_column_count": 4, "reference_description_column": "area", "reference_pk_csv_column": "Area Code", "sql_column_name": "area_code", "table_name": "area_codes", "validation_func": "is_valid_area_code"}, {"csv_column_name": "Item Code", "exception_func": "invalid_item_code", "format_methods": [], "hash_columns": ["Item Code", "source_dataset"], "hash_fk_csv_column_name": "Item Code_id", "hash_fk_sql_column_name": "item_code_id", "hash_pk_sql_column_name": "id", "index_hash": "6f030d6b_item_codes", "model_name": "ItemCodes", "pipeline_name": "item_codes", "reference_additional_columns": ["item_code_cpc", "item_code_fbs", "item_code_sdg"], "reference_column_count": 6, "reference_description_column": "item", "reference_pk_csv_column": "Item Code", "sql_column_name": "item_code", "table_name": "item_codes", "validation_func": "is_valid_item_code"}, {"csv_column_name": "Element Code", "exception_func": "invalid_element_code", "format_methods": [], "hash_columns": ["Element Code", "source_dataset"], "hash_fk_csv_column_name": "Element Code_id", "hash_fk_sql_column_name": "element_code_id", "hash_pk_sql_column_name": "id", "index_hash": "9182af5d_elements", "model_name": "Elements", "pipeline_name": "elements", "reference_additional_columns": [], "reference_column_count": 3, "reference_description_column": "element", "reference_pk_csv_column": "Element Code", "sql_column_name": "element_code", "table_name": "elements", "validation_func": "is_valid_element_code"}, {"csv_column_name": "Flag", "exception_func": "invalid_flag", "format_methods": ["upper"], "hash_columns": ["Flag"], "hash_fk_csv_column_name": "Flag_id", "hash_fk_sql_column_name": "flag_id", "hash_pk_sql_column_name": "id", "index_hash": "eb2558ea_flags", "model_name": "Flags", "pipeline_name": "flags", "reference_additional_columns": [], "reference_column_count": 3, "reference_description_column": "description", "reference_pk_csv_column": "Flag", "sql_column_name": "flag", "table_name": "flags", "validation_func": "is_valid_flag"}]
         )
@@ -37,30 +38,10 @@ class AstiResearchersETL(BaseDatasetETL):
         df['Note'] = df['Note'].astype(str).str.strip().str.replace("'", "")
         
         return df
-    
-    def build_record(self, row: pd.Series) -> dict:
-        """Build record for insertion"""
-        record = {}
-        # Foreign key columns
-        record['area_code_id'] = row['area_code_id']
-        record['item_code_id'] = row['item_code_id']
-        record['element_code_id'] = row['element_code_id']
-        record['flag_id'] = row['flag_id']
-        # Data columns
-        record['year_code'] = row['Year Code']
-        record['year'] = row['Year']
-        record['unit'] = row['Unit']
-        record['value'] = row['Value']
-        record['note'] = row['Note']
-        return record
 
 
-# Module-level functions for backwards compatibility
-etl = AstiResearchersETL()
-load = etl.load
-clean = etl.clean
-insert = etl.insert
-run = etl.run
+# Module-level etl/load/clean/insert/run for backwards compatibility, built on first use
+__getattr__ = etl_module_getattr("asti_researchers")
 
 if __name__ == "__main__":
-    run_with_session(run)
\ No newline at end of file
+    run_with_session(get_etl("asti_researchers").run)
\ No newline at end of file
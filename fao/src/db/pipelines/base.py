@@ -3,23 +3,69 @@ from abc import ABC, abstractmethod
 from sqlalchemy import text, func
 from sqlalchemy.orm import Session
 from sqlalchemy.dialects.postgresql import insert as pg_insert
-from typing import Dict, List, Optional, Type
-from fao.src.db.utils import load_csv, generate_numeric_id, calculate_optimal_chunk_size
+from functools import cached_property
+from typing import Dict, Iterable, Iterator, List, Optional, Type, Union
+from fao.src.db.utils import (
+    CSV_CHUNK_ROWS,
+    CsvSource,
+    as_csv_source,
+    calculate_optimal_chunk_size,
+    generate_numeric_ids,
+    generate_row_ids,
+    get_csv_path_for,
+    iter_csv_chunks,
+    load_csv,
+)
+from fao.src.db.copy_loader import (
+    copy_frame,
+    copy_frame_for,
+    create_staging_table,
+    drop_staging_table,
+    merge_staging,
+    staging_table_exists,
+)
+from fao.src.db.delta_loader import apply_delta
 from fao.logger import logger
-from fao.src.db.system_models import PipelineProgress
+from fao.src.core import settings
+from fao.src.db.system_models import DatasetMetadata, PipelineProgress
+
+# Dataset columns that hold what was measured rather than identify it - left out of the natural key
+MEASURE_COLUMNS = ["value", "flag_id", "note"]
 
 
 class BaseETL(ABC):
     """Base class for all ETL pipelines"""
 
-    def __init__(self, csv_path: str, model_class: Type, table_name: str):
-        self.csv_path = csv_path
+    def __init__(self, csv_path: Union[str, CsvSource], model_class: Type, table_name: str, column_map: Dict[str, str]):
+        # Relative to FAO_ZIP_PATH - located (in its ZIP or on disk) when first read, see csv_path
+        self.csv_file = csv_path
         self.model_class = model_class
         self.table_name = table_name
+        # Model column → cleaned DataFrame column to insert into it
+        self.column_map = column_map
+        # Rows the last run inserted, updated or deleted
+        self.rows_changed = 0
+        # SHA-256 of the CSV, taken as it is read (or by start_run) so a completed load doesn't read it again
+        self.content_hash: Optional[str] = None
+
+    @cached_property
+    def csv_path(self) -> CsvSource:
+        return self.csv_file if isinstance(self.csv_file, CsvSource) else get_csv_path_for(self.csv_file)
 
     def load(self) -> pd.DataFrame:
         """Load the CSV file - common for all pipelines"""
-        return load_csv(self.csv_path)
+        return load_csv(self.csv_path, on_content_hash=self.keep_content_hash)
+
+    def load_chunks(self) -> Iterator[pd.DataFrame]:
+        """Stream the CSV file in chunks of CSV_CHUNK_ROWS rows"""
+        return iter_csv_chunks(self.csv_path, on_content_hash=self.keep_content_hash)
+
+    def keep_content_hash(self, content_hash: str) -> None:
+        self.content_hash = content_hash
+
+    def build_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Model columns of the cleaned rows, selected and renamed in one DataFrame operation"""
+        return df[list(self.column_map.values())].set_axis(list(self.column_map), axis=1)
 
     def update_pipeline_progress(self, session, last_row, total_rows, status="in_progress"):
         """Update progress tracking"""
@@ -39,8 +85,95 @@ class BaseETL(ABC):
             )
             session.add(progress)
 
+        if status == "completed":
+            progress.source_signature = self.source_signature()
+            self.record_content_hash(session)
+
         session.commit()
 
+    def source_signature(self) -> str:
+        return as_csv_source(self.csv_path).signature()
+
+    def source_unchanged(self, session: Session) -> bool:
+        """Whether the last completed run loaded the CSV as it is now (ZIP member CRC and size)
+
+        A completed run from before signatures were recorded is taken to be current.
+        """
+        progress = session.query(PipelineProgress).filter_by(table_name=self.table_name).first()
+        if progress is None or progress.status != "completed":
+            return False
+        if progress.source_signature is None:
+            progress.source_signature = self.source_signature()
+            session.commit()
+        return progress.source_signature == self.source_signature()
+
+    def dataset_metadata(self, session: Session) -> Optional[DatasetMetadata]:
+        return session.query(DatasetMetadata).filter_by(local_file_path=str(as_csv_source(self.csv_path))).first()
+
+    def content_unchanged(self, session: Session) -> bool:
+        """Whether the CSV's bytes hash the same as when it was last loaded, whatever its ZIP entry says"""
+        metadata = self.dataset_metadata(session)
+        if metadata is None or metadata.csv_content_hash is None:
+            return False
+        self.content_hash = as_csv_source(self.csv_path).content_hash()
+        return self.content_hash == metadata.csv_content_hash
+
+    def record_content_hash(self, session: Session) -> None:
+        """Keep the loaded CSV's hash, and the one before it, on its DatasetMetadata row. Doesn't commit."""
+        content_hash = self.content_hash
+        if content_hash is None:
+            # Rows inserted without reading the CSV through load()/load_chunks() - nothing to record
+            logger.debug(f"No content hash for {self.table_name}'s CSV, leaving its metadata as it is")
+            return
+        source = as_csv_source(self.csv_path)
+        metadata = self.dataset_metadata(session)
+        if metadata is None:
+            metadata = DatasetMetadata(dataset_name=self.table_name, local_file_path=str(source))
+            session.add(metadata)
+
+        metadata.has_content_changed = metadata.csv_content_hash not in (None, content_hash)
+        if metadata.has_content_changed:
+            metadata.previous_csv_hash = metadata.csv_content_hash
+        metadata.csv_content_hash = content_hash
+        metadata.last_checked = func.now()
+        self.content_hash = None
+
+    def start_run(self, session: Session) -> bool:
+        """False when the table already holds this CSV, otherwise sets up a reload if the CSV changed"""
+        progress = session.query(PipelineProgress).filter_by(table_name=self.table_name).first()
+        if progress is None or progress.status != "completed":
+            # First run, or resuming an interrupted one
+            return True
+        if self.source_unchanged(session):
+            print(f"✅ Skipping {self.table_name} - {self.csv_path} is unchanged")
+            return False
+        if self.content_unchanged(session):
+            # Same bytes in a new ZIP entry, e.g. downloaded again - remember the new signature
+            self.update_pipeline_progress(session, progress.last_row_processed, progress.total_rows, status="completed")
+            print(f"✅ Skipping {self.table_name} - {self.csv_path} has the same content")
+            return False
+
+        logger.info(f"🔄 {self.csv_path} changed since {self.table_name} was loaded, reloading")
+        self.prepare_reload(session)
+        self.update_pipeline_progress(session, 0, None)
+        return True
+
+    def prepare_reload(self, session: Session) -> None:
+        """Called before loading a changed CSV over a completed table"""
+        pass
+
+    def cache_patterns(self) -> List[str]:
+        """Cached responses built from this table: its endpoints' results and counts"""
+        return [f"{self.table_name}:*"]
+
+    def invalidate_caches(self) -> None:
+        # Imported here so building or importing an ETL doesn't import FastAPI and redis
+        from fao.src.core.cache import invalidate_cache
+
+        for pattern in self.cache_patterns():
+            deleted = invalidate_cache(pattern)
+            logger.info(f"  🧹 Invalidated {deleted} cached responses matching {pattern}")
+
     @abstractmethod
     def clean(self, df: pd.DataFrame) -> pd.DataFrame:
         """Clean and prepare data - must be implemented by subclasses"""
@@ -53,6 +186,8 @@ class BaseETL(ABC):
 
     def run(self, db: Session) -> None:
         """Run the complete ETL pipeline - common for all"""
+        if not self.start_run(db):
+            return
         df = self.load()
         df = self.clean(df)
         self.insert(df, db)
@@ -61,8 +196,16 @@ class BaseETL(ABC):
 class BaseLookupETL(BaseETL):
     """Base class for reference table ETL pipelines"""
 
-    def __init__(self, csv_path: str, model_class: Type, table_name: str, hash_columns: List[str], pk_column: str):
-        super().__init__(csv_path, model_class, table_name)
+    def __init__(
+        self,
+        csv_path: Union[str, CsvSource],
+        model_class: Type,
+        table_name: str,
+        column_map: Dict[str, str],
+        hash_columns: List[str],
+        pk_column: str,
+    ):
+        super().__init__(csv_path, model_class, table_name, column_map)
         self.hash_columns = hash_columns
         self.pk_column = pk_column
 
@@ -98,11 +241,9 @@ class BaseLookupETL(BaseETL):
 
         self.update_pipeline_progress(session, 0, len(df))
 
-        records = []
-        for _, row in df.iterrows():
-            record = self.build_record(row)
-            record["id"] = generate_numeric_id(row.to_dict(), self.hash_columns)
-            records.append(record)
+        frame = self.build_frame(df)
+        frame["id"] = generate_row_ids(df, self.hash_columns)
+        records = frame.to_dict(orient="records")
 
         if records:
             try:
@@ -110,6 +251,7 @@ class BaseLookupETL(BaseETL):
                 stmt = stmt.on_conflict_do_nothing()
                 result = session.execute(stmt)
                 session.commit()
+                self.rows_changed = result.rowcount
                 print(f"  ✅ Inserted {result.rowcount} rows")
             except Exception as e:
                 logger.error(f"  ❌ Error during bulk insert: {e} - {records[:5]}")
@@ -117,12 +259,13 @@ class BaseLookupETL(BaseETL):
                 raise
 
         self.update_pipeline_progress(session, len(records), len(df), status="completed")
+        if self.rows_changed:
+            self.invalidate_caches()
         print(f"✅ {self.table_name} insert complete")
 
-    @abstractmethod
-    def build_record(self, row: pd.Series) -> Dict:
-        """Build record dict from row - implement in subclass"""
-        pass
+    def cache_patterns(self) -> List[str]:
+        """Its own cached responses, and the datasets' cached lists of its codes (e.g. prices:area_codes)"""
+        return [f"{self.table_name}:*", f"*:{self.table_name}:*"]
 
 
 class BaseDatasetETL(BaseETL):
@@ -130,17 +273,21 @@ class BaseDatasetETL(BaseETL):
 
     def __init__(
         self,
-        csv_path: str,
+        csv_path: Union[str, CsvSource],
         model_class: Type,
         table_name: str,
+        column_map: Dict[str, str],
         column_renames: Optional[Dict] = None,
         exclude_columns: Optional[List[str]] = None,
         foreign_keys: Optional[List[Dict]] = None,
+        natural_key: Optional[List[str]] = None,
     ):
-        super().__init__(csv_path, model_class, table_name)
+        super().__init__(csv_path, model_class, table_name, column_map)
         self.column_renames = column_renames or {}
         self.exclude_columns = exclude_columns or []
         self.foreign_keys = foreign_keys or []
+        # Model columns that identify a row - delta loads match rows on these
+        self.natural_key = natural_key or [column for column in column_map if column not in MEASURE_COLUMNS]
 
     def base_clean(self, df: pd.DataFrame) -> pd.DataFrame:
         """Common cleaning for all datasets"""
@@ -171,21 +318,16 @@ class BaseDatasetETL(BaseETL):
                     for method in fk["format_methods"]:
                         df[fk["reference_pk_csv_column"]] = getattr(df[fk["reference_pk_csv_column"]].str, method)()
 
-                df[fk["hash_fk_sql_column_name"]] = df[fk["reference_pk_csv_column"]].apply(
-                    lambda val: (
-                        generate_numeric_id(
-                            {col: dataset_name if col == "source_dataset" else str(val) for col in fk["hash_columns"]},
-                            fk["hash_columns"],
-                        )
-                        if pd.notna(val) and str(val).strip()
-                        else None
-                    )
+                df[fk["hash_fk_sql_column_name"]] = generate_numeric_ids(
+                    df[fk["reference_pk_csv_column"]],
+                    fk["hash_columns"],
+                    fixed_values={"source_dataset": dataset_name},
                 )
 
-        # Don't drop excluded columns - let build_record handle what to insert
+        # Don't drop excluded columns - column_map picks what to insert
         logger.debug(f"  Excluded columns (kept for reference): {self.exclude_columns}")
 
-        # Remove duplicates
+        # Remove duplicates within the chunk - the load drops those across chunks in the database
         df = df.drop_duplicates()
 
         final_count = len(df)
@@ -208,59 +350,126 @@ class BaseDatasetETL(BaseETL):
 
         return result[0] if result else 0
 
-    def insert(self, df: pd.DataFrame, session: Session) -> None:
-        """Common insert logic for datasets with chunking"""
-        if df.empty:
-            logger.debug(f"No {self.table_name} data to insert.")
+    def run(self, db: Session) -> None:
+        """Stream the CSV through clean and insert, so only one chunk is in memory at a time"""
+        if not self.start_run(db):
             return
+        chunks = (self.clean(chunk) for chunk in self.load_chunks())
+        if settings.etl_incremental and self.get_resume_position(db) == 0 and self.has_rows(db):
+            self.load_delta(chunks, db)
+        else:
+            self.insert_chunks(chunks, db)
+
+    def has_rows(self, session: Session) -> bool:
+        return session.execute(text(f"SELECT EXISTS (SELECT 1 FROM {self.table_name})")).scalar()
+
+    def prepare_reload(self, session: Session) -> None:
+        """Incremental loads diff the changed CSV against the table, otherwise it is replaced"""
+        if not settings.etl_incremental:
+            session.execute(text(f"TRUNCATE {self.table_name}"))
+            session.commit()
+
+    def load_delta(self, chunks: Iterable[pd.DataFrame], session: Session) -> None:
+        """Stage every cleaned chunk, then apply only the rows that differ from the table (see delta_loader.py)
+
+        Nothing reaches the table until the delta commits, so an interrupted delta load just runs again.
+        """
+        logger.info(f"\nApplying changes to {self.table_name} on ({', '.join(self.natural_key)})")
+        table = self.model_class.__table__
+        staging = None
+        position = 0
+
+        try:
+            for df in chunks:
+                if df.empty:
+                    continue
+                frame = copy_frame_for(table, self.build_frame(df))
+                if staging is None:
+                    staging = create_staging_table(session, table, list(frame.columns))
+                copy_frame(session, staging, frame, truncate=False)
+                position += len(df)
+                logger.info(f"  Staged {position:,} rows")
+
+            if staging is None:
+                logger.warning(f"No {self.table_name} data in the new CSV - leaving the table as it is")
+                session.rollback()
+                return
 
-        # Check for resume point
-        start_row = self.get_resume_position(session)
-        original_total = len(df)
+            delta = apply_delta(session, staging, table, self.natural_key)
+            drop_staging_table(session, staging)
+            session.commit()
+        except Exception as e:
+            logger.error(f"  ❌ Error applying changes to {self.table_name}: {e}")
+            session.rollback()
+            raise
+
+        if delta.duplicates:
+            logger.warning(f"  Dropped {delta.duplicates:,} rows repeating another row's natural key")
+        self.rows_changed = delta.changed
+        self.update_pipeline_progress(session, position, position, status="completed")
+        if self.rows_changed:
+            self.invalidate_caches()
+        logger.info(f"✅ {self.table_name} updated: {delta}")
 
+    def insert(self, df: pd.DataFrame, session: Session) -> None:
+        """Common insert logic for datasets, for a DataFrame that is already in memory"""
+        self.insert_chunks([df], session)
+
+    def insert_chunks(self, chunks: Iterable[pd.DataFrame], session: Session) -> None:
+        """COPY cleaned chunks into a staging table, committing progress after each, then merge the staged
+        rows into the table in one statement.
+
+        The merge inserts each distinct row once, so duplicates are dropped across the whole file by
+        Postgres rather than held in memory. Row positions count cleaned rows across all chunks and the
+        staged rows are kept between runs, so a resumed run stages exactly the rows an earlier run didn't.
+        """
+        table = self.model_class.__table__
+        start_row = self.get_resume_position(session)
+        if start_row > 0 and not staging_table_exists(session, table):
+            # Unlogged tables are emptied by a database crash - and older runs merged as they went
+            logger.warning(f"📍 No staged {self.table_name} rows to resume from, loading it from the start")
+            session.execute(text(f"TRUNCATE {self.table_name}"))
+            start_row = 0
         if start_row > 0:
-            logger.info(f"📍 Resuming {self.table_name} from row {start_row:,}/{original_total:,}")
-            df = df.iloc[start_row:]
-            if df.empty:
-                logger.info(f"✅ {self.table_name} already complete!")
-                self.update_pipeline_progress(session, original_total, original_total, status="completed")
-                return
+            logger.info(f"📍 Resuming {self.table_name} from row {start_row:,}")
 
-        # Calculate chunk size
-        chunk_size = 15000
-        logger.info(f"\nInserting {self.table_name} data ({len(df):,} rows remaining)")
+        # Chunks only bound memory and how much a resume redoes - COPY has no parameter limit
+        chunk_size = CSV_CHUNK_ROWS
+        logger.info(f"\nInserting {self.table_name} data")
         logger.info(f"  Using chunk size: {chunk_size:,} rows")
 
-        total_inserted = 0
+        staging = create_staging_table(session, table, list(self.column_map), keep_rows=start_row > 0)
+        session.commit()
+        position = 0
+        chunk_idx = -1
 
-        for chunk_idx, chunk_start in enumerate(range(0, len(df), chunk_size)):
-            chunk_end = min(chunk_start + chunk_size, len(df))
-            chunk_df = df.iloc[chunk_start:chunk_end]
+        for df in chunks:
+            df_start = position
+            position += len(df)
+            if position <= start_row:
+                continue
+            if df_start < start_row:
+                df = df.iloc[start_row - df_start :]
+                df_start = start_row
 
-            # Calculate absolute position
-            absolute_position = start_row + chunk_end
+            for chunk_start in range(0, len(df), chunk_size):
+                chunk_idx += 1
+                chunk_df = df.iloc[chunk_start : chunk_start + chunk_size]
 
-            records = []
-            for _, row in chunk_df.iterrows():
-                record = self.build_record(row)
-                records.append(record)
+                # Calculate absolute position
+                absolute_position = df_start + chunk_start + len(chunk_df)
 
-            if records:
-                try:
-                    stmt = pg_insert(self.model_class).values(records)
-                    stmt = stmt.on_conflict_do_nothing()
-                    result = session.execute(stmt)
-                    session.commit()
+                frame = copy_frame_for(table, self.build_frame(chunk_df))
 
-                    total_inserted += result.rowcount
+                try:
+                    copy_frame(session, staging, frame, truncate=False)
 
-                    # Update progress after each chunk
-                    self.update_pipeline_progress(session, absolute_position, original_total)
+                    # Commits the staged chunk with it - the total isn't known until the stream ends
+                    self.update_pipeline_progress(session, absolute_position, None)
 
                     logger.info(
-                        f"  Chunk {chunk_idx + 1}: Inserted {result.rowcount} rows into {self.table_name} "
-                        + f"(Progress: {absolute_position:,}/{original_total:,} - "
-                        + f"{(absolute_position/original_total*100):.1f}%)"
+                        f"  Chunk {chunk_idx + 1}: Staged {len(frame):,} rows for {self.table_name} "
+                        + f"(Progress: {absolute_position:,} rows)"
                     )
 
                 except Exception as e:
@@ -278,6 +487,7 @@ class BaseDatasetETL(BaseETL):
                     # Save the chunk data
                     import json
 
+                    records = frame.to_dict(orient="records")
                     with open(error_file, "w") as f:
                         json.dump(records, f, indent=2, default=str)
 
@@ -286,22 +496,47 @@ class BaseDatasetETL(BaseETL):
                     for i, record in enumerate(records[:3]):
                         logger.error(f"    Record {i}: {record}")
 
-                    # If it's a FK constraint error, try to identify the problematic value
-                    if "foreign key constraint" in str(e).lower():
-                        logger.error(f"  🔍 Checking for problematic foreign keys...")
-                        for fk in self.foreign_keys:
-                            fk_column = fk["hash_fk_sql_column_name"]
-                            unique_fk_values = set(rec.get(fk_column) for rec in records if rec.get(fk_column))
-                            logger.error(f"    {fk_column} values in chunk: {list(unique_fk_values)[:10]}...")
-
                     session.rollback()
                     raise
 
+        if position == 0:
+            logger.debug(f"No {self.table_name} data to insert.")
+            drop_staging_table(session, staging)
+            session.commit()
+            return
+
+        try:
+            total_inserted = merge_staging(session, staging, table, distinct=True)
+            drop_staging_table(session, staging)
+            session.commit()
+        except Exception as e:
+            logger.error(f"  ❌ Error merging the staged {self.table_name} rows: {e}")
+
+            # If it's a FK constraint error, show which ids have no reference row
+            if "foreign key constraint" in str(e).lower():
+                session.rollback()
+                logger.error(f"  🔍 Checking for problematic foreign keys...")
+                for fk in self.foreign_keys:
+                    fk_column = fk["hash_fk_sql_column_name"]
+                    missing = session.execute(
+                        text(
+                            f"SELECT DISTINCT s.{fk_column} FROM {staging.name} s "
+                            f"LEFT JOIN {fk['table_name']} r ON r.id = s.{fk_column} "
+                            f"WHERE s.{fk_column} IS NOT NULL AND r.id IS NULL LIMIT 10"
+                        )
+                    ).scalars()
+                    logger.error(f"    {fk_column} values with no {fk['table_name']} row: {list(missing)}...")
+
+            session.rollback()
+            raise
+
+        duplicates = position - total_inserted
+        if duplicates:
+            logger.info(f"  Dropped {duplicates:,} duplicate rows")
+
         # Mark as complete
-        self.update_pipeline_progress(session, original_total, original_total, status="completed")
+        self.rows_changed = total_inserted
+        self.update_pipeline_progress(session, position, position, status="completed")
+        if self.rows_changed:
+            self.invalidate_caches()
         logger.info(f"✅ {self.table_name} complete: {total_inserted:,} rows inserted")
-
-    @abstractmethod
-    def build_record(self, row: pd.Series) -> Dict:
-        """Build record dict from row - implement in subclass"""
-        pass
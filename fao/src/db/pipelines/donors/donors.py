@@ -1,6 +1,6 @@
 import pandas as pd
-from fao.src.db.utils import get_csv_path_for
 from fao.src.db.database import run_with_session
+from fao.src.db.pipelines.registry import etl_module_getattr, get_etl
 from fao.src.db.pipelines.base import BaseLookupETL
 from .donors_model import Donors
 
@@ -10,9 +10,10 @@ class DonorsETL(BaseLookupETL):
     
     def __init__(self):
         super().__init__(
-            csv_path=get_csv_path_for("synthetic_references/donors.csv"),
+            csv_path="synthetic_references/donors.csv",
             model_class=Donors,
             table_name="donors",
+            column_map={"donor_code": "Donor Code", "donor": "Donor", "donor_code_m49": "Donor Code (M49)", "source_dataset": "source_dataset"},
             hash_columns=["Donor Code", "source_dataset"],
             pk_column="Donor Code"
         )
@@ -29,23 +30,10 @@ class DonorsETL(BaseLookupETL):
         df['source_dataset'] = df['source_dataset'].astype(str).str.strip().str.replace("'", "")
         
         return df
-    
-    def build_record(self, row: pd.Series) -> dict:
-        """Build record for insertion"""
-        record = {}
-        record['donor_code'] = row['Donor Code']
-        record['donor'] = row['Donor']
-        record['donor_code_m49'] = row['Donor Code (M49)']
-        record['source_dataset'] = row['source_dataset']
-        return record
 
 
-# Module-level functions for backwards compatibility
-etl = DonorsETL()
-load = etl.load
-clean = etl.clean
-insert = etl.insert
-run = etl.run
+# Module-level etl/load/clean/insert/run for backwards compatibility, built on first use
+__getattr__ = etl_module_getattr("donors")
 
 if __name__ == "__main__":
-    run_with_session(run)
\ No newline at end of file
+    run_with_session(get_etl("donors").run)
\ No newline at end of file
@@ -1,6 +1,6 @@
 import pandas as pd
-from fao.src.db.utils import get_csv_path_for
 from fao.src.db.database import run_with_session
+from fao.src.db.pipelines.registry import etl_module_getattr, get_etl
 from fao.src.db.pipelines.base import BaseLookupETL
 from .elements_model import Elements
 
@@ -10,9 +10,10 @@ class ElementsETL(BaseLookupETL):
     
     def __init__(self):
         super().__init__(
-            csv_path=get_csv_path_for("synthetic_references/elements.csv"),
+            csv_path="synthetic_references/elements.csv",
             model_class=Elements,
             table_name="elements",
+            column_map={"element_code": "Element Code", "element": "Element", "source_dataset": "source_dataset"},
             hash_columns=["Element Code", "source_dataset"],
             pk_column="Element Code"
         )
@@ -28,22 +29,10 @@ class ElementsETL(BaseLookupETL):
         df['source_dataset'] = df['source_dataset'].astype(str).str.strip().str.replace("'", "")
         
         return df
-    
-    def build_record(self, row: pd.Series) -> dict:
-        """Build record for insertion"""
-        record = {}
-        record['element_code'] = row['Element Code']
-        record['element'] = row['Element']
-        record['source_dataset'] = row['source_dataset']
-        return record
 
 
-# Module-level functions for backwards compatibility
-etl = ElementsETL()
-load = etl.load
-clean = etl.clean
-insert = etl.insert
-run = etl.run
+# Module-level etl/load/clean/insert/run for backwards compatibility, built on first use
+__getattr__ = etl_module_getattr("elements")
 
 if __name__ == "__main__":
-    run_with_session(run)
\ No newline at end of file
+    run_with_session(get_etl("elements").run)
\ No newline at end of file
@@ -1,6 +1,6 @@
 import pandas as pd
-from fao.src.db.utils import get_csv_path_for
 from fao.src.db.database import run_with_session
+from fao.src.db.pipelines.registry import etl_module_getattr, get_etl
 from fao.src.db.pipelines.base import BaseDatasetETL
 from .exchange_rate_model import ExchangeRate
 
@@ -10,9 +10,10 @@ class ExchangeRateETL(BaseDatasetETL):
     
     def __init__(self):
         super().__init__(
-            csv_path=get_csv_path_for("Exchange_rate_E_All_Data_(Normalized)/Exchange_rate_E_All_Data_(Normalized).csv"),
+            csv_path="Exchange_rate_E_All_Data_(Normalized)/Exchange_rate_E_All_Data_(Normalized).csv",
             model_class=ExchangeRate,
             table_name="exchange_rate",
+            column_map={"area_code_id": "area_code_id", "element_code_id": "element_code_id", "iso_currency_code_id": "iso_currency_code_id", "flag_id": "flag_id", "year_code": "Year Code", "year": "Year", "months_code": "Months Code", "months": "Months", "unit": "Unit", "value": "Value"},
             exclude_columns=["Area", "Area Code", "Area Code (M49)", "Currency", "Element", "Element Code", "Flag", "ISO Currency Code"],
             foreign_keys=[{"csv_column_name": "Area Code", "exception_func": "invalid_area_code", "format_methods": [], "hash_columns": ["Area Code", "source_dataset"], "hash_fk_csv_column_name": "Area Code_id", "hash_fk_sql_column_name": "area_code_id", "hash_pk_sql_column_name": "id", "index_hash": "b408a449_area_codes", "model_name": "AreaCodes", "pipeline_name": "area_codes", "reference_additional_columns": ["area_code_m49"], "reference_column_count": 4, "reference_description_column": "area", "reference_pk_csv_column": "Area Code", "sql_column_name": "area_code", "table_name": "area_codes", "validation_func": "is_valid_area_code"}, {"csv_column_name": "Element Code", "exception_func": "invalid_element_code", "format_methods": [], "hash_columns": ["Element Code", "source_dataset"], "hash_fk_csv_column_name": "Element Code_id", "hash_fk_sql_column_name": "element_code_id", "hash_pk_sql_column_name": "id", "index_hash": "a8b36093_elements", "model_name": "Elements", "pipeline_name": "elements", "reference_additional_columns": [], "reference_column_count": 3, "reference_description_column": "element", "reference_pk_csv_column": "Element Code", "sql_column_name": "element_code", "table_name": "elements", "validation_func": "is_valid_element_code"}, {"csv_column_name": "ISO Currency Code", "exception_func": "invalid_currency_code", "format_methods": [], "hash_columns": ["ISO Currency Code", "source_dataset"], "hash_fk_csv_column_name": "ISO Currency Code_id", "hash_fk_sql_column_name": "iso_currency_code_id", "hash_pk_sql_column_name": "id", "index_hash": "72bfc3cb_currencies", "model_name": "Currencies", "pipeline_name": "currencies", "reference_additional_columns": [], "reference_column_count": 3, "reference_description_column": "currency", "reference_pk_csv_column": "ISO Currency Code", "sql_column_name": "iso_currency_code", "table_name": "currencies", "validation_func": "is_valid_currency_code"}, {"csv_column_name": "Flag", "exception_func": "invalid_flag", "format_methods": ["upper"], "hash_columns": ["Flag"], "hash_fk_csv_column_name": "Flag_id", "hash_fk_sql_column_name": "flag_id", "hash_pk_sql_column_name": "id", "index_hash": "efc1dbdd_flags", "model_name": "Flags", "pipeline_name": "flags", "reference_additional_columns": [], "reference_column_count": 3, "reference_description_column": "description", "reference_pk_csv_column": "Flag", "sql_column_name": "flag", "table_name": "flags", "validation_func": "is_valid_flag"}]
         )
@@ -39,31 +40,10 @@ class ExchangeRateETL(BaseDatasetETL):
         df['Value'] = pd.to_numeric(df['Value'], errors='coerce')
         
         return df
-    
-    def build_record(self, row: pd.Series) -> dict:
-        """Build record for insertion"""
-        record = {}
-        # Foreign key columns
-        record['area_code_id'] = row['area_code_id']
-        record['element_code_id'] = row['element_code_id']
-        record['iso_currency_code_id'] = row['iso_currency_code_id']
-        record['flag_id'] = row['flag_id']
-        # Data columns
-        record['year_code'] = row['Year Code']
-        record['year'] = row['Year']
-        record['months_code'] = row['Months Code']
-        record['months'] = row['Months']
-        record['unit'] = row['Unit']
-        record['value'] = row['Value']
-        return record
 
 
-# Module-level functions for backwards compatibility
-etl = ExchangeRateETL()
-load = etl.load
-clean = etl.clean
-insert = etl.insert
-run = etl.run
+# Module-level etl/load/clean/insert/run for backwards compatibility, built on first use
+__getattr__ = etl_module_getattr("exchange_rate")
 
 if __name__ == "__main__":
-    run_with_session(run)
\ No newline at end of file
+    run_with_session(get_etl("exchange_rate").run)
\ No newline at end of file
@@ -1,6 +1,6 @@
 import pandas as pd
-from fao.src.db.utils import get_csv_path_for
 from fao.src.db.database import run_with_session
+from fao.src.db.pipelines.registry import etl_module_getattr, get_etl
 from fao.src.db.pipelines.base import BaseLookupETL
 from .factors_model import Factors
 
@@ -10,9 +10,10 @@ class FactorsETL(BaseLookupETL):
     
     def __init__(self):
         super().__init__(
-            csv_path=get_csv_path_for("synthetic_references/factors.csv"),
+            csv_path="synthetic_references/factors.csv",
             model_class=Factors,
             table_name="factors",
+            column_map={"factor_code": "Factor Code", "factor": "Factor", "source_dataset": "source_dataset"},
             hash_columns=["Factor Code", "source_dataset"],
             pk_column="Factor Code"
         )
@@ -28,22 +29,10 @@ class FactorsETL(BaseLookupETL):
         df['source_dataset'] = df['source_dataset'].astype(str).str.strip().str.replace("'", "")
         
         return df
-    
-    def build_record(self, row: pd.Series) -> dict:
-        """Build record for insertion"""
-        record = {}
-        record['factor_code'] = row['Factor Code']
-        record['factor'] = row['Factor']
-        record['source_dataset'] = row['source_dataset']
-        return record
 
 
-# Module-level functions for backwards compatibility
-etl = FactorsETL()
-load = etl.load
-clean = etl.clean
-insert = etl.insert
-run = etl.run
+# Module-level etl/load/clean/insert/run for backwards compatibility, built on first use
+__getattr__ = etl_module_getattr("factors")
 
 if __name__ == "__main__":
-    run_with_session(run)
\ No newline at end of file
+    run_with_session(get_etl("factors").run)
\ No newline at end of file
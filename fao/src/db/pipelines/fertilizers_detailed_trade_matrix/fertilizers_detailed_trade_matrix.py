@@ -1,6 +1,6 @@
 import pandas as pd
-from fao.src.db.utils import get_csv_path_for
 from fao.src.db.database import run_with_session
+from fao.src.db.pipelines.registry import etl_module_getattr, get_etl
 from fao.src.db.pipelines.base import BaseDatasetETL
 from .fertilizers_detailed_trade_matrix_model import FertilizersDetailedTradeMatrix
 
@@ -10,9 +10,10 @@ class FertilizersDetailedTradeMatrixETL(BaseDatasetETL):
     
     def __init__(self):
         super().__init__(
-            csv_path=get_csv_path_for("Fertilizers_DetailedTradeMatrix_E_All_Data_(Normalized)/Fertilizers_DetailedTradeMatrix_E_All_Data_(Normalized).csv"),
+            csv_path="Fertilizers_DetailedTradeMatrix_E_All_Data_(Normalized)/Fertilizers_DetailedTradeMatrix_E_All_Data_(Normalized).csv",
             model_class=FertilizersDetailedTradeMatrix,
             table_name="fertilizers_detailed_trade_matrix",
+            column_map={"reporter_country_code_id": "reporter_country_code_id", "partner_country_code_id": "partner_country_code_id", "item_code_id": "item_code_id", "element_code_id": "element_code_id", "flag_id": "flag_id", "year_code": "Year Code", "year": "Year", "unit": "Unit", "value": "Value"},
             exclude_columns=["Element", "Element Code", "Flag", "Item", "Item Code", "Item Code (CPC)", "Partner Countries", "Partner Country Code", "Partner Country Code (M49)", "Reporter Countries", "Reporter Country Code", "Reporter Country Code (M49)"],
             foreign_keys=[{"csv_column_name": "Reporter Country Code", "exception_func": "invalid_reporter_country_code", "format_methods": [], "hash_columns": ["Reporter Country Code", "source_dataset"], "hash_fk_csv_column_name": "Reporter Country Code_id", "hash_fk_sql_column_name": "reporter_country_code_id", "hash_pk_sql_column_name": "id", "index_hash": "2b1e5220_reporter_country_codes", "model_name": "ReporterCountryCodes", "pipeline_name": "reporter_country_codes", "reference_additional_columns": ["reporter_country_code_m49"], "reference_column_count": 4, "reference_description_column": "reporter_countries", "reference_pk_csv_column": "Reporter Country Code", "sql_column_name": "reporter_country_code", "table_name": "reporter_country_codes", "validation_func": "is_valid_reporter_country_code"}, {"csv_column_name": "Partner Country Code", "exception_func": "invalid_partner_country_code", "format_methods": [], "hash_columns": ["Partner Country Code", "source_dataset"], "hash_fk_csv_column_name": "Partner Country Code_id", "hash_fk_sql_column_name": "partner_country_code_id", "hash_pk_sql_column_name": "id", "index_hash": "3820e844_partner_country_codes", "model_name": "PartnerCountryCodes", "pipeline_name": "partner_country_codes", "reference_additional_columns": ["partner_country_code_m49"], "reference_column_count": 4, "reference_description_column": "partner_countries", "reference_pk_csv_column": "Partner Country Code", "sql_column_name": "partner_country_code", "table_name": "partner_country_codes", "validation_func": "is_valid_partner_country_code"}, {"csv_column_name": "Item Code", "exception_func": "invalid_item_code", "format_methods": [], "hash_columns": ["Item Code", "source_dataset"], "hash_fk_csv_column_name": "Item Code_id", "hash_fk_sql_column_name": "item_code_id", "hash_pk_sql_column_name": "id", "index_hash": "589c799c_item_codes", "model_name": "ItemCodes", "pipeline_name": "item_codes", "reference_additional_columns": ["item_code_cpc", "item_code_fbs", "item_code_sdg"], "reference_column_count": 6, "reference_description_column": "item", "reference_pk_csv_column": "Item Code", "sql_column_name": "item_code", "table_name": "item_codes", "validation_func": "is_valid_item_code"}, {"csv_column_name": "Element Code", "exception_func": "invalid_element_code", "format_methods": [], "hash_columns": ["Element Code", "source_dataset"], "hash_fk_csv_column_name": "Element Code_id", "hash_fk_sql_column_name": "element_code_id", "hash_pk_sql_column_name": "id", "index_hash": "f301cc79_elements", "model_name": "Elements", "pipeline_name": "elements", "reference_additional_columns": [], "reference_column_count": 3, "reference_description_column": "element", "reference_pk_csv_column": "Element Code", "sql_column_name": "element_code", "table_name": "elements", "validation_func": "is_valid_element_code"}, {"csv_column_name": "Flag", "exception_func": "invalid_flag", "format_methods": ["upper"], "hash_columns": ["Flag"], "hash_fk_csv_column_name": "Flag_id", "hash_fk_sql_column_name": "flag_id", "hash_pk_sql_column_name": "id", "index_hash": "01c85306_flags", "model_name": "Flags", "pipeline_name": "flags", "reference_additional_columns": [], "reference_column_count": 3, "reference_description_column": "description", "reference_pk_csv_column": "Flag", "sql_column_name": "flag", "table_name": "flags", "validation_func": "is_valid_flag"}]
         )
@@ -35,30 +36,10 @@ class FertilizersDetailedTradeMatrixETL(BaseDatasetETL):
         df['Value'] = pd.to_numeric(df['Value'], errors='coerce')
         
         return df
-    
-    def build_record(self, row: pd.Series) -> dict:
-        """Build record for insertion"""
-        record = {}
-        # Foreign key columns
-        record['reporter_country_code_id'] = row['reporter_country_code_id']
-        record['partner_country_code_id'] = row['partner_country_code_id']
-        record['item_code_id'] = row['item_code_id']
-        record['element_code_id'] = row['element_code_id']
-        record['flag_id'] = row['flag_id']
-        # Data columns
-        record['year_code'] = row['Year Code']
-        record['year'] = row['Year']
-        record['unit'] = row['Unit']
-        record['value'] = row['Value']
-        return record
 
 
-# Module-level functions for backwards compatibility
-etl = FertilizersDetailedTradeMatrixETL()
-load = etl.load
-clean = etl.clean
-insert = etl.insert
-run = etl.run
+# Module-level etl/load/clean/insert/run for backwards compatibility, built on first use
+__getattr__ = etl_module_getattr("fertilizers_detailed_trade_matrix")
 
 if __name__ == "__main__":
-    run_with_session(run)
\ No newline at end of file
+    run_with_session(get_etl("fertilizers_detailed_trade_matrix").run)
\ No newline at end of file
@@ -1,6 +1,6 @@
 import pandas as pd
-from fao.src.db.utils import get_csv_path_for
 from fao.src.db.database import run_with_session
+from fao.src.db.pipelines.registry import etl_module_getattr, get_etl
 from fao.src.db.pipelines.base import BaseLookupETL
 from .flags_model import Flags
 
@@ -10,9 +10,10 @@ class FlagsETL(BaseLookupETL):
     
     def __init__(self):
         super().__init__(
-            csv_path=get_csv_path_for("synthetic_references/flags.csv"),
+            csv_path="synthetic_references/flags.csv",
             model_class=Flags,
             table_name="flags",
+            column_map={"flag": "Flag", "description": "Description", "source_dataset": "source_dataset"},
             hash_columns=["Flag"],
             pk_column="Flag"
         )
@@ -29,22 +30,10 @@ class FlagsETL(BaseLookupETL):
         df['source_dataset'] = df['source_dataset'].astype(str).str.strip().str.replace("'", "")
         
         return df
-    
-    def build_record(self, row: pd.Series) -> dict:
-        """Build record for insertion"""
-        record = {}
-        record['flag'] = row['Flag']
-        record['description'] = row['Description']
-        record['source_dataset'] = row['source_dataset']
-        return record
 
 
-# Module-level functions for backwards compatibility
-etl = FlagsETL()
-load = etl.load
-clean = etl.clean
-insert = etl.insert
-run = etl.run
+# Module-level etl/load/clean/insert/run for backwards compatibility, built on first use
+__getattr__ = etl_module_getattr("flags")
 
 if __name__ == "__main__":
-    run_with_session(run)
\ No newline at end of file
+    run_with_session(get_etl("flags").run)
\ No newline at end of file
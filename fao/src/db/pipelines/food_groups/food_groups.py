@@ -1,6 +1,6 @@
 import pandas as pd
-from fao.src.db.utils import get_csv_path_for
 from fao.src.db.database import run_with_session
+from fao.src.db.pipelines.registry import etl_module_getattr, get_etl
 from fao.src.db.pipelines.base import BaseLookupETL
 from .food_groups_model import FoodGroups
 
@@ -10,9 +10,10 @@ class FoodGroupsETL(BaseLookupETL):
     
     def __init__(self):
         super().__init__(
-            csv_path=get_csv_path_for("synthetic_references/food_groups.csv"),
+            csv_path="synthetic_references/food_groups.csv",
             model_class=FoodGroups,
             table_name="food_groups",
+            column_map={"food_group_code": "Food Group Code", "food_group": "Food Group", "source_dataset": "source_dataset"},
             hash_columns=["Food Group Code", "source_dataset"],
             pk_column="Food Group Code"
         )
@@ -28,22 +29,10 @@ class FoodGroupsETL(BaseLookupETL):
         df['source_dataset'] = df['source_dataset'].astype(str).str.strip().str.replace("'", "")
         
         return df
-    
-    def build_record(self, row: pd.Series) -> dict:
-        """Build record for insertion"""
-        record = {}
-        record['food_group_code'] = row['Food Group Code']
-        record['food_group'] = row['Food Group']
-        record['source_dataset'] = row['source_dataset']
-        return record
 
 
-# Module-level functions for backwards compatibility
-etl = FoodGroupsETL()
-load = etl.load
-clean = etl.clean
-insert = etl.insert
-run = etl.run
+# Module-level etl/load/clean/insert/run for backwards compatibility, built on first use
+__getattr__ = etl_module_getattr("food_groups")
 
 if __name__ == "__main__":
-    run_with_session(run)
\ No newline at end of file
+    run_with_session(get_etl("food_groups").run)
\ No newline at end of file
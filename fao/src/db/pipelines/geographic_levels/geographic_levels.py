@@ -1,6 +1,6 @@
 import pandas as pd
-from fao.src.db.utils import get_csv_path_for
 from fao.src.db.database import run_with_session
+from fao.src.db.pipelines.registry import etl_module_getattr, get_etl
 from fao.src.db.pipelines.base import BaseLookupETL
 from .geographic_levels_model import GeographicLevels
 
@@ -10,9 +10,10 @@ class GeographicLevelsETL(BaseLookupETL):
     
     def __init__(self):
         super().__init__(
-            csv_path=get_csv_path_for("synthetic_references/geographic_levels.csv"),
+            csv_path="synthetic_references/geographic_levels.csv",
             model_class=GeographicLevels,
             table_name="geographic_levels",
+            column_map={"geographic_level_code": "Geographic Level Code", "geographic_level": "Geographic Level", "source_dataset": "source_dataset"},
             hash_columns=["Geographic Level Code", "source_dataset"],
             pk_column="Geographic Level Code"
         )
@@ -28,22 +29,10 @@ class GeographicLevelsETL(BaseLookupETL):
         df['source_dataset'] = df['source_dataset'].astype(str).str.strip().str.replace("'", "")
         
         return df
-    
-    def build_record(self, row: pd.Series) -> dict:
-        """Build record for insertion"""
-        record = {}
-        record['geographic_level_code'] = row['Geographic Level Code']
-        record['geographic_level'] = row['Geographic Level']
-        record['source_dataset'] = row['source_dataset']
-        return record
 
 
-# Module-level functions for backwards compatibility
-etl = GeographicLevelsETL()
-load = etl.load
-clean = etl.clean
-insert = etl.insert
-run = etl.run
+# Module-level etl/load/clean/insert/run for backwards compatibility, built on first use
+__getattr__ = etl_module_getattr("geographic_levels")
 
 if __name__ == "__main__":
-    run_with_session(run)
\ No newline at end of file
+    run_with_session(get_etl("geographic_levels").run)
\ No newline at end of file
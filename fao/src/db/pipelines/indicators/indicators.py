@@ -1,6 +1,6 @@
 import pandas as pd
-from fao.src.db.utils import get_csv_path_for
 from fao.src.db.database import run_with_session
+from fao.src.db.pipelines.registry import etl_module_getattr, get_etl
 from fao.src.db.pipelines.base import BaseLookupETL
 from .indicators_model import Indicators
 
@@ -10,9 +10,10 @@ class IndicatorsETL(BaseLookupETL):
     
     def __init__(self):
         super().__init__(
-            csv_path=get_csv_path_for("synthetic_references/indicators.csv"),
+            csv_path="synthetic_references/indicators.csv",
             model_class=Indicators,
             table_name="indicators",
+            column_map={"indicator_code": "Indicator Code", "indicator": "Indicator", "source_dataset": "source_dataset"},
             hash_columns=["Indicator Code", "source_dataset"],
             pk_column="Indicator Code"
         )
@@ -28,22 +29,10 @@ class IndicatorsETL(BaseLookupETL):
         df['source_dataset'] = df['source_dataset'].astype(str).str.strip().str.replace("'", "")
         
         return df
-    
-    def build_record(self, row: pd.Series) -> dict:
-        """Build record for insertion"""
-        record = {}
-        record['indicator_code'] = row['Indicator Code']
-        record['indicator'] = row['Indicator']
-        record['source_dataset'] = row['source_dataset']
-        return record
 
 
-# Module-level functions for backwards compatibility
-etl = IndicatorsETL()
-load = etl.load
-clean = etl.clean
-insert = etl.insert
-run = etl.run
+# Module-level etl/load/clean/insert/run for backwards compatibility, built on first use
+__getattr__ = etl_module_getattr("indicators")
 
 if __name__ == "__main__":
-    run_with_session(run)
\ No newline at end of file
+    run_with_session(get_etl("indicators").run)
\ No newline at end of file
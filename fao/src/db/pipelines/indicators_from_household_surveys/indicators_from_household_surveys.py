@@ -1,6 +1,6 @@
 import pandas as pd
-from fao.src.db.utils import get_csv_path_for
 from fao.src.db.database import run_with_session
+from fao.src.db.pipelines.registry import etl_module_getattr, get_etl
 from fao.src.db.pipelines.base import BaseDatasetETL
 from .indicators_from_household_surveys_model import IndicatorsFromHouseholdSurveys
 
@@ -10,9 +10,10 @@ class IndicatorsFromHouseholdSurveysETL(BaseDatasetETL):
     
     def __init__(self):
         super().__init__(
-            csv_path=get_csv_path_for("Indicators_from_Household_Surveys_E_All_Data_(Normalized)/Indicators_from_Household_Surveys_E_All_Data_(Normalized).csv"),
+            csv_path="Indicators_from_Household_Surveys_E_All_Data_(Normalized)/Indicators_from_Household_Surveys_E_All_Data_(Normalized).csv",
             model_class=IndicatorsFromHouseholdSurveys,
             table_name="indicators_from_household_surveys",
+            column_map={"survey_code_id": "survey_code_id", "indicator_code_id": "indicator_code_id", "element_code_id": "element_code_id", "flag_id": "flag_id", "breakdown_variable_code": "Breakdown Variable Code", "breakdown_variable": "Breakdown Variable", "breadown_by_sex_of_the_household_head_code": "Breadown by Sex of the Household Head Code", "breadown_by_sex_of_the_household_head": "Breadown by Sex of the Household Head", "unit": "Unit", "value": "Value"},
             exclude_columns=["Element", "Element Code", "Flag", "Indicator", "Indicator Code", "Survey", "Survey Code"],
             foreign_keys=[{"csv_column_name": "Survey Code", "exception_func": "invalid_survey_code", "format_methods": [], "hash_columns": ["Survey Code", "source_dataset"], "hash_fk_csv_column_name": "Survey Code_id", "hash_fk_sql_column_name": "survey_code_id", "hash_pk_sql_column_name": "id", "index_hash": "87237df8_surveys", "model_name": "Surveys", "pipeline_name": "surveys", "reference_additional_columns": [], "reference_column_count": 3, "reference_description_column": "survey", "reference_pk_csv_column": "Survey Code", "sql_column_name": "survey_code", "table_name": "surveys", "validation_func": "is_valid_survey_code"}, {"csv_column_name": "Indicator Code", "exception_func": "invalid_indicator_code", "format_methods": [], "hash_columns": ["Indicator Code", "source_dataset"], "hash_fk_csv_column_name": "Indicator Code_id", "hash_fk_sql_column_name": "indicator_code_id", "hash_pk_sql_column_name": "id", "index_hash": "51eaa30f_indicators", "model_name": "Indicators", "pipeline_name": "indicators", "reference_additional_columns": [], "reference_column_count": 3, "reference_description_column": "indicator", "reference_pk_csv_column": "Indicator Code", "sql_column_name": "indicator_code", "table_name": "indicators", "validation_func": "is_valid_indicator_code"}, {"csv_column_name": "Element Code", "exception_func": "invalid_element_code", "format_methods": [], "hash_columns": ["Element Code", "source_dataset"], "hash_fk_csv_column_name": "Element Code_id", "hash_fk_sql_column_name": "element_code_id", "hash_pk_sql_column_name": "id", "index_hash": "9b156b86_elements", "model_name": "Elements", "pipeline_name": "elements", "reference_additional_columns": [], "reference_column_count": 3, "reference_description_column": "element", "reference_pk_csv_column": "Element Code", "sql_column_name": "element_code", "table_name": "elements", "validation_func": "is_valid_element_code"}, {"csv_column_name": "Flag", "exception_func": "invalid_flag", "format_methods": ["upper"], "hash_columns": ["Flag"], "hash_fk_csv_column_name": "Flag_id", "hash_fk_sql_column_name": "flag_id", "hash_pk_sql_column_name": "id", "index_hash": "9b974387_flags", "model_name": "Flags", "pipeline_name": "flags", "reference_additional_columns": [], "reference_column_count": 3, "reference_description_column": "description", "reference_pk_csv_column": "Flag", "sql_column_name": "flag", "table_name": "flags", "validation_func": "is_valid_flag"}]
         )
@@ -39,31 +40,10 @@ class IndicatorsFromHouseholdSurveysETL(BaseDatasetETL):
         df['Value'] = pd.to_numeric(df['Value'], errors='coerce')
         
         return df
-    
-    def build_record(self, row: pd.Series) -> dict:
-        """Build record for insertion"""
-        record = {}
-        # Foreign key columns
-        record['survey_code_id'] = row['survey_code_id']
-        record['indicator_code_id'] = row['indicator_code_id']
-        record['element_code_id'] = row['element_code_id']
-        record['flag_id'] = row['flag_id']
-        # Data columns
-        record['breakdown_variable_code'] = row['Breakdown Variable Code']
-        record['breakdown_variable'] = row['Breakdown Variable']
-        record['breadown_by_sex_of_the_household_head_code'] = row['Breadown by Sex of the Household Head Code']
-        record['breadown_by_sex_of_the_household_head'] = row['Breadown by Sex of the Household Head']
-        record['unit'] = row['Unit']
-        record['value'] = row['Value']
-        return record
 
 
-# Module-level functions for backwards compatibility
-etl = IndicatorsFromHouseholdSurveysETL()
-load = etl.load
-clean = etl.clean
-insert = etl.insert
-run = etl.run
+# Module-level etl/load/clean/insert/run for backwards compatibility, built on first use
+__getattr__ = etl_module_getattr("indicators_from_household_surveys")
 
 if __name__ == "__main__":
-    run_with_session(run)
\ No newline at end of file
+    run_with_session(get_etl("indicators_from_household_surveys").run)
\ No newline at end of file
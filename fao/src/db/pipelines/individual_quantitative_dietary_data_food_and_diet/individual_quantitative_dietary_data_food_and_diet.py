@@ -1,6 +1,6 @@
 import pandas as pd
-from fao.src.db.utils import get_csv_path_for
 from fao.src.db.database import run_with_session
+from fao.src.db.pipelines.registry import etl_module_getattr, get_etl
 from fao.src.db.pipelines.base import BaseDatasetETL
 from .individual_quantitative_dietary_data_food_and_diet_model import IndividualQuantitativeDietaryDataFoodAndDiet
 
@@ -10,9 +10,10 @@ class IndividualQuantitativeDietaryDataFoodAndDietETL(BaseDatasetETL):
     
     def __init__(self):
         super().__init__(
-            csv_path=get_csv_path_for("Individual_Quantitative_Dietary_Data_Food_and_Diet_E_All_Data_(Normalized)/Individual_Quantitative_Dietary_Data_Food_and_Diet_E_All_Data_(Normalized).csv"),
+            csv_path="Individual_Quantitative_Dietary_Data_Food_and_Diet_E_All_Data_(Normalized)/Individual_Quantitative_Dietary_Data_Food_and_Diet_E_All_Data_(Normalized).csv",
             model_class=IndividualQuantitativeDietaryDataFoodAndDiet,
             table_name="individual_quantitative_dietary_data_food_and_diet",
+            column_map={"survey_code_id": "survey_code_id", "geographic_level_code_id": "geographic_level_code_id", "population_age_group_code_id": "population_age_group_code_id", "food_group_code_id": "food_group_code_id", "indicator_code_id": "indicator_code_id", "element_code_id": "element_code_id", "sex_code_id": "sex_code_id", "flag_id": "flag_id", "unit": "Unit", "value": "Value", "note": "Note"},
             exclude_columns=["Element", "Element Code", "Flag", "Food Group", "Food Group Code", "Geographic Level", "Geographic Level Code", "Indicator", "Indicator Code", "Population Age Group", "Population Age Group Code", "Sex", "Sex Code", "Survey", "Survey Code"],
             foreign_keys=[{"csv_column_name": "Survey Code", "exception_func": "invalid_survey_code", "format_methods": [], "hash_columns": ["Survey Code", "source_dataset"], "hash_fk_csv_column_name": "Survey Code_id", "hash_fk_sql_column_name": "survey_code_id", "hash_pk_sql_column_name": "id", "index_hash": "1d679c90_surveys", "model_name": "Surveys", "pipeline_name": "surveys", "reference_additional_columns": [], "reference_column_count": 3, "reference_description_column": "survey", "reference_pk_csv_column": "Survey Code", "sql_column_name": "survey_code", "table_name": "surveys", "validation_func": "is_valid_survey_code"}, {"csv_column_name": "Geographic Level Code", "exception_func": "invalid_geographic_level_code", "format_methods": [], "hash_columns": ["Geographic Level Code", "source_dataset"], "hash_fk_csv_column_name": "Geographic Level Code_id", "hash_fk_sql_column_name": "geographic_level_code_id", "hash_pk_sql_column_name": "id", "index_hash": "ed8d6b2b_geographic_levels", "model_name": "GeographicLevels", "pipeline_name": "geographic_levels", "reference_additional_columns": [], "reference_column_count": 3, "reference_description_column": "geographic_level", "reference_pk_csv_column": "Geographic Level Code", "sql_column_name": "geographic_level_code", "table_name": "geographic_levels", "validation_func": "is_valid_geographic_level_code"}, {"csv_column_name": "Population Age Group Code", "exception_func": "invalid_population_age_group_code", "format_methods": [], "hash_columns": ["Population Age Group Code", "source_dataset"], "hash_fk_csv_column_name": "Population Age Group Code_id", "hash_fk_sql_column_name": "population_age_group_code_id", "hash_pk_sql_column_name": "id", "index_hash": "1db9d48c_population_age_groups", "model_name": "PopulationAgeGroups", "pipeline_name": "population_age_groups", "reference_additional_columns": [], "reference_column_count": 3, "reference_description_column": "population_age_group", "reference_pk_csv_column": "Population Age Group Code", "sql_column_name": "population_age_group_code", "table_name": "population_age_groups", "validation_func": "is_valid_population_age_group_code"}, {"csv_column_name": "Food Group Code", "exception_func": "invalid_food_group_code", "format_methods": [], "hash_columns": ["Food Group Code", "source_dataset"], "hash_fk_csv_column_name": "Food Group Code_id", "hash_fk_sql_column_name": "food_group_code_id", "hash_pk_sql_column_name": "id", "index_hash": "f81f71c5_food_groups", "model_name": "FoodGroups", "pipeline_name": "food_groups", "reference_additional_columns": [], "reference_column_count": 3, "reference_description_column": "food_group", "reference_pk_csv_column": "Food Group Code", "sql_column_name": "food_group_code", "table_name": "food_groups", "validation_func": "is_valid_food_group_code"}, {"csv_column_name": "Indicator Code", "exception_func": "invalid_indicator_code", "format_methods": [], "hash_columns": ["Indicator Code", "source_dataset"], "hash_fk_csv_column_name": "Indicator Code_id", "hash_fk_sql_column_name": "indicator_code_id", "hash_pk_sql_column_name": "id", "index_hash": "50544513_indicators", "model_name": "Indicators", "pipeline_name": "indicators", "reference_additional_columns": [], "reference_column_count": 3, "reference_description_column": "indicator", "reference_pk_csv_column": "Indicator Code", "sql_column_name": "indicator_code", "table_name": "indicators", "validation_func": "is_valid_indicator_code"}, {"csv_column_name": "Element Code", "exception_func": "invalid_element_code", "format_methods": [], "hash_columns": ["Element Code", "source_dataset"], "hash_fk_csv_column_name": "Element Code_id", "hash_fk_sql_column_name": "element_code_id", "hash_pk_sql_column_name": "id", "index_hash": "a6238604_elements", "model_name": "Elements", "pipeline_name": "elements", "reference_additional_columns": [], "reference_column_count": 3, "reference_description_column": "element", "reference_pk_csv_column": "Element Code", "sql_column_name": "element_code", "table_name": "elements", "validation_func": "is_valid_element_code"}, {"csv_column_name": "Sex Code", "exception_func": "invalid_sex_code", "format_methods": [], "hash_columns": ["Sex Code", "source_dataset"], "hash_fk_csv_column_name": "Sex Code_id", "hash_fk_sql_column_name": "sex_code_id", "hash_pk_sql_column_name": "id", "index_hash": "fb2dc96a_sexs", "model_name": "Sexs", "pipeline_name": "sexs", "reference_additional_columns": [], "reference_column_count": 3, "reference_description_column": "sex", "reference_pk_csv_column": "Sex Code", "sql_column_name": "sex_code", "table_name": "sexs", "validation_func": "is_valid_sex_code"}, {"csv_column_name": "Flag", "exception_func": "invalid_flag", "format_methods": ["upper"], "hash_columns": ["Flag"], "hash_fk_csv_column_name": "Flag_id", "hash_fk_sql_column_name": "flag_id", "hash_pk_sql_column_name": "id", "index_hash": "69979d9f_flags", "model_name": "Flags", "pipeline_name": "flags", "reference_additional_columns": [], "reference_column_count": 3, "reference_description_column": "description", "reference_pk_csv_column": "Flag", "sql_column_name": "flag", "table_name": "flags", "validation_func": "is_valid_flag"}]
         )
@@ -33,32 +34,10 @@ class IndividualQuantitativeDietaryDataFoodAndDietETL(BaseDatasetETL):
         df['Note'] = df['Note'].astype(str).str.strip().str.replace("'", "")
         
         return df
-    
-    def build_record(self, row: pd.Series) -> dict:
-        """Build record for insertion"""
-        record = {}
-        # Foreign key columns
-        record['survey_code_id'] = row['survey_code_id']
-        record['geographic_level_code_id'] = row['geographic_level_code_id']
-        record['population_age_group_code_id'] = row['population_age_group_code_id']
-        record['food_group_code_id'] = row['food_group_code_id']
-        record['indicator_code_id'] = row['indicator_code_id']
-        record['element_code_id'] = row['element_code_id']
-        record['sex_code_id'] = row['sex_code_id']
-        record['flag_id'] = row['flag_id']
-        # Data columns
-        record['unit'] = row['Unit']
-        record['value'] = row['Value']
-        record['note'] = row['Note']
-        return record
 
 
-# Module-level functions for backwards compatibility
-etl = IndividualQuantitativeDietaryDataFoodAndDietETL()
-load = etl.load
-clean = etl.clean
-insert = etl.insert
-run = etl.run
+# Module-level etl/load/clean/insert/run for backwards compatibility, built on first use
+__getattr__ = etl_module_getattr("individual_quantitative_dietary_data_food_and_diet")
 
 if __name__ == "__main__":
-    run_with_session(run)
\ No newline at end of file
+    run_with_session(get_etl("individual_quantitative_dietary_data_food_and_diet").run)
\ No newline at end of file
@@ -1,6 +1,6 @@
 import pandas as pd
-from fao.src.db.utils import get_csv_path_for
 from fao.src.db.database import run_with_session
+from fao.src.db.pipelines.registry import etl_module_getattr, get_etl
 from fao.src.db.pipelines.base import BaseLookupETL
 from .item_codes_model import ItemCodes
 
@@ -10,9 +10,10 @@ class ItemCodesETL(BaseLookupETL):
     
     def __init__(self):
         super().__init__(
-            csv_path=get_csv_path_for("synthetic_references/item_codes.csv"),
+            csv_path="synthetic_references/item_codes.csv",
             model_class=ItemCodes,
             table_name="item_codes",
+            column_map={"item_code": "Item Code", "item": "Item", "item_code_cpc": "Item Code (CPC)", "item_code_fbs": "Item Code (FBS)", "item_code_sdg": "Item Code (SDG)", "source_dataset": "source_dataset"},
             hash_columns=["Item Code", "source_dataset"],
             pk_column="Item Code"
         )
@@ -31,25 +32,10 @@ class ItemCodesETL(BaseLookupETL):
         df['source_dataset'] = df['source_dataset'].astype(str).str.strip().str.replace("'", "")
         
         return df
-    
-    def build_record(self, row: pd.Series) -> dict:
-        """Build record for insertion"""
-        record = {}
-        record['item_code'] = row['Item Code']
-        record['item'] = row['Item']
-        record['item_code_cpc'] = row['Item Code (CPC)']
-        record['item_code_fbs'] = row['Item Code (FBS)']
-        record['item_code_sdg'] = row['Item Code (SDG)']
-        record['source_dataset'] = row['source_dataset']
-        return record
 
 
-# Module-level functions for backwards compatibility
-etl = ItemCodesETL()
-load = etl.load
-clean = etl.clean
-insert = etl.insert
-run = etl.run
+# Module-level etl/load/clean/insert/run for backwards compatibility, built on first use
+__getattr__ = etl_module_getattr("item_codes")
 
 if __name__ == "__main__":
-    run_with_session(run)
\ No newline at end of file
+    run_with_session(get_etl("item_codes").run)
\ No newline at end of file
@@ -1,6 +1,6 @@
 import pandas as pd
-from fao.src.db.utils import get_csv_path_for
 from fao.src.db.database import run_with_session
+from fao.src.db.pipelines.registry import etl_module_getattr, get_etl
 from fao.src.db.pipelines.base import BaseLookupETL
 from .recipient_country_codes_model import RecipientCountryCodes
 
@@ -10,9 +10,10 @@ class RecipientCountryCodesETL(BaseLookupETL):
     
     def __init__(self):
         super().__init__(
-            csv_path=get_csv_path_for("synthetic_references/recipient_country_codes.csv"),
+            csv_path="synthetic_references/recipient_country_codes.csv",
             model_class=RecipientCountryCodes,
             table_name="recipient_country_codes",
+            column_map={"recipient_country_code": "Recipient Country Code", "recipient_country": "Recipient Country", "recipient_country_code_m49": "Recipient Country Code (M49)", "source_dataset": "source_dataset"},
             hash_columns=["Recipient Country Code", "source_dataset"],
             pk_column="Recipient Country Code"
         )
@@ -29,23 +30,10 @@ class RecipientCountryCodesETL(BaseLookupETL):
         df['source_dataset'] = df['source_dataset'].astype(str).str.strip().str.replace("'", "")
         
         return df
-    
-    def build_record(self, row: pd.Series) -> dict:
-        """Build record for insertion"""
-        record = {}
-        record['recipient_country_code'] = row['Recipient Country Code']
-        record['recipient_country'] = row['Recipient Country']
-        record['recipient_country_code_m49'] = row['Recipient Country Code (M49)']
-        record['source_dataset'] = row['source_dataset']
-        return record
 
 
-# Module-level functions for backwards compatibility
-etl = RecipientCountryCodesETL()
-load = etl.load
-clean = etl.clean
-insert = etl.insert
-run = etl.run
+# Module-level etl/load/clean/insert/run for backwards compatibility, built on first use
+__getattr__ = etl_module_getattr("recipient_country_codes")
 
 if __name__ == "__main__":
-    run_with_session(run)
\ No newline at end of file
+    run_with_session(get_etl("recipient_country_codes").run)
\ No newline at end of file
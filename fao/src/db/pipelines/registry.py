@@ -0,0 +1,146 @@
+# fao/src/db/pipelines/registry.py
+"""
+The ETL pipelines by name, each imported and built the first time it is used
+
+Importing a pipeline package, or this registry, does no filesystem work and
+builds no ETL: get_etl(name) imports the pipeline's module and builds its ETL
+once per process, and the ETL only locates its CSV when it first reads it.
+A pipeline module's `etl` (and its load/clean/insert/run) are still there
+for `from . import area_codes; area_codes.run(db)` - its module __getattr__
+asks the registry for them.
+
+load_models() imports every pipeline's model, for the code that needs the
+whole schema on Base.metadata (setup.py, schema_diff.py).
+"""
+import importlib
+from functools import cache
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from fao.src.db.pipelines.base import BaseETL
+
+# Every pipeline run_all_pipelines runs - the order they start in when nothing else decides it
+PIPELINES = [
+    "area_codes",
+    "reporter_country_codes",
+    "partner_country_codes",
+    "recipient_country_codes",
+    "item_codes",
+    "elements",
+    "flags",
+    "currencies",
+    "sources",
+    "releases",
+    "sexs",
+    "indicators",
+    "population_age_groups",
+    "surveys",
+    "purposes",
+    "donors",
+    "food_groups",
+    "geographic_levels",
+    "food_values",
+    "industries",
+    "factors",
+    "aquastat",
+    "asti_expenditures",
+    "asti_researchers",
+    "climate_change_emissions_indicators",
+    "commodity_balances_non_food_2013_old_methodology",
+    "commodity_balances_non_food_2010",
+    "consumer_price_indices",
+    "cost_affordability_healthy_diet_co_ahd",
+    "deflators",
+    "development_assistance_to_agriculture",
+    "emissions_agriculture_energy",
+    "emissions_crops",
+    "emissions_drained_organic_soils",
+    "emissions_land_use_fires",
+    "emissions_land_use_forests",
+    "emissions_livestock",
+    "emissions_pre_post_production",
+    "emissions_totals",
+    "employment_indicators_agriculture",
+    "employment_indicators_rural",
+    "environment_bioenergy",
+    "environment_cropland_nutrient_budget",
+    "environment_emissions_intensities",
+    "environment_land_cover",
+    "environment_livestock_manure",
+    "environment_livestock_patterns",
+    "environment_temperature_change",
+    "exchange_rate",
+    "fertilizers_detailed_trade_matrix",
+    "food_balance_sheets_historic",
+    "food_balance_sheets",
+    "food_aid_shipments_wfp",
+    "food_security_data",
+    "forestry",
+    "forestry_pulp_paper_survey",
+    "forestry_trade_flows",
+    "household_consumption_and_expenditure_surveys_food_and_diet",
+    "indicators_from_household_surveys",
+    "individual_quantitative_dietary_data_food_and_diet",
+    "inputs_fertilizers_archive",
+    "inputs_fertilizers_nutrient",
+    "inputs_fertilizers_product",
+    "inputs_land_use",
+    "inputs_pesticides_trade",
+    "inputs_pesticides_use",
+    "investment_capital_stock",
+    "investment_country_investment_statistics_profile",
+    "investment_credit_agriculture",
+    "investment_foreign_direct_investment",
+    "investment_government_expenditure",
+    "investment_machinery_archive",
+    "investment_machinery",
+    "macro_statistics_key_indicators",
+    "minimum_dietary_diversity_for_women_mdd_w_food_and_diet",
+    "population",
+    "prices_archive",
+    "prices",
+    "production_crops_livestock",
+    "production_indices",
+    "sdg_bulk_downloads",
+    "sua_crops_livestock",
+    "supply_utilization_accounts_food_and_diet",
+    "trade_crops_livestock_indicators",
+    "trade_crops_livestock",
+    "trade_detailed_trade_matrix",
+    "trade_indices",
+    "value_of_production",
+    "value_shares_industry_primary_factors",
+    "world_census_agriculture",
+]
+
+# What a pipeline module used to build at import
+ETL_ATTRIBUTES = ("etl", "load", "clean", "insert", "run")
+
+
+def etl_class_name(name: str) -> str:
+    """area_codes → AreaCodesETL"""
+    return "".join(part.capitalize() for part in name.split("_")) + "ETL"
+
+
+@cache
+def get_etl(name: str) -> "BaseETL":
+    module = importlib.import_module(f"fao.src.db.pipelines.{name}.{name}")
+    return getattr(module, etl_class_name(name))()
+
+
+def etl_module_getattr(name: str) -> Callable[[str], Any]:
+    """__getattr__ for pipeline `name`'s module: its etl, and the etl's load/clean/insert/run"""
+
+    def __getattr__(attribute: str) -> Any:
+        if attribute not in ETL_ATTRIBUTES:
+            raise AttributeError(f"module 'fao.src.db.pipelines.{name}.{name}' has no attribute {attribute!r}")
+        etl = get_etl(name)
+        return etl if attribute == "etl" else getattr(etl, attribute)
+
+    return __getattr__
+
+
+def load_models() -> None:
+    """Import every pipeline's model, registering its table on Base.metadata"""
+    for name in PIPELINES:
+        importlib.import_module(f"fao.src.db.pipelines.{name}.{name}_model")
@@ -1,6 +1,6 @@
 import pandas as pd
-from fao.src.db.utils import get_csv_path_for
 from fao.src.db.database import run_with_session
+from fao.src.db.pipelines.registry import etl_module_getattr, get_etl
 from fao.src.db.pipelines.base import BaseLookupETL
 from .releases_model import Releases
 
@@ -10,9 +10,10 @@ class ReleasesETL(BaseLookupETL):
     
     def __init__(self):
         super().__init__(
-            csv_path=get_csv_path_for("synthetic_references/releases.csv"),
+            csv_path="synthetic_references/releases.csv",
             model_class=Releases,
             table_name="releases",
+            column_map={"release_code": "Release Code", "release": "Release", "source_dataset": "source_dataset"},
             hash_columns=["Release Code", "source_dataset"],
             pk_column="Release Code"
         )
@@ -28,22 +29,10 @@ class ReleasesETL(BaseLookupETL):
         df['source_dataset'] = df['source_dataset'].astype(str).str.strip().str.replace("'", "")
         
         return df
-    
-    def build_record(self, row: pd.Series) -> dict:
-        """Build record for insertion"""
-        record = {}
-        record['release_code'] = row['Release Code']
-        record['release'] = row['Release']
-        record['source_dataset'] = row['source_dataset']
-        return record
 
 
-# Module-level functions for backwards compatibility
-etl = ReleasesETL()
-load = etl.load
-clean = etl.clean
-insert = etl.insert
-run = etl.run
+# Module-level etl/load/clean/insert/run for backwards compatibility, built on first use
+__getattr__ = etl_module_getattr("releases")
 
 if __name__ == "__main__":
-    run_with_session(run)
\ No newline at end of file
+    run_with_session(get_etl("releases").run)
\ No newline at end of file
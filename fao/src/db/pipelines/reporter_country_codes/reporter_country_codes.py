@@ -1,6 +1,6 @@
 import pandas as pd
-from fao.src.db.utils import get_csv_path_for
 from fao.src.db.database import run_with_session
+from fao.src.db.pipelines.registry import etl_module_getattr, get_etl
 from fao.src.db.pipelines.base import BaseLookupETL
 from .reporter_country_codes_model import ReporterCountryCodes
 
@@ -10,9 +10,10 @@ class ReporterCountryCodesETL(BaseLookupETL):
     
     def __init__(self):
         super().__init__(
-            csv_path=get_csv_path_for("synthetic_references/reporter_country_codes.csv"),
+            csv_path="synthetic_references/reporter_country_codes.csv",
             model_class=ReporterCountryCodes,
             table_name="reporter_country_codes",
+            column_map={"reporter_country_code": "Reporter Country Code", "reporter_countries": "Reporter Countries", "reporter_country_code_m49": "Reporter Country Code (M49)", "source_dataset": "source_dataset"},
             hash_columns=["Reporter Country Code", "source_dataset"],
             pk_column="Reporter Country Code"
         )
@@ -29,23 +30,10 @@ class ReporterCountryCodesETL(BaseLookupETL):
         df['source_dataset'] = df['source_dataset'].astype(str).str.strip().str.replace("'", "")
         
         return df
-    
-    def build_record(self, row: pd.Series) -> dict:
-        """Build record for insertion"""
-        record = {}
-        record['reporter_country_code'] = row['Reporter Country Code']
-        record['reporter_countries'] = row['Reporter Countries']
-        record['reporter_country_code_m49'] = row['Reporter Country Code (M49)']
-        record['source_dataset'] = row['source_dataset']
-        return record
 
 
-# Module-level functions for backwards compatibility
-etl = ReporterCountryCodesETL()
-load = etl.load
-clean = etl.clean
-insert = etl.insert
-run = etl.run
+# Module-level etl/load/clean/insert/run for backwards compatibility, built on first use
+__getattr__ = etl_module_getattr("reporter_country_codes")
 
 if __name__ == "__main__":
-    run_with_session(run)
\ No newline at end of file
+    run_with_session(get_etl("reporter_country_codes").run)
\ No newline at end of file
@@ -0,0 +1,177 @@
+# fao/src/db/pipelines/scheduler.py
+"""
+Dependency-aware parallel runner for the ETL pipelines
+
+Each pipeline depends on the pipelines its ETL's foreign_keys point at (a
+dataset on area_codes, item_codes, flags, ...). Pipelines run as soon as
+everything they depend on has completed, up to `max_workers` at a time, each
+in its own process with its own session - so the lookups load first and the
+datasets then load side by side.
+
+A pipeline whose dependency fails is skipped, the rest keep running. Each
+run's start, finish, duration and error are recorded on its pipeline_progress
+row next to the row counts the ETL itself keeps. A completed pipeline runs
+again only when its CSV's ZIP member has changed since (see BaseETL.start_run),
+and only the materialized views built from tables whose rows changed are
+refreshed afterwards.
+"""
+import importlib
+import multiprocessing
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
+
+from sqlalchemy import func, text
+from sqlalchemy.orm import Session
+
+from fao.logger import logger
+from fao.src.db.pipelines.registry import get_etl
+from fao.src.db.system_models import PipelineProgress
+from fao.src.db.views import views_reading
+
+
+@dataclass
+class PipelineRunSummary:
+    already_completed: List[str] = field(default_factory=list)
+    completed: List[str] = field(default_factory=list)
+    failed: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    # Completed pipelines that inserted, updated or deleted rows
+    changed: List[str] = field(default_factory=list)
+
+
+def pipeline_dependencies(names: List[str]) -> Dict[str, Set[str]]:
+    """Pipelines each pipeline has to wait for: the tables its foreign keys reference"""
+    dependencies = {}
+    for name in names:
+        etl = get_etl(name)
+        referenced = {fk["pipeline_name"] for fk in getattr(etl, "foreign_keys", [])}
+        missing = referenced.difference(names)
+        if missing:
+            logger.warning(f"{name} references {sorted(missing)}, which have no pipeline - not waiting for them")
+        dependencies[name] = referenced.intersection(names)
+    check_acyclic(dependencies)
+    return dependencies
+
+
+def check_acyclic(dependencies: Dict[str, Set[str]]) -> None:
+    remaining = {name: set(depends_on) for name, depends_on in dependencies.items()}
+    while remaining:
+        ready = [name for name, depends_on in remaining.items() if not depends_on]
+        if not ready:
+            raise ValueError(f"Pipeline dependency cycle between {sorted(remaining)}")
+        for name in ready:
+            del remaining[name]
+        for depends_on in remaining.values():
+            depends_on.difference_update(ready)
+
+
+def run_pipeline(name: str) -> int:
+    """Worker process entry point: run one pipeline with its own session. Returns the rows it changed."""
+    from fao.src.db.database import run_with_session
+
+    runner = importlib.import_module(f"fao.src.db.pipelines.{name}.__main__").run_all
+    run_with_session(runner)
+    # run_all ran the registry's etl - the same instance
+    return get_etl(name).rows_changed
+
+
+def record_start(db: Session, name: str) -> None:
+    progress = db.query(PipelineProgress).filter_by(table_name=name).first()
+    if progress is None:
+        progress = PipelineProgress(table_name=name, last_row_processed=0)
+        db.add(progress)
+    elif progress.status != "completed":
+        if progress.last_row_processed:
+            print(f"🔄 Resuming {name} from row {progress.last_row_processed:,}/{progress.total_rows or 0:,}")
+        # A failed run resumes from its last committed chunk
+        progress.status = "in_progress"
+    # else its CSV changed - left completed so the ETL reloads it (BaseETL.start_run)
+    progress.started_at = func.now()
+    progress.finished_at = None
+    progress.duration_seconds = None
+    progress.error = None
+    db.commit()
+
+
+def record_finish(db: Session, name: str, seconds: float, error: Optional[BaseException] = None) -> None:
+    progress = db.query(PipelineProgress).filter_by(table_name=name).one()
+    progress.status = "failed" if error else "completed"
+    progress.finished_at = func.now()
+    progress.duration_seconds = round(seconds, 3)
+    progress.error = f"{type(error).__name__}: {error}" if error else None
+    db.commit()
+
+
+def run_pipelines(
+    db: Session, names: List[str], dependencies: Dict[str, Set[str]], max_workers: int
+) -> PipelineRunSummary:
+    """Run every pipeline in `names` that hasn't completed from its current CSV, in dependency order,
+    `max_workers` at a time"""
+    summary = PipelineRunSummary()
+    completed = set()
+    for progress in db.query(PipelineProgress).filter(PipelineProgress.table_name.in_(names)).all():
+        if progress.status == "completed" and get_etl(progress.table_name).source_unchanged(db):
+            print(f"✅ Skipping {progress.table_name} - already completed ({progress.total_rows or 0:,} rows)")
+            completed.add(progress.table_name)
+            summary.already_completed.append(progress.table_name)
+
+    pending = [name for name in names if name not in completed]
+    running = {}
+
+    # spawn: workers must not inherit the parent's engine and its open connections
+    context = multiprocessing.get_context("spawn")
+    # One pipeline per worker process, so each dataset's memory is returned when it finishes
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=context, max_tasks_per_child=1) as pool:
+        while pending or running:
+            blocked = set(summary.failed) | set(summary.skipped)
+            for name in list(pending):
+                if dependencies[name] & blocked:
+                    logger.warning(f"⏭️  Skipping {name} - depends on {sorted(dependencies[name] & blocked)}")
+                    pending.remove(name)
+                    summary.skipped.append(name)
+                    blocked.add(name)
+
+            ready = [name for name in pending if dependencies[name] <= completed]
+            for name in ready[: max_workers - len(running)]:
+                print(f"🆕 Starting {name}")
+                pending.remove(name)
+                record_start(db, name)
+                running[pool.submit(run_pipeline, name)] = (name, time.perf_counter())
+
+            if not running:
+                continue
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name, started = running.pop(future)
+                seconds = time.perf_counter() - started
+                error = future.exception()
+                record_finish(db, name, seconds, error)
+                if error:
+                    logger.error(f"❌ {name} failed after {seconds:,.1f}s: {error}")
+                    summary.failed.append(name)
+                else:
+                    logger.info(f"✅ {name} finished in {seconds:,.1f}s")
+                    completed.add(name)
+                    summary.completed.append(name)
+                    if future.result():
+                        summary.changed.append(name)
+
+    return summary
+
+
+def refresh_views_reading(db: Session, tables: List[str]) -> List[str]:
+    """Refresh the materialized views built from `tables`, leaving the rest. Returns the views refreshed."""
+    existing = set(db.execute(text("SELECT matviewname FROM pg_matviews")).scalars())
+    refreshed = []
+    for name in views_reading(tables):
+        if name not in existing:
+            continue
+        logger.info(f"Refreshing materialized view {name}...")
+        db.execute(text("SET LOCAL statement_timeout = '30min'"))
+        db.execute(text(f"REFRESH MATERIALIZED VIEW {name}"))
+        db.commit()
+        refreshed.append(name)
+    return refreshed
@@ -1,6 +1,6 @@
 import pandas as pd
-from fao.src.db.utils import get_csv_path_for
 from fao.src.db.database import run_with_session
+from fao.src.db.pipelines.registry import etl_module_getattr, get_etl
 from fao.src.db.pipelines.base import BaseLookupETL
 from .sexs_model import Sexs
 
@@ -10,9 +10,10 @@ class SexsETL(BaseLookupETL):
     
     def __init__(self):
         super().__init__(
-            csv_path=get_csv_path_for("synthetic_references/sexs.csv"),
+            csv_path="synthetic_references/sexs.csv",
             model_class=Sexs,
             table_name="sexs",
+            column_map={"sex_code": "Sex Code", "sex": "Sex", "source_dataset": "source_dataset"},
             hash_columns=["Sex Code", "source_dataset"],
             pk_column="Sex Code"
         )
@@ -28,22 +29,10 @@ class SexsETL(BaseLookupETL):
         df['source_dataset'] = df['source_dataset'].astype(str).str.strip().str.replace("'", "")
         
         return df
-    
-    def build_record(self, row: pd.Series) -> dict:
-        """Build record for insertion"""
-        record = {}
-        record['sex_code'] = row['Sex Code']
-        record['sex'] = row['Sex']
-        record['source_dataset'] = row['source_dataset']
-        return record
 
 
-# Module-level functions for backwards compatibility
-etl = SexsETL()
-load = etl.load
-clean = etl.clean
-insert = etl.insert
-run = etl.run
+# Module-level etl/load/clean/insert/run for backwards compatibility, built on first use
+__getattr__ = etl_module_getattr("sexs")
 
 if __name__ == "__main__":
-    run_with_session(run)
\ No newline at end of file
+    run_with_session(get_etl("sexs").run)
\ No newline at end of file
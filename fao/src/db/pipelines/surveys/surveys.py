@@ -1,6 +1,6 @@
 import pandas as pd
-from fao.src.db.utils import get_csv_path_for
 from fao.src.db.database import run_with_session
+from fao.src.db.pipelines.registry import etl_module_getattr, get_etl
 from fao.src.db.pipelines.base import BaseLookupETL
 from .surveys_model import Surveys
 
@@ -10,9 +10,10 @@ class SurveysETL(BaseLookupETL):
     
     def __init__(self):
         super().__init__(
-            csv_path=get_csv_path_for("synthetic_references/surveys.csv"),
+            csv_path="synthetic_references/surveys.csv",
             model_class=Surveys,
             table_name="surveys",
+            column_map={"survey_code": "Survey Code", "survey": "Survey", "source_dataset": "source_dataset"},
             hash_columns=["Survey Code", "source_dataset"],
             pk_column="Survey Code"
         )
@@ -28,22 +29,10 @@ class SurveysETL(BaseLookupETL):
         df['source_dataset'] = df['source_dataset'].astype(str).str.strip().str.replace("'", "")
         
         return df
-    
-    def build_record(self, row: pd.Series) -> dict:
-        """Build record for insertion"""
-        record = {}
-        record['survey_code'] = row['Survey Code']
-        record['survey'] = row['Survey']
-        record['source_dataset'] = row['source_dataset']
-        return record
 
 
-# Module-level functions for backwards compatibility
-etl = SurveysETL()
-load = etl.load
-clean = etl.clean
-insert = etl.insert
-run = etl.run
+# Module-level etl/load/clean/insert/run for backwards compatibility, built on first use
+__getattr__ = etl_module_getattr("surveys")
 
 if __name__ == "__main__":
-    run_with_session(run)
\ No newline at end of file
+    run_with_session(get_etl("surveys").run)
\ No newline at end of file
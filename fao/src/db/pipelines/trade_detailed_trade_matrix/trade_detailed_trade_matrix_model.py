@@ -11,12 +11,13 @@ from sqlalchemy import (
     func,
 )
 from fao.src.db.database import Base
+from fao.src.db.partitioning import partitioned_by_year
 
 
 class TradeDetailedTradeMatrix(Base):
     __tablename__ = "trade_detailed_trade_matrix"
      # Dataset table - use auto-increment id
-    id = Column(Integer, primary_key=True)
+    id = Column(Integer, primary_key=True, autoincrement=True)
     # Foreign key to reporter_country_codes
     reporter_country_code_id = Column(Integer, ForeignKey("reporter_country_codes.id"), index=True)
     # Foreign key to partner_country_codes
@@ -28,12 +29,16 @@ class TradeDetailedTradeMatrix(Base):
     # Foreign key to flags
     flag_id = Column(Integer, ForeignKey("flags.id"), index=True)
     year_code = Column(String(8), nullable=False, index=False)
-    year = Column(SmallInteger, nullable=False, index=True)
+    # Partition key - has to be part of the primary key
+    year = Column(SmallInteger, primary_key=True, nullable=False, index=True)
     unit = Column(String(50), nullable=False, index=False)
     value = Column(Float, nullable=False, index=False)
    
     created_at = Column(DateTime, default=func.now(), nullable=False)
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
+
+    # Range partitioned by year, see fao/src/db/partitioning.py
+    __table_args__ = partitioned_by_year(__tablename__)
     
     #     #         #         #             #         #             #         #             #         #             #         #             #         #         #             #         #         #         #         #             #             
     #         # __table_args__ = (
@@ -1,6 +1,6 @@
 import pandas as pd
-from fao.src.db.utils import get_csv_path_for
 from fao.src.db.database import run_with_session
+from fao.src.db.pipelines.registry import etl_module_getattr, get_etl
 from fao.src.db.pipelines.base import BaseDatasetETL
 from .value_shares_industry_primary_factors_model import ValueSharesIndustryPrimaryFactors
 
@@ -10,9 +10,10 @@ class ValueSharesIndustryPrimaryFactorsETL(BaseDatasetETL):
     
     def __init__(self):
         super().__init__(
-            csv_path=get_csv_path_for("Value_shares_industry_primary_factors_E_All_Data_(Normalized)/Value_shares_industry_primary_factors_E_All_Data_(Normalized).csv"),
+            csv_path="Value_shares_industry_primary_factors_E_All_Data_(Normalized)/Value_shares_industry_primary_factors_E_All_Data_(Normalized).csv",
             model_class=ValueSharesIndustryPrimaryFactors,
             table_name="value_shares_industry_primary_factors",
+            column_map={"area_code_id": "area_code_id", "food_value_code_id": "food_value_code_id", "industry_code_id": "industry_code_id", "factor_code_id": "factor_code_id", "element_code_id": "element_code_id", "flag_id": "flag_id", "year_code": "Year Code", "year": "Year", "unit": "Unit", "value": "Value"},
             exclude_columns=["Area", "Area Code", "Area Code (M49)", "Element", "Element Code", "Factor", "Factor Code", "Flag", "Food Value", "Food Value Code", "Industry", "Industry Code"],
             foreign_keys=[{"csv_column_name": "Area Code", "exception_func": "invalid_area_code", "format_methods": [], "hash_columns": ["Area Code", "source_dataset"], "hash_fk_csv_column_name": "Area Code_id", "hash_fk_sql_column_name": "area_code_id", "hash_pk_sql_column_name": "id", "index_hash": "2b9877fb_area_codes", "model_name": "AreaCodes", "pipeline_name": "area_codes", "reference_additional_columns": ["area_code_m49"], "reference_column_count": 4, "reference_description_column": "area", "reference_pk_csv_column": "Area Code", "sql_column_name": "area_code", "table_name": "area_codes", "validation_func": "is_valid_area_code"}, {"csv_column_name": "Food Value Code", "exception_func": "invalid_food_value_code", "format_methods": [], "hash_columns": ["Food Value Code", "source_dataset"], "hash_fk_csv_column_name": "Food Value Code_id", "hash_fk_sql_column_name": "food_value_code_id", "hash_pk_sql_column_name": "id", "index_hash": "51b8893d_food_values", "model_name": "FoodValues", "pipeline_name": "food_values", "reference_additional_columns": [], "reference_column_count": 3, "reference_description_column": "food_value", "reference_pk_csv_column": "Food Value Code", "sql_column_name": "food_value_code", "table_name": "food_values", "validation_func": "is_valid_food_value_code"}, {"csv_column_name": "Industry Code", "exception_func": "invalid_industry_code", "format_methods": [], "hash_columns": ["Industry Code", "source_dataset"], "hash_fk_csv_column_name": "Industry Code_id", "hash_fk_sql_column_name": "industry_code_id", "hash_pk_sql_column_name": "id", "index_hash": "58bbf6e1_industries", "model_name": "Industries", "pipeline_name": "industries", "reference_additional_columns": [], "reference_column_count": 3, "reference_description_column": "industry", "reference_pk_csv_column": "Industry Code", "sql_column_name": "industry_code", "table_name": "industries", "validation_func": "is_valid_industry_code"}, {"csv_column_name": "Factor Code", "exception_func": "invalid_factor_code", "format_methods": [], "hash_columns": ["Factor Code", "source_dataset"], "hash_fk_csv_column_name": "Factor Code_id", "hash_fk_sql_column_name": "factor_code_id", "hash_pk_sql_column_name": "id", "index_hash": "14dacc25_factors", "model_name": "Factors", "pipeline_name": "factors", "reference_additional_columns": [], "reference_column_count": 3, "reference_description_column": "factor", "reference_pk_csv_column": "Factor Code", "sql_column_name": "factor_code", "table_name": "factors", "validation_func": "is_valid_factor_code"}, {"csv_column_name": "Element Code", "exception_func": "invalid_element_code", "format_methods": [], "hash_columns": ["Element Code", "source_dataset"], "hash_fk_csv_column_name": "Element Code_id", "hash_fk_sql_column_name": "element_code_id", "hash_pk_sql_column_name": "id", "index_hash": "8f579a71_elements", "model_name": "Elements", "pipeline_name": "elements", "reference_additional_columns": [], "reference_column_count": 3, "reference_description_column": "element", "reference_pk_csv_column": "Element Code", "sql_column_name": "element_code", "table_name": "elements", "validation_func": "is_valid_element_code"}, {"csv_column_name": "Flag", "exception_func": "invalid_flag", "format_methods": ["upper"], "hash_columns": ["Flag"], "hash_fk_csv_column_name": "Flag_id", "hash_fk_sql_column_name": "flag_id", "hash_pk_sql_column_name": "id", "index_hash": "46cf6cfc_flags", "model_name": "Flags", "pipeline_name": "flags", "reference_additional_columns": [], "reference_column_count": 3, "reference_description_column": "description", "reference_pk_csv_column": "Flag", "sql_column_name": "flag", "table_name": "flags", "validation_func": "is_valid_flag"}]
         )
@@ -35,31 +36,10 @@ class ValueSharesIndustryPrimaryFactorsETL(BaseDatasetETL):
         df['Value'] = pd.to_numeric(df['Value'], errors='coerce')
         
         return df
-    
-    def build_record(self, row: pd.Series) -> dict:
-        """Build record for insertion"""
-        record = {}
-        # Foreign key columns
-        record['area_code_id'] = row['area_code_id']
-        record['food_value_code_id'] = row['food_value_code_id']
-        record['industry_code_id'] = row['industry_code_id']
-        record['factor_code_id'] = row['factor_code_id']
-        record['element_code_id'] = row['element_code_id']
-        record['flag_id'] = row['flag_id']
-        # Data columns
-        record['year_code'] = row['Year Code']
-        record['year'] = row['Year']
-        record['unit'] = row['Unit']
-        record['value'] = row['Value']
-        return record
 
 
-# Module-level functions for backwards compatibility
-etl = ValueSharesIndustryPrimaryFactorsETL()
-load = etl.load
-clean = etl.clean
-insert = etl.insert
-run = etl.run
+# Module-level etl/load/clean/insert/run for backwards compatibility, built on first use
+__getattr__ = etl_module_getattr("value_shares_industry_primary_factors")
 
 if __name__ == "__main__":
-    run_with_session(run)
\ No newline at end of file
+    run_with_session(get_etl("value_shares_industry_primary_factors").run)
\ No newline at end of file
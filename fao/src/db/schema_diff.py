@@ -6,7 +6,9 @@ from sqlalchemy import create_engine
 from fao.logger import logger
 from fao.src.db.database import Base, DATABASE_URL
 from fao.src.db.system_models import *
-from fao.all_model_imports import *
+from fao.src.db.pipelines.registry import load_models
+
+load_models()
 
 
 def schema_diff():
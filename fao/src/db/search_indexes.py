@@ -0,0 +1,69 @@
+# fao/src/db/search_indexes.py
+"""
+Index plan for the text ("like") filters on lookup name columns
+
+Every dataset endpoint exposes its lookups' name columns (area, item, element,
+description, ...) as text filters that reach the lookup through a join. Each
+such column gets:
+
+- a pg_trgm GIN index, which serves the default contains match (ILIKE '%v%')
+- a btree on lower(column) text_pattern_ops, which serves match=prefix
+  (lower(column) LIKE 'v%') and match=exact (lower(column) = 'v')
+
+The plan is derived from the router configs and written to
+views/_create_search_indexes.sql, next to the materialized view indexes.
+Regenerate it after adding datasets:
+
+    python -m fao.src.db.search_indexes
+"""
+from pathlib import Path
+from typing import List, Tuple
+
+from fao.logger import logger
+
+SEARCH_INDEXES_PATH = Path(__file__).parent / "views" / "_create_search_indexes.sql"
+
+
+def collect_search_columns() -> List[Tuple[str, str]]:
+    """(lookup table, column) for every joined text filter in the router configs"""
+    from fao.src.api.utils.config_registry import load_router_configs
+
+    columns = set()
+    for config in load_router_configs():
+        for filter_config in config.filter_configs:
+            if filter_config["filter_type"] == "like" and filter_config.get("joins_table"):
+                columns.add((filter_config["filter_model"].__tablename__, filter_config["filter_column"]))
+    return sorted(columns)
+
+
+def build_search_index_sql(columns: List[Tuple[str, str]]) -> str:
+    lines = [
+        "-- Generated by python -m fao.src.db.search_indexes - do not edit by hand",
+        "-- Text filter indexes on lookup name columns",
+        "",
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm;",
+    ]
+    current_table = None
+    for table, column in columns:
+        if table != current_table:
+            lines += ["", f"-- {table}"]
+            current_table = table
+        lines.append(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_{table}_{column}_trgm "
+            f"ON {table} USING gin ({column} gin_trgm_ops);"
+        )
+        lines.append(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_{table}_{column}_lower "
+            f"ON {table} (lower({column}) text_pattern_ops);"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def write_search_index_sql(path: Path = SEARCH_INDEXES_PATH) -> None:
+    columns = collect_search_columns()
+    path.write_text(build_search_index_sql(columns))
+    logger.info(f"Wrote {len(columns) * 2} indexes on {len(columns)} lookup columns to {path}")
+
+
+if __name__ == "__main__":
+    write_search_index_sql()
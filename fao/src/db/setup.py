@@ -1,10 +1,20 @@
 # scripts/init_db.py
 from sqlalchemy import create_engine, text, inspect
+from sqlalchemy.schema import CreateTable
 from fao.logger import logger
 from fao.src.db.database import Base, DATABASE_URL
-from fao.all_model_imports import *
+from fao.src.db.pipelines.registry import load_models
 from fao.src.db.system_models import *
-from fao.src.db.views import ALL_VIEWS, ALL_DROP_VIEWS, refresh_views_sql, create_view_indexes_sql
+from fao.src.db.partitioning import PARTITIONED_DATASETS, get_year_partitions
+from fao.src.db.views import (
+    ALL_VIEWS,
+    ALL_DROP_VIEWS,
+    refresh_views_sql,
+    create_view_indexes_sql,
+    create_search_indexes_sql,
+)
+
+load_models()
 
 
 def create_views(engine):
@@ -33,9 +43,20 @@ def create_views(engine):
 
     # Then create indexes with CONCURRENTLY (requires autocommit)
     print("Creating indexes (this may take a few minutes)...")
+    create_indexes(engine, create_view_indexes_sql)
+
+
+def create_search_indexes(engine):
+    """Create the trigram and lower() indexes behind the text filters (see search_indexes.py)"""
+    logger.info("Creating text filter indexes...")
+    create_indexes(engine, create_search_indexes_sql)
+
+
+def create_indexes(engine, indexes_sql: str):
+    """Run a file of CREATE INDEX CONCURRENTLY statements, one at a time"""
     with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
         # Split the SQL file into individual statements
-        statements = create_view_indexes_sql.split(";")
+        statements = indexes_sql.split(";")
 
         for statement in statements:
             statement = statement.strip()
@@ -83,6 +104,92 @@ def update_database(engine):
     if new_tables:
         logger.info(f"Created tables: {new_tables}")
 
+    add_missing_columns(engine)
+
+
+def add_missing_columns(engine):
+    """Add model columns that existing tables don't have yet (create_all only creates whole tables).
+
+    Only nullable columns are added - existing rows get NULL, as the code
+    reading them expects (e.g. pipeline_progress.source_signature). Anything
+    else needs a data migration and is only reported.
+    """
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table_name, table in Base.metadata.tables.items():
+            if not inspector.has_table(table_name):
+                continue
+            existing = {column["name"] for column in inspector.get_columns(table_name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                if not column.nullable and column.server_default is None:
+                    logger.warning(f"{table_name}.{column.name} is missing and NOT NULL - add it by hand")
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                conn.execute(text(f'ALTER TABLE {table_name} ADD COLUMN IF NOT EXISTS "{column.name}" {column_type}'))
+                logger.info(f"Added column {table_name}.{column.name} ({column_type})")
+
+
+def partition_tables(engine):
+    """Convert existing tables listed in PARTITIONED_DATASETS to year partitioned tables, keeping their rows.
+
+    Each table is renamed out of the way, recreated partitioned, copied over and
+    dropped in one transaction. Indexes are built after the copy; indexes added
+    outside the models (index_advisor) go with the old table and need recreating.
+    """
+    for table_name in PARTITIONED_DATASETS:
+        table = Base.metadata.tables[table_name]
+
+        with engine.begin() as conn:
+            relkind = conn.execute(
+                text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:table_name)"), {"table_name": table_name}
+            ).scalar()
+            if relkind is None:
+                logger.info(f"{table_name} doesn't exist yet, creating it partitioned")
+                table.create(conn)
+                continue
+            if relkind == "p":
+                logger.info(f"{table_name} is already partitioned, skipping")
+                continue
+
+            old_name = f"{table_name}_unpartitioned"
+            logger.info(f"Partitioning {table_name} by year...")
+            conn.execute(text(f"ALTER TABLE {table_name} RENAME TO {old_name}"))
+
+            # Indexes and the id sequence keep their names through a rename - move them aside too
+            index_names = conn.execute(
+                text("SELECT indexname FROM pg_indexes WHERE tablename = :table_name"), {"table_name": old_name}
+            ).scalars()
+            for index_name in list(index_names):
+                conn.execute(text(f'ALTER INDEX "{index_name}" RENAME TO "{index_name[:55]}_unpart"'))
+            sequence = conn.execute(text("SELECT pg_get_serial_sequence(:table_name, 'id')"), {"table_name": old_name}).scalar()
+            if sequence:
+                conn.execute(text(f"ALTER SEQUENCE {sequence} RENAME TO {table_name}_id_seq_unpart"))
+
+            conn.execute(CreateTable(table))
+            for statement in get_year_partitions(table).partition_ddl(table_name):
+                conn.execute(text(statement))
+
+            columns = ", ".join(column.name for column in table.columns)
+            copied = conn.execute(text(f"INSERT INTO {table_name} ({columns}) SELECT {columns} FROM {old_name}")).rowcount
+            expected = conn.execute(text(f"SELECT count(*) FROM {old_name}")).scalar()
+            if copied != expected:
+                raise RuntimeError(f"Copied {copied:,} of {expected:,} rows into {table_name}, rolling back")
+            conn.execute(
+                text(f"SELECT setval(pg_get_serial_sequence('{table_name}', 'id'), max(id)) FROM {table_name}")
+            )
+
+            for index in table.indexes:
+                logger.info(f"  Creating index {index.name}...")
+                index.create(conn)
+            conn.execute(text(f"DROP TABLE {old_name}"))
+            logger.info(f"  ✓ {table_name}: {copied:,} rows in {len(get_year_partitions(table).bounds()) + 1} partitions")
+
+        # Partitioned parents are only analyzed on request - the planner needs it for join estimates
+        with engine.begin() as conn:
+            conn.execute(text(f"ANALYZE {table_name}"))
+
 
 def drop_views(engine):
     """Nuclear option - drop everything and start fresh"""
@@ -125,6 +232,13 @@ if __name__ == "__main__":
             refresh_views(engine)
         elif sys.argv[1] == "create-views":
             create_views(engine)
+        elif sys.argv[1] == "create-search-indexes":
+            create_search_indexes(engine)
+        elif sys.argv[1] == "partition-tables":
+            partition_tables(engine)
     else:
-        logger.info("Usage: python -m fao.src.db.setup [ reset | drop-views | refresh-views | create-views ]")
+        logger.info(
+            "Usage: python -m fao.src.db.setup "
+            "[ reset | drop-views | refresh-views | create-views | create-search-indexes | partition-tables ]"
+        )
         sys.exit(1)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, func
+from sqlalchemy import Column, Integer, String, DateTime, Float, Text, func
 from fao.src.db.database import Base
 
 
@@ -11,6 +11,13 @@ class PipelineProgress(Base):
     total_rows = Column(Integer)
     last_chunk_time = Column(DateTime, default=func.now())
     status = Column(String(20), default="in_progress")
+    # CsvSource.signature() of the CSV the last completed run loaded
+    source_signature = Column(String(64))
+    # Last run by run_all_pipelines (see pipelines/scheduler.py)
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
+    duration_seconds = Column(Float)
+    error = Column(Text)
     created_at = Column(DateTime, default=func.now(), nullable=False)
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
 
@@ -1,6 +1,9 @@
+import numpy as np
 import pandas as pd
-import zipfile, hashlib
+import codecs, io, zipfile, hashlib
+from dataclasses import dataclass
 from pathlib import Path
+from typing import BinaryIO, Callable, Iterator, Optional
 
 from fao.src.core import settings
 from fao.logger import logger
@@ -58,6 +61,11 @@ def generate_numeric_id(row_data: dict, hash_columns: list[str]) -> int:
     # Create hash string
     content = "|".join(values)
 
+    return content_numeric_id(content)
+
+
+def content_numeric_id(content: str) -> int:
+    """The id generate_numeric_id gives the joined hash column values in `content`"""
     # Generate hash
     hash_bytes = hashlib.md5(content.encode("utf-8")).digest()
 
@@ -68,70 +76,269 @@ def generate_numeric_id(row_data: dict, hash_columns: list[str]) -> int:
     return numeric_id % 2147483647
 
 
-def get_csv_path_for(csv_path):
-    """Get CSV path, extracting from ZIP if necessary"""
-    assert settings.Config.fao_zip_path is not None, "settings.Config.fao_zip_path must be set"
+def generate_numeric_ids(values: pd.Series, hash_columns: list[str], fixed_values: dict = None) -> pd.Series:
+    """generate_numeric_id for every value of a column, hashing each distinct value once
 
-    full_path = Path(settings.Config.fao_zip_path) / csv_path
+    Each value fills every hash column except those in fixed_values (e.g.
+    {"source_dataset": "prices"}), exactly as the per-row dicts did, so the ids
+    are identical to generate_numeric_id's. Missing and blank values get <NA>.
 
-    if full_path.exists():
-        return str(full_path)
+    Args:
+        values: Column of raw values (e.g. the CSV's "Area Code")
+        hash_columns: List of column names to include in hash
+        fixed_values: Hash columns with the same value for every row
 
-    # Split path and try to find/extract ZIP
-    parts = Path(csv_path).parts
-    if len(parts) >= 2:
-        zip_name = parts[0] + ".zip"  # e.g., "Prices_E_All_Data_(Normalized).zip"
-        zip_path = Path(settings.Config.fao_zip_path) / zip_name
+    Returns:
+        Nullable integer (Int64) Series aligned with values
+    """
+    fixed_values = fixed_values or {}
+    codes, uniques = pd.factorize(values)
 
-        if zip_path.exists():
-            extract_dir = Path(settings.Config.fao_zip_path) / parts[0]
-            extract_dir.mkdir(exist_ok=True)
+    unique_ids = np.empty(len(uniques) + 1, dtype="int64")
+    unique_valid = np.zeros(len(uniques) + 1, dtype=bool)
+    for i, value in enumerate(uniques):
+        value = str(value)
+        if value.strip():
+            unique_ids[i] = generate_numeric_id(
+                {col: fixed_values.get(col, value) for col in hash_columns},
+                hash_columns,
+            )
+            unique_valid[i] = True
 
-            with zipfile.ZipFile(zip_path, "r") as zf:
-                zf.extractall(extract_dir)
+    # factorize codes missing values as -1, which indexes the trailing invalid slot
+    ids = pd.arrays.IntegerArray(unique_ids[codes], ~unique_valid[codes])
+    return pd.Series(ids, index=values.index)
 
-            logger.info(f"Extracted {zip_name}")
-            return str(full_path)  # Should exist now
 
-    raise FileNotFoundError(f"Could not find or extract {csv_path}")
+def generate_row_ids(df: pd.DataFrame, hash_columns: list[str]) -> pd.Series:
+    """generate_numeric_id for every row of df, hashing each distinct combination once
 
+    The hash string is built column-wise the way generate_numeric_id builds it
+    from a row dict (str() of each value, stripped, missing columns as ""),
+    so the ids are identical.
 
-def extract_zip_if_needed(zip_path, csv_filename):
-    """Extract ZIP to directory named after the ZIP file"""
-    extract_dir = zip_path.parent / zip_path.stem
-    extract_dir.mkdir(exist_ok=True)
+    Args:
+        df: DataFrame containing the rows
+        hash_columns: List of column names to include in hash
+
+    Returns:
+        int64 Series aligned with df
+    """
+    parts = [
+        df[col].astype(str).str.strip() if col in df.columns else pd.Series("", index=df.index)
+        for col in sorted(hash_columns)
+    ]
+    content = parts[0].str.cat(parts[1:], sep="|") if len(parts) > 1 else parts[0]
+
+    codes, uniques = pd.factorize(content)
+    unique_ids = np.array([content_numeric_id(value) for value in uniques], dtype="int64")
+    return pd.Series(unique_ids[codes], index=df.index)
+
+
+@dataclass(frozen=True)
+class CsvSource:
+    """A CSV to load: a member of an FAO bulk ZIP, decompressed as it is read, or a plain file"""
+
+    path: Path
+    # Member of the ZIP at `path`, None when `path` is the CSV itself
+    member: Optional[str] = None
+
+    def open(self) -> BinaryIO:
+        if self.member is None:
+            return open(self.path, "rb")
+        # The member keeps the archive's file open until it is closed itself
+        return zipfile.ZipFile(self.path).open(self.member)
+
+    def signature(self) -> str:
+        """Identifies the content without reading it: the member's CRC-32 and size from the
+        ZIP directory, or the file's mtime and size"""
+        if self.member is None:
+            stat = self.path.stat()
+            return f"mtime:{stat.st_mtime_ns}:{stat.st_size}"
+        with zipfile.ZipFile(self.path) as archive:
+            info = archive.getinfo(self.member)
+        return f"crc32:{info.CRC:08x}:{info.file_size}"
+
+    def content_hash(self, block_size: int = 1 << 20) -> str:
+        """SHA-256 of the CSV's bytes (decompressed, for a member), as DatasetMetadata.csv_content_hash"""
+        digest = hashlib.sha256()
+        with self.open() as f:
+            while block := f.read(block_size):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def __str__(self) -> str:
+        return f"{self.path}:{self.member}" if self.member else str(self.path)
+
+
+class HashingReader(io.RawIOBase):
+    """Binary stream passing everything read through it into a SHA-256 - CsvSource.content_hash()
+    of the CSV once it has been read to the end, without reading it a second time"""
+
+    def __init__(self, raw: BinaryIO):
+        self.raw = raw
+        self.digest = hashlib.sha256()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self.raw.read(len(buffer))
+        self.digest.update(data)
+        buffer[: len(data)] = data
+        return len(data)
+
+    def hexdigest(self, block_size: int = 1 << 20) -> str:
+        """Hash of the whole stream - reads whatever the consumer left unread"""
+        while block := self.raw.read(block_size):
+            self.digest.update(block)
+        return self.digest.hexdigest()
+
+    def close(self) -> None:
+        self.raw.close()
+        super().close()
+
+
+def get_csv_path_for(csv_path) -> CsvSource:
+    """Where to read a dataset's CSV from: its FAO bulk ZIP (never extracted), else a plain CSV
+
+    `csv_path` is relative to FAO_ZIP_PATH, e.g. "Prices_E_All_Data_(Normalized)/Prices_E_All_Data_(Normalized).csv"
+    is read from Prices_E_All_Data_(Normalized).zip.
+    """
+    assert settings.Config.fao_zip_path is not None, "settings.Config.fao_zip_path must be set"
+
+    root = Path(settings.Config.fao_zip_path)
+    parts = Path(csv_path).parts
+    if len(parts) >= 2:
+        zip_path = root / (parts[0] + ".zip")  # e.g., "Prices_E_All_Data_(Normalized).zip"
+        if zip_path.exists():
+            member = "/".join(parts[1:])
+            with zipfile.ZipFile(zip_path) as archive:
+                names = archive.namelist()
+            if member not in names:
+                # Some archives keep the CSV in a folder
+                member = next((name for name in names if name.endswith("/" + member)), None)
+            if member is not None:
+                return CsvSource(zip_path, member)
+
+    full_path = root / csv_path
+    if full_path.exists():
+        return CsvSource(full_path)
+
+    raise FileNotFoundError(f"Could not find {csv_path} in its ZIP or on disk")
 
-    with zipfile.ZipFile(zip_path, "r") as zf:
-        zf.extractall(extract_dir)
 
-    logger.info(f"Extracted {zip_path.name} to {extract_dir}")
+def as_csv_source(csv_path) -> CsvSource:
+    return csv_path if isinstance(csv_path, CsvSource) else CsvSource(Path(csv_path))
 
 
 def strip_quote(df: pd.DataFrame, column_name, quote="'"):
     return df[column_name].str.replace(quote, "").str.strip()
 
 
-def load_csv(csv_path) -> pd.DataFrame:
-    """Load and preview data from single file or multiple files."""
+# Tried in order; latin-1 decodes any byte, so it is the last resort
+CSV_ENCODINGS = ["utf-8", "latin-1"]
+
+# Rows per DataFrame when streaming a CSV
+CSV_CHUNK_ROWS = 200000
+
+
+def detect_encoding(csv_path, sample_blocks: int = 8, block_size: int = 1 << 20) -> str:
+    """First of CSV_ENCODINGS that decodes a sample of the file
+
+    The sample is the first block plus blocks spread evenly through the file,
+    so a stray latin-1 byte deep in a multi-GB file is still likely to be seen
+    without reading (let alone parsing) the whole file once per encoding.
+    A ZIP member is only sampled at the start - seeking into it means
+    decompressing everything before - and relies on iter_csv_chunks' fallback.
+    """
+    source = as_csv_source(csv_path)
+    if source.member is None:
+        size = source.path.stat().st_size
+        offsets = sorted({0, *(size * i // sample_blocks for i in range(1, sample_blocks))})
+    else:
+        offsets = [0]
+    blocks = []
+    with source.open() as f:
+        for offset in offsets:
+            f.seek(offset)
+            blocks.append((offset, f.read(block_size)))
+
+    for encoding in CSV_ENCODINGS:
+        try:
+            for offset, block in blocks:
+                if encoding == "utf-8" and offset:
+                    # A block can start inside a multi-byte character
+                    block = block.lstrip(bytes(range(0x80, 0xC0)))
+                # final=False: a block can also end inside one
+                codecs.getincrementaldecoder(encoding)().decode(block, final=False)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    return CSV_ENCODINGS[-1]
+
+
+def iter_csv_chunks(
+    csv_path, chunk_rows: int = CSV_CHUNK_ROWS, on_content_hash: Optional[Callable[[str], None]] = None
+) -> Iterator[pd.DataFrame]:
+    """Stream a CSV (or ZIP member) as DataFrames of at most chunk_rows rows, every column a string
+
+    on_content_hash is called with the CSV's content hash once the last chunk has been read.
+    """
+    source = as_csv_source(csv_path)
+    encoding = detect_encoding(source)
+    logger.info(f"Streaming: {source} (encoding: {encoding}, {chunk_rows:,} rows per chunk)")
+
+    rows_read = 0
+    while True:
+        try:
+            # Every attempt reads the file from the start, so its hash covers the whole file
+            with HashingReader(source.open()) as f, pd.read_csv(
+                f,
+                dtype=str,
+                encoding=encoding,
+                chunksize=chunk_rows,
+                skiprows=(lambda line, skip=rows_read: 0 < line <= skip) if rows_read else None,
+            ) as reader:
+                for chunk in reader:
+                    chunk.columns = chunk.columns.str.strip()
+                    rows_read += len(chunk)
+                    yield chunk
+                if on_content_hash is not None:
+                    on_content_hash(f.hexdigest())
+            return
+        except UnicodeDecodeError:
+            # The sample missed it - carry on from the same row with the fallback
+            if encoding == CSV_ENCODINGS[-1]:
+                raise
+            logger.warning(f"{source} isn't {encoding} after row {rows_read:,}, reading the rest as latin-1")
+            encoding = CSV_ENCODINGS[-1]
+
+
+def read_csv_hashed(source: CsvSource, encoding: str) -> tuple[pd.DataFrame, str]:
+    with HashingReader(source.open()) as f:
+        return pd.read_csv(f, dtype=str, encoding=encoding), f.hexdigest()
+
+
+def load_csv(csv_path, on_content_hash: Optional[Callable[[str], None]] = None) -> pd.DataFrame:
+    """Load and preview data from single file or multiple files.
+
+    on_content_hash is called with the CSV's content hash, as for iter_csv_chunks.
+    """
     # Handle both single path and list of paths
 
+    source = as_csv_source(csv_path)
     try:
-        # Try different encodings like CSVAnalyzer does
-        encodings = ["utf-8", "latin-1", "cp1252", "iso-8859-1"]
-        df = None
-
-        for encoding in encodings:
-            try:
-                df = pd.read_csv(csv_path, dtype=str, encoding=encoding)
-                logger.info(f"Loading: {csv_path} (encoding: {encoding})")
-                break
-            except UnicodeDecodeError:
-                continue
-
-        if df is None:
-            # If all encodings fail, read with latin-1 (accepts any byte)
-            df = pd.read_csv(csv_path, dtype=str, encoding="latin-1")
-            logger.info(f"Loading: {csv_path} (encoding: latin-1 fallback)")
+        encoding = detect_encoding(source)
+        try:
+            df, content_hash = read_csv_hashed(source, encoding)
+        except UnicodeDecodeError:
+            # The sample missed it
+            encoding = CSV_ENCODINGS[-1]
+            df, content_hash = read_csv_hashed(source, encoding)
+        if on_content_hash is not None:
+            on_content_hash(content_hash)
+        logger.info(f"Loading: {source} (encoding: {encoding})")
 
         df.columns = df.columns.str.strip()
         logger.info(df.shape)
@@ -140,7 +347,7 @@ def load_csv(csv_path) -> pd.DataFrame:
         logger.error(f"File not found: {csv_path}")
         raise e
     except Exception as e:
-        logger.error(f"Error reading {csv_path}: {e}")
+        logger.error(f"Error reading {source}: {e}")
         raise e
 
     if not len(df):
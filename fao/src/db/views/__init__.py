@@ -1,10 +1,13 @@
 """Database views for the agricultural data analysis project."""
 
+import re
 from pathlib import Path
+from typing import Iterable, List
 from fao.src.core.utils import load_sql
 
 refresh_views_sql = load_sql("_refresh_all.sql", Path(__file__).parent)
 create_view_indexes_sql = load_sql("_create_mv_indexes.sql", Path(__file__).parent)
+create_search_indexes_sql = load_sql("_create_search_indexes.sql", Path(__file__).parent)
 
 # List all views for registration
 ALL_VIEWS = {
@@ -24,3 +27,19 @@ ALL_DROP_VIEWS = {
     "item_stats_lcu": "DROP MATERIALIZED VIEW IF EXISTS item_stats_lcu CASCADE",
     "item_stats_usd": "DROP MATERIALIZED VIEW IF EXISTS item_stats_usd CASCADE",
 }
+
+
+def views_reading(tables: Iterable[str]) -> List[str]:
+    """Materialized views built from any of `tables` (or from views that are), in ALL_VIEWS order"""
+    affected = set(tables)
+    views = set()
+    while True:
+        found = {
+            name
+            for name, sql in ALL_VIEWS.items()
+            if affected.intersection(re.findall(r"\b(?:from|join)\s+(\w+)", sql, flags=re.IGNORECASE))
+        }
+        if found <= views:
+            return [name for name in ALL_VIEWS if name in views]
+        views |= found
+        affected |= found
@@ -0,0 +1,88 @@
+-- Generated by python -m fao.src.db.search_indexes - do not edit by hand
+-- Text filter indexes on lookup name columns
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- area_codes
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_area_codes_area_trgm ON area_codes USING gin (area gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_area_codes_area_lower ON area_codes (lower(area) text_pattern_ops);
+
+-- currencies
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_currencies_currency_trgm ON currencies USING gin (currency gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_currencies_currency_lower ON currencies (lower(currency) text_pattern_ops);
+
+-- donors
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_donors_donor_trgm ON donors USING gin (donor gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_donors_donor_lower ON donors (lower(donor) text_pattern_ops);
+
+-- elements
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_elements_element_trgm ON elements USING gin (element gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_elements_element_lower ON elements (lower(element) text_pattern_ops);
+
+-- factors
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_factors_factor_trgm ON factors USING gin (factor gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_factors_factor_lower ON factors (lower(factor) text_pattern_ops);
+
+-- flags
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_flags_description_trgm ON flags USING gin (description gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_flags_description_lower ON flags (lower(description) text_pattern_ops);
+
+-- food_groups
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_food_groups_food_group_trgm ON food_groups USING gin (food_group gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_food_groups_food_group_lower ON food_groups (lower(food_group) text_pattern_ops);
+
+-- food_values
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_food_values_food_value_trgm ON food_values USING gin (food_value gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_food_values_food_value_lower ON food_values (lower(food_value) text_pattern_ops);
+
+-- geographic_levels
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_geographic_levels_geographic_level_trgm ON geographic_levels USING gin (geographic_level gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_geographic_levels_geographic_level_lower ON geographic_levels (lower(geographic_level) text_pattern_ops);
+
+-- indicators
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_indicators_indicator_trgm ON indicators USING gin (indicator gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_indicators_indicator_lower ON indicators (lower(indicator) text_pattern_ops);
+
+-- industries
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_industries_industry_trgm ON industries USING gin (industry gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_industries_industry_lower ON industries (lower(industry) text_pattern_ops);
+
+-- item_codes
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_item_codes_item_trgm ON item_codes USING gin (item gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_item_codes_item_lower ON item_codes (lower(item) text_pattern_ops);
+
+-- partner_country_codes
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_partner_country_codes_partner_countries_trgm ON partner_country_codes USING gin (partner_countries gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_partner_country_codes_partner_countries_lower ON partner_country_codes (lower(partner_countries) text_pattern_ops);
+
+-- population_age_groups
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_population_age_groups_population_age_group_trgm ON population_age_groups USING gin (population_age_group gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_population_age_groups_population_age_group_lower ON population_age_groups (lower(population_age_group) text_pattern_ops);
+
+-- purposes
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_purposes_purpose_trgm ON purposes USING gin (purpose gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_purposes_purpose_lower ON purposes (lower(purpose) text_pattern_ops);
+
+-- recipient_country_codes
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_recipient_country_codes_recipient_country_trgm ON recipient_country_codes USING gin (recipient_country gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_recipient_country_codes_recipient_country_lower ON recipient_country_codes (lower(recipient_country) text_pattern_ops);
+
+-- releases
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_releases_release_trgm ON releases USING gin (release gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_releases_release_lower ON releases (lower(release) text_pattern_ops);
+
+-- reporter_country_codes
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_reporter_country_codes_reporter_countries_trgm ON reporter_country_codes USING gin (reporter_countries gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_reporter_country_codes_reporter_countries_lower ON reporter_country_codes (lower(reporter_countries) text_pattern_ops);
+
+-- sexs
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sexs_sex_trgm ON sexs USING gin (sex gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sexs_sex_lower ON sexs (lower(sex) text_pattern_ops);
+
+-- sources
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sources_source_trgm ON sources USING gin (source gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sources_source_lower ON sources (lower(source) text_pattern_ops);
+
+-- surveys
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_surveys_survey_trgm ON surveys USING gin (survey gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_surveys_survey_lower ON surveys (lower(survey) text_pattern_ops);